@@ -3,6 +3,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from vgsales import SALES_COLUMNS
+from vgsales.data import load_store
+from vgsales.figures import FIGURES, cached_figure
+from vgsales.ingest import RunningAggregates, stream_aggregates
+
 st.set_page_config(
     page_title="Analyse des Ventes de Jeux Vidéo",
     page_icon="🎮",
@@ -113,62 +118,84 @@ st.markdown("---")
 # Dataset Overview
 st.markdown("## 📊 **Aperçu du Dataset**")
 
-# Chargement des données pour les statistiques
-df = pd.read_csv("datasets/vgsales.csv")
-
-# Métriques principales
-col1, col2, col3, col4, col5 = st.columns(5)
-
-with col1:
-    st.metric("🎮 Total Jeux", f"{len(df):,}")
-
-with col2:
-    st.metric("🌍 Ventes Totales", f"{df['Global_Sales'].sum():.0f}M")
-
-with col3:
-    st.metric("🎯 Genres", f"{df['Genre'].nunique()}")
-
-with col4:
-    st.metric("🕹️ Plateformes", f"{df['Platform'].nunique()}")
-
-with col5:
-    st.metric("📅 Années", f"{df['Year'].min():.0f}-{df['Year'].max():.0f}")
-
-# Graphiques de présentation rapide
-col1, col2 = st.columns(2)
-
-with col1:
-    # Top 10 des genres
-    genre_sales = df.groupby('Genre')['Global_Sales'].sum().sort_values(ascending=False).head(10)
-    fig_genre = px.bar(
-        x=genre_sales.values, 
-        y=genre_sales.index,
-        orientation='h',
-        title="🎮 Top 10 des Genres",
-        labels={'x': 'Ventes (millions)', 'y': 'Genre'},
-        color=genre_sales.values,
-        color_continuous_scale='viridis'
-    )
-    fig_genre.update_layout(height=400, showlegend=False)
-    st.plotly_chart(fig_genre, use_container_width=True)
-
-with col2:
-    # Ventes par région
-    regional_sales = {
-        'Amérique du Nord': df['NA_Sales'].sum(),
-        'Europe': df['EU_Sales'].sum(), 
-        'Japon': df['JP_Sales'].sum(),
-        'Autres': df['Other_Sales'].sum()
-    }
-    
-    fig_region = px.pie(
-        values=list(regional_sales.values()),
-        names=list(regional_sales.keys()),
-        title="🌍 Répartition Mondiale des Ventes",
-        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-    )
-    fig_region.update_layout(height=400)
-    st.plotly_chart(fig_region, use_container_width=True)
+# Chargement des données en flux (stockage colonne partagé) : métriques et
+# graphiques s'affichent au fil de la lecture, puis sont mémorisés pour les
+# visites suivantes
+progress = st.empty()
+overview = st.empty()
+
+# Agrégats vides si le dataset ne contient aucune ligne
+aggregates = RunningAggregates(done=True)
+for aggregates in stream_aggregates(load_store()):
+    # Seules les figures des agrégats complets vont dans le cache : celles des
+    # blocs intermédiaires ne servent qu'une fois
+    figures = FIGURES if aggregates.done else None
+    if aggregates.done:
+        progress.empty()
+    else:
+        progress.progress(aggregates.progress, text=f"Lecture du dataset : {aggregates.rows:,} lignes")
+
+    with overview.container():
+        # Métriques principales
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            st.metric("🎮 Total Jeux", f"{aggregates.rows:,}")
+
+        with col2:
+            global_mean = aggregates.moments.mean[SALES_COLUMNS.index('Global_Sales')]
+            st.metric("🌍 Ventes Totales", f"{aggregates.totals['Global_Sales']:.0f}M",
+                      f"{global_mean:.2f}M / jeu", delta_color="off")
+
+        with col3:
+            st.metric("🎯 Genres", f"{len(aggregates.by_genre)}")
+
+        with col4:
+            st.metric("🕹️ Plateformes", f"{len(aggregates.by_platform)}")
+
+        with col5:
+            first_year, last_year = aggregates.year_range
+            st.metric("📅 Années", f"{first_year:.0f}-{last_year:.0f}")
+
+        # Graphiques de présentation rapide
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Top 10 des genres
+            genre_sales = aggregates.by_genre['Global_Sales'].sort_values(ascending=False).head(10)
+            fig_genre = cached_figure(
+                px.bar,
+                x=genre_sales.values, 
+                y=genre_sales.index,
+                orientation='h',
+                title="🎮 Top 10 des Genres",
+                labels={'x': 'Ventes (millions)', 'y': 'Genre'},
+                color=genre_sales.values,
+                color_continuous_scale='viridis',
+                layout=dict(height=400, showlegend=False),
+                cache=figures
+            )
+            st.plotly_chart(fig_genre, use_container_width=True, key=f"fig_genre_{aggregates.rows}_{aggregates.done}")
+
+        with col2:
+            # Ventes par région
+            regional_sales = {
+                'Amérique du Nord': aggregates.totals['NA_Sales'],
+                'Europe': aggregates.totals['EU_Sales'], 
+                'Japon': aggregates.totals['JP_Sales'],
+                'Autres': aggregates.totals['Other_Sales']
+            }
+            
+            fig_region = cached_figure(
+                px.pie,
+                values=list(regional_sales.values()),
+                names=list(regional_sales.keys()),
+                title="🌍 Répartition Mondiale des Ventes",
+                color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'],
+                layout=dict(height=400),
+                cache=figures
+            )
+            st.plotly_chart(fig_region, use_container_width=True, key=f"fig_region_{aggregates.rows}_{aggregates.done}")
 
 # Structure du dataset
 st.markdown("### 📋 **Structure du Dataset**")
@@ -177,7 +204,7 @@ col1, col2 = st.columns([3, 2])
 
 with col1:
     # Affichage d'un échantillon du dataset
-    st.dataframe(df.head(10), use_container_width=True)
+    st.dataframe(aggregates.head, use_container_width=True)
 
 with col2:
     st.markdown("""
@@ -7,6 +7,19 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+from vgsales import load_view
+from vgsales.cache import FilterState, PageAggregates
+from vgsales.cube import load_cube
+from vgsales.distributions import summarize
+from vgsales.figures import cached_figure
+from vgsales.filters import load_filter_engine
+from vgsales.plotting import box, violin
+from vgsales.prefix import load_prefix_index
+from vgsales.sections import Sections
+from vgsales.sketch import load_sketches
+from vgsales.topk import load_topk_index
+from vgsales.verdicts import load_verdicts, robustness
+
 # Configuration de la page
 st.set_page_config(
     page_title="Vente de jeux vidéo",
@@ -19,19 +32,8 @@ st.set_page_config(
 st.markdown("# 🎮 Les jeux d'action sont-ils les plus vendus dans le monde ❓")
 st.markdown("---")
 
-# Chargement des données
-@st.cache_data
-def load_data():
-    df = pd.read_csv("datasets/vgsales.csv")
-    # Nettoyage basique
-    df = df.dropna(subset=["Genre", "Global_Sales"])
-    # Conversion de Year en numérique et nettoyage
-    df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-    df = df.dropna(subset=['Year'])
-    df['Year'] = df['Year'].astype(int)
-    return df
-
-df = load_data()
+# Chargement des données (vue partagée, nettoyée une seule fois par processus)
+df = load_view("genres")
 
 # Sidebar pour les filtres
 st.sidebar.header("🔧 Filtres")
@@ -50,10 +52,28 @@ regions = st.sidebar.multiselect(
     default=['NA_Sales', 'EU_Sales', 'JP_Sales']
 )
 
-# Application des filtres
-filtered_df = df[(df['Year'] >= year_range[0]) & (df['Year'] <= year_range[1])]
-if selected_platform != 'Toutes':
-    filtered_df = filtered_df[filtered_df['Platform'] == selected_platform]
+# Application des filtres (index bitmap partagé)
+selection = load_filter_engine("genres").mask(
+    Year=tuple(year_range),
+    Platform=None if selected_platform == 'Toutes' else selected_platform
+)
+
+# Même sélection sur le cube d'agrégats (pour les sommes par genre, année,
+# plateforme), avec cache des résultats partagé entre sessions et pages
+aggregates = PageAggregates(
+    "genres",
+    FilterState.from_selection(year_range, platform=selected_platform),
+    lambda: load_cube("genres").where(
+        Year=tuple(year_range),
+        Platform=None if selected_platform == 'Toutes' else selected_platform
+    )
+)
+
+# Totaux de la période : deux lectures dans les sommes cumulées par année
+totals = load_prefix_index("genres").total(
+    tuple(year_range),
+    **({} if selected_platform == 'Toutes' else {'Platform': selected_platform})
+)
 
 # Explication de la démarche
 st.info("""
@@ -64,16 +84,19 @@ Nous allons analyser les ventes mondiales (`Global_Sales`) par **genre de jeu**
 # Métriques principales
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("Total des jeux", len(filtered_df))
+    st.metric("Total des jeux", int(totals['count']))
 with col2:
-    st.metric("Ventes totales", f"{filtered_df['Global_Sales'].sum():.1f}M")
+    st.metric("Ventes totales", f"{totals['Global_Sales']:.1f}M")
 with col3:
-    st.metric("Genres uniques", filtered_df['Genre'].nunique())
+    st.metric("Genres uniques", len(aggregates.rollup('Genre')))
 with col4:
-    st.metric("Plateformes", filtered_df['Platform'].nunique())
+    st.metric("Plateformes", len(aggregates.rollup('Platform')))
 
 # Agrégation des ventes par genre
-sales_by_genre = filtered_df.groupby("Genre")["Global_Sales"].sum().sort_values(ascending=False).reset_index()
+sales_by_genre = aggregates.get(
+    "sales_by_genre",
+    lambda: aggregates.rollup("Genre")["Global_Sales"].sort_values(ascending=False).reset_index()
+)
 
 # Affichage du tableau
 st.markdown("### 📋 Classement des genres par ventes mondiales")
@@ -85,7 +108,8 @@ col1, col2 = st.columns(2)
 with col1:
     # Graphique en barres horizontales (original amélioré)
     st.markdown("### 📊 Ventes globales par genre")
-    fig_bar = px.bar(
+    fig_bar = cached_figure(
+        px.bar,
         sales_by_genre, 
         x='Global_Sales', 
         y='Genre',
@@ -93,15 +117,16 @@ with col1:
         title="Ventes mondiales par genre de jeu",
         labels={'Global_Sales': 'Ventes (en millions)', 'Genre': 'Genre'},
         color='Global_Sales',
-        color_continuous_scale='viridis'
+        color_continuous_scale='viridis',
+        layout=dict(yaxis={'categoryorder': 'total ascending'})
     )
-    fig_bar.update_layout(yaxis={'categoryorder': 'total ascending'})
     st.plotly_chart(fig_bar, use_container_width=True)
 
 with col2:
     # Graphique en secteurs (camembert)
     st.markdown("### 🥧 Répartition des ventes par genre")
-    fig_pie = px.pie(
+    fig_pie = cached_figure(
+        px.pie,
         sales_by_genre.head(8), 
         values='Global_Sales', 
         names='Genre',
@@ -113,136 +138,190 @@ with col2:
 st.markdown("---")
 st.markdown("## 📈 Analyses approfondies")
 
-# Évolution temporelle des ventes par genre
-st.markdown("### 📅 Évolution des ventes par genre au fil du temps")
-yearly_genre_sales = filtered_df.groupby(['Year', 'Genre'])['Global_Sales'].sum().reset_index()
-top_genres = sales_by_genre.head(5)['Genre'].tolist()
-yearly_top_genres = yearly_genre_sales[yearly_genre_sales['Genre'].isin(top_genres)]
-
-fig_timeline = px.line(
-    yearly_top_genres, 
-    x='Year', 
-    y='Global_Sales', 
-    color='Genre',
-    title="Évolution des ventes des 5 genres les plus populaires",
-    labels={'Global_Sales': 'Ventes (en millions)', 'Year': 'Année'}
-)
-st.plotly_chart(fig_timeline, use_container_width=True)
+# Calcul des sections indépendantes en parallèle (vgsales.sections) ;
+# l'affichage suit ensuite l'ordre de la page
+sections = Sections()
+
+def timeline_section():
+    yearly_genre_sales = aggregates.rollup(['Year', 'Genre'])['Global_Sales'].reset_index()
+    top_genres = sales_by_genre.head(5)['Genre'].tolist()
+    yearly_top_genres = yearly_genre_sales[yearly_genre_sales['Genre'].isin(top_genres)]
+    return cached_figure(
+        px.line,
+        yearly_top_genres, 
+        x='Year', 
+        y='Global_Sales', 
+        color='Genre',
+        title="Évolution des ventes des 5 genres les plus populaires",
+        labels={'Global_Sales': 'Ventes (en millions)', 'Year': 'Année'}
+    )
 
-# Analyse par région
-if regions:
-    st.markdown("### 🌍 Ventes par région et genre")
-    
-    # Calcul des ventes par région pour chaque genre
-    region_data = []
-    for region in regions:
-        region_sales = filtered_df.groupby('Genre')[region].sum().reset_index()
-        region_sales['Region'] = region.replace('_Sales', '')
-        region_sales = region_sales.rename(columns={region: 'Sales'})
-        region_data.append(region_sales)
-    
-    region_df = pd.concat(region_data, ignore_index=True)
+def region_section():
+    # Ventes de toutes les régions pour chaque genre, en une seule passe
+    region_df = (aggregates.matrix('Genre', regions)
+                 .rename(columns=lambda region: region.replace('_Sales', ''))
+                 .melt(var_name='Region', value_name='Sales', ignore_index=False)
+                 .reset_index())
     
     # Graphique en barres groupées
-    fig_region = px.bar(
+    fig_region = cached_figure(
+        px.bar,
         region_df, 
         x='Genre', 
         y='Sales', 
         color='Region',
         title="Ventes par région et genre",
         labels={'Sales': 'Ventes (en millions)', 'Genre': 'Genre'},
-        barmode='group'
+        barmode='group',
+        layout=dict(xaxis_tickangle=-45)
     )
-    fig_region.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig_region, use_container_width=True)
-
-# Analyse des plateformes
-st.markdown("### 🎮 Top 10 des plateformes par ventes")
-platform_sales = filtered_df.groupby('Platform')['Global_Sales'].sum().sort_values(ascending=False).head(10)
-
-col1, col2 = st.columns(2)
+    return fig_region
 
-with col1:
-    fig_platform = px.bar(
+def platform_section():
+    platform_sales = aggregates.rollup('Platform')['Global_Sales'].sort_values(ascending=False).head(10)
+    fig_platform = cached_figure(
+        px.bar,
         x=platform_sales.values,
         y=platform_sales.index,
         orientation='h',
         title="Top 10 des plateformes",
-        labels={'x': 'Ventes (en millions)', 'y': 'Plateforme'}
+        labels={'x': 'Ventes (en millions)', 'y': 'Plateforme'},
+        layout=dict(yaxis={'categoryorder': 'total ascending'})
     )
-    fig_platform.update_layout(yaxis={'categoryorder': 'total ascending'})
-    st.plotly_chart(fig_platform, use_container_width=True)
 
-with col2:
     # Heatmap genre x plateforme
-    st.markdown("### 🔥 Heatmap Genre x Plateforme (Top 10)")
     top_platforms = platform_sales.head(10).index.tolist()
-    heatmap_data = filtered_df[filtered_df['Platform'].isin(top_platforms)].pivot_table(
-        index='Genre', 
-        columns='Platform', 
-        values='Global_Sales', 
-        aggfunc='sum', 
-        fill_value=0
+    heatmap_data = aggregates.get(
+        "heatmap_genre_platform",
+        lambda: (aggregates.cube.where(Platform=top_platforms)
+                 .rollup(['Genre', 'Platform'])['Global_Sales']
+                 .unstack(fill_value=0))
     )
-    
-    fig_heatmap = px.imshow(
+    fig_heatmap = cached_figure(
+        px.imshow,
         heatmap_data,
         title="Ventes par Genre et Plateforme",
         labels=dict(x="Plateforme", y="Genre", color="Ventes (millions)"),
         aspect="auto"
     )
-    st.plotly_chart(fig_heatmap, use_container_width=True)
-
-# Analyse statistique avancée
-st.markdown("### 📊 Analyse statistique des genres")
-
-col1, col2 = st.columns(2)
-
-with col1:
+    return fig_platform, fig_heatmap
+
+def distribution_section():
+    # Quartiles, moustaches et densité par genre lus dans les esquisses des
+    # cellules du cube : les figures ne contiennent qu'un résumé par genre
+    # (voir vgsales.distributions)
+    def genre_summary():
+        cells = aggregates.cube.cells
+        genres = df['Genre'].cat.categories
+        return summarize(
+            load_sketches("genres").grouped(
+                'Global_Sales',
+                cells.index,
+                pd.Categorical(cells['Genre'], categories=genres).codes,
+                len(genres)
+            ),
+            genres
+        )
+
+    summary = aggregates.get("distribution_Global_Sales", genre_summary)
     # Box plot des ventes par genre
-    fig_box = px.box(
-        filtered_df, 
-        x='Genre', 
+    fig_box = cached_figure(
+        box,
+        summary,
+        x='Genre',
         y='Global_Sales',
-        title="Distribution des ventes par genre (Box Plot)"
+        title="Distribution des ventes par genre (Box Plot)",
+        layout=dict(xaxis_tickangle=-45)
     )
-    fig_box.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig_box, use_container_width=True)
 
-with col2:
     # Violon plot
-    fig_violin = px.violin(
-        filtered_df, 
-        x='Genre', 
+    fig_violin = cached_figure(
+        violin,
+        summary,
+        x='Genre',
         y='Global_Sales',
-        title="Distribution des ventes par genre (Violin Plot)"
+        title="Distribution des ventes par genre (Violin Plot)",
+        layout=dict(xaxis_tickangle=-45)
+    )
+    return fig_box, fig_violin
+
+def top_games_section():
+    top_games = load_topk_index("genres")
+    return [(genre, top_games.frame(df, 'Global_Sales', 3, selection, Genre=genre))
+            for genre in sales_by_genre['Genre'].head(6)]  # Top 6 genres
+
+def correlation_section():
+    # (sommes des produits croisés des cellules du cube, sans relire les lignes)
+    correlation_data = aggregates.get(
+        "correlation",
+        lambda: aggregates.cube.correlation(['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'])
+    )
+    return cached_figure(
+        px.imshow,
+        correlation_data,
+        title="Matrice de corrélation entre les ventes régionales",
+        labels=dict(color="Corrélation"),
+        text_auto=True
     )
-    fig_violin.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig_violin, use_container_width=True)
+
+sections.add("timeline", timeline_section)
+if regions:
+    sections.add("regions", region_section)
+# Sections repliées : calculées seulement quand l'utilisateur les ouvre
+sections.lazy("platforms", "🎮 Top 10 des plateformes par ventes", platform_section)
+sections.lazy("distributions", "📊 Analyse statistique des genres", distribution_section)
+sections.lazy("top_games", "🏆 Top 3 des jeux par genre", top_games_section)
+sections.lazy("correlation", "🔗 Corrélations entre régions", correlation_section)
+
+# Évolution temporelle des ventes par genre
+st.markdown("### 📅 Évolution des ventes par genre au fil du temps")
+st.plotly_chart(sections["timeline"], use_container_width=True)
+
+# Analyse par région
+if regions:
+    st.markdown("### 🌍 Ventes par région et genre")
+    st.plotly_chart(sections["regions"], use_container_width=True)
+
+# Analyse des plateformes
+with sections.expander("platforms"):
+    if "platforms" in sections:
+        fig_platform, fig_heatmap = sections["platforms"]
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(fig_platform, use_container_width=True)
+
+        with col2:
+            st.markdown("### 🔥 Heatmap Genre x Plateforme (Top 10)")
+            st.plotly_chart(fig_heatmap, use_container_width=True)
+
+# Analyse statistique avancée
+with sections.expander("distributions"):
+    if "distributions" in sections:
+        fig_box, fig_violin = sections["distributions"]
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(fig_box, use_container_width=True)
+
+        with col2:
+            st.plotly_chart(fig_violin, use_container_width=True)
 
 # Top des jeux par genre
-st.markdown("### 🏆 Top 3 des jeux par genre")
-top_games_by_genre = (filtered_df.groupby('Genre')
-                     .apply(lambda x: x.nlargest(3, 'Global_Sales')[['Name', 'Global_Sales', 'Year', 'Platform']])
-                     .reset_index(drop=True))
-
-for genre in sales_by_genre['Genre'].head(6):  # Top 6 genres
-    genre_games = filtered_df[filtered_df['Genre'] == genre].nlargest(3, 'Global_Sales')
-    if not genre_games.empty:
-        st.markdown(f"**{genre}:**")
-        for idx, game in genre_games.iterrows():
-            st.write(f"• {game['Name']} ({game['Year']}) - {game['Global_Sales']:.2f}M ventes")
+with sections.expander("top_games"):
+    if "top_games" in sections:
+        for genre, genre_games in sections["top_games"]:
+            if not genre_games.empty:
+                st.markdown(f"**{genre}:**")
+                for idx, game in genre_games.iterrows():
+                    st.write(f"• {game['Name']} ({game['Year']}) - {game['Global_Sales']:.2f}M ventes")
 
 # Analyse de corrélation
-st.markdown("### 🔗 Corrélations entre régions")
-correlation_data = filtered_df[['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']].corr()
-fig_corr = px.imshow(
-    correlation_data,
-    title="Matrice de corrélation entre les ventes régionales",
-    labels=dict(color="Corrélation"),
-    text_auto=True
-)
-st.plotly_chart(fig_corr, use_container_width=True)
+with sections.expander("correlation"):
+    if "correlation" in sections:
+        st.plotly_chart(sections["correlation"], use_container_width=True)
 
 # Conclusion dynamique
 st.markdown("---")
@@ -260,13 +339,16 @@ else:
     ❌ **Conclusion :** Non, les jeux d'**action** ne sont pas les plus vendus. Le genre le plus vendu est **{top_genre}** avec **{top_sales:.2f} millions** d'unités.
     """)
 
+# Robustesse du verdict sur toute la grille des filtres (table précalculée)
+st.caption(f"🧪 Verdict vérifié sur {robustness(load_verdicts(), 'action'):.0%} des sélections (périodes × plateformes).")
+
 # Insights supplémentaires
 st.info(f"""
 ### 💡 Insights supplémentaires :
 - **Période analysée :** {year_range[0]} - {year_range[1]}
 - **Plateforme :** {selected_platform}
-- **Genre dominant :** {top_genre} représente {(top_sales/filtered_df['Global_Sales'].sum()*100):.1f}% des ventes totales
-- **Nombre de jeux analysés :** {len(filtered_df)} jeux
+- **Genre dominant :** {top_genre} représente {(top_sales/totals['Global_Sales']*100):.1f}% des ventes totales
+- **Nombre de jeux analysés :** {int(totals['count'])} jeux
 """)
 
 # Footer
@@ -7,6 +7,20 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+from vgsales import REGION_COLUMNS, load_view
+from vgsales.cache import FilterState, PageAggregates
+from vgsales.cube import dominance, load_cube
+from vgsales.figures import cached_figure
+from vgsales.filters import load_filter_engine
+from vgsales.incremental import incremental_cube
+from vgsales.plotting import scatter
+from vgsales.prefix import load_prefix_index
+from vgsales.sections import Sections
+from vgsales.sketch import RELATIVE_ACCURACY, load_sketches
+from vgsales.stats import Moments
+from vgsales.topk import load_topk_index
+from vgsales.verdicts import load_verdicts, robustness
+
 # Configuration de la page
 st.set_page_config(
     page_title="Vente de jeux vidéo par région",
@@ -19,19 +33,8 @@ st.set_page_config(
 st.markdown("# 🌍 Les États-Unis représentent-ils la plus grande part de consommation de jeux vidéo ❓")
 st.markdown("---")
 
-# Chargement du dataset
-@st.cache_data
-def load_data():
-    df = pd.read_csv("datasets/vgsales.csv")
-    # Nettoyage de base
-    df = df.dropna(subset=["NA_Sales", "EU_Sales", "JP_Sales", "Other_Sales"])
-    # Conversion de Year en numérique
-    df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-    df = df.dropna(subset=['Year'])
-    df['Year'] = df['Year'].astype(int)
-    return df
-
-df = load_data()
+# Chargement du dataset (vue partagée, nettoyée une seule fois par processus)
+df = load_view("regions")
 
 # Sidebar pour les filtres
 st.sidebar.header("🔧 Filtres d'analyse")
@@ -52,18 +55,46 @@ selected_platform = st.sidebar.selectbox("Plateforme", platforms)
 # Filtre par seuil de ventes
 min_sales = st.sidebar.slider("Ventes minimales par jeu (millions)", 0.0, 5.0, 0.0, 0.1)
 
-# Application des filtres
-filtered_df = df[
-    (df['Year'] >= year_range[0]) & 
-    (df['Year'] <= year_range[1]) &
-    (df['Global_Sales'] >= min_sales)
-]
+# Application des filtres (index bitmap partagé)
+selection = load_filter_engine("regions").mask(
+    Year=tuple(year_range),
+    Global_Sales=(min_sales, None) if min_sales > 0 else None,
+    Genre=None if selected_genre == 'Tous' else selected_genre,
+    Platform=None if selected_platform == 'Toutes' else selected_platform
+)
+filtered_df = df[selection]
+
+# Agrégats : tranche du cube pré-calculé, ou cube des lignes filtrées
+# (mis à jour par différence avec la sélection précédente) quand le seuil de
+# ventes par jeu est actif ; résultats en cache partagé
+def selection_cube():
+    if min_sales > 0:
+        return incremental_cube("regions", selection)
+    return load_cube("regions").where(
+        Year=tuple(year_range),
+        Genre=None if selected_genre == 'Tous' else selected_genre,
+        Platform=None if selected_platform == 'Toutes' else selected_platform
+    )
 
-if selected_genre != 'Tous':
-    filtered_df = filtered_df[filtered_df['Genre'] == selected_genre]
+aggregates = PageAggregates(
+    "regions",
+    FilterState.from_selection(
+        year_range, platform=selected_platform, genre=selected_genre, min_global_sales=min_sales
+    ),
+    selection_cube
+)
 
-if selected_platform != 'Toutes':
-    filtered_df = filtered_df[filtered_df['Platform'] == selected_platform]
+# Totaux de la période : sommes cumulées par année si au plus un filtre
+# de groupe s'applique, sinon somme des cellules du cube
+group_filters = {
+    column: value
+    for column, value, default in (('Genre', selected_genre, 'Tous'), ('Platform', selected_platform, 'Toutes'))
+    if value != default
+}
+if min_sales == 0 and len(group_filters) <= 1:
+    totals = load_prefix_index("regions").total(tuple(year_range), **group_filters)
+else:
+    totals = aggregates.rollup()
 
 # Explication
 st.info("""
@@ -75,11 +106,11 @@ Comparer les ventes régionales de jeux vidéo afin de savoir si **l'Amérique d
 col1, col2, col3, col4 = st.columns(4)
 
 # Calcul des ventes totales par région
-na_total = filtered_df["NA_Sales"].sum()
-eu_total = filtered_df["EU_Sales"].sum()
-jp_total = filtered_df["JP_Sales"].sum()
-other_total = filtered_df["Other_Sales"].sum()
-global_total = filtered_df["Global_Sales"].sum()
+na_total = totals["NA_Sales"]
+eu_total = totals["EU_Sales"]
+jp_total = totals["JP_Sales"]
+other_total = totals["Other_Sales"]
+global_total = totals["Global_Sales"]
 
 with col1:
     st.metric("🇺🇸 Amérique du Nord", f"{na_total:.1f}M", f"{(na_total/global_total*100):.1f}%")
@@ -113,21 +144,23 @@ col1, col2 = st.columns(2)
 with col1:
     # Graphique en barres interactif
     st.markdown("### 📊 Ventes par région")
-    fig_bar = px.bar(
+    fig_bar = cached_figure(
+        px.bar,
         sales_df, 
         x='Région', 
         y='Ventes (en millions)',
         title="Ventes régionales de jeux vidéo",
         color='Ventes (en millions)',
-        color_continuous_scale='viridis'
+        color_continuous_scale='viridis',
+        layout=dict(showlegend=False)
     )
-    fig_bar.update_layout(showlegend=False)
     st.plotly_chart(fig_bar, use_container_width=True)
 
 with col2:
     # Graphique en secteurs
     st.markdown("### 🥧 Répartition mondiale")
-    fig_pie = px.pie(
+    fig_pie = cached_figure(
+        px.pie,
         sales_df, 
         values='Ventes (en millions)', 
         names='Région',
@@ -140,22 +173,6 @@ with col2:
 st.markdown("---")
 st.markdown("## 📈 Évolution temporelle des ventes régionales")
 
-# Évolution des ventes par région au fil du temps
-yearly_regional_sales = filtered_df.groupby('Year').agg({
-    'NA_Sales': 'sum',
-    'EU_Sales': 'sum',
-    'JP_Sales': 'sum',
-    'Other_Sales': 'sum'
-}).reset_index()
-
-# Reshape pour plotly
-yearly_melted = yearly_regional_sales.melt(
-    id_vars=['Year'], 
-    value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
-    var_name='Région', 
-    value_name='Ventes'
-)
-
 # Mapping des noms de régions
 region_mapping = {
     'NA_Sales': 'Amérique du Nord',
@@ -163,251 +180,269 @@ region_mapping = {
     'JP_Sales': 'Japon',
     'Other_Sales': 'Autres régions'
 }
-yearly_melted['Région'] = yearly_melted['Région'].map(region_mapping)
-
-fig_timeline = px.line(
-    yearly_melted, 
-    x='Year', 
-    y='Ventes', 
-    color='Région',
-    title="Évolution des ventes par région (1980-2020)",
-    labels={'Ventes': 'Ventes (en millions)', 'Year': 'Année'}
-)
-st.plotly_chart(fig_timeline, use_container_width=True)
-
-# Analyse par genre et région
-st.markdown("### 🎮 Ventes par genre et région")
 
-genre_regional = filtered_df.groupby('Genre').agg({
-    'NA_Sales': 'sum',
-    'EU_Sales': 'sum',
-    'JP_Sales': 'sum',
-    'Other_Sales': 'sum'
-}).reset_index()
-
-# Reshape pour la visualisation
-genre_melted = genre_regional.melt(
-    id_vars=['Genre'], 
-    value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
-    var_name='Région', 
-    value_name='Ventes'
-)
-genre_melted['Région'] = genre_melted['Région'].map(region_mapping)
-
-fig_genre_region = px.bar(
-    genre_melted, 
-    x='Genre', 
-    y='Ventes', 
-    color='Région',
-    title="Ventes par genre et région",
-    labels={'Ventes': 'Ventes (en millions)'},
-    barmode='group'
-)
-fig_genre_region.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_genre_region, use_container_width=True)
+# Calcul des sections indépendantes en parallèle (vgsales.sections) ;
+# l'affichage suit ensuite l'ordre de la page
+sections = Sections()
 
-# Heatmap des ventes par décennie et région
-st.markdown("### 🔥 Heatmap : Ventes par décennie et région")
+def timeline_section():
+    # Évolution des ventes par région au fil du temps
+    yearly_regional_sales = aggregates.rollup('Year', REGION_COLUMNS).drop(columns='count').reset_index()
 
-# Créer des décennies
-filtered_df['Decade'] = (filtered_df['Year'] // 10) * 10
-decade_regional = filtered_df.groupby('Decade').agg({
-    'NA_Sales': 'sum',
-    'EU_Sales': 'sum',
-    'JP_Sales': 'sum',
-    'Other_Sales': 'sum'
-}).reset_index()
-
-# Reshape pour heatmap
-decade_melted = decade_regional.melt(
-    id_vars=['Decade'], 
-    value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
-    var_name='Région', 
-    value_name='Ventes'
-)
-decade_melted['Région'] = decade_melted['Région'].map(region_mapping)
+    # Reshape pour plotly
+    yearly_melted = yearly_regional_sales.melt(
+        id_vars=['Year'], 
+        value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
+        var_name='Région', 
+        value_name='Ventes'
+    )
+    yearly_melted['Région'] = yearly_melted['Région'].map(region_mapping)
+
+    return cached_figure(
+        px.line,
+        yearly_melted, 
+        x='Year', 
+        y='Ventes', 
+        color='Région',
+        title="Évolution des ventes par région (1980-2020)",
+        labels={'Ventes': 'Ventes (en millions)', 'Year': 'Année'}
+    )
 
-# Pivot pour heatmap
-heatmap_data = decade_melted.pivot(index='Decade', columns='Région', values='Ventes')
+def genre_section():
+    genre_regional = aggregates.matrix('Genre', REGION_COLUMNS).reset_index()
 
-fig_heatmap = px.imshow(
-    heatmap_data,
-    title="Ventes par décennie et région",
-    labels=dict(x="Région", y="Décennie", color="Ventes (millions)"),
-    aspect="auto",
-    color_continuous_scale='RdYlBu_r'
-)
-st.plotly_chart(fig_heatmap, use_container_width=True)
+    # Reshape pour la visualisation
+    genre_melted = genre_regional.melt(
+        id_vars=['Genre'], 
+        value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
+        var_name='Région', 
+        value_name='Ventes'
+    )
+    genre_melted['Région'] = genre_melted['Région'].map(region_mapping)
+
+    return cached_figure(
+        px.bar,
+        genre_melted, 
+        x='Genre', 
+        y='Ventes', 
+        color='Région',
+        title="Ventes par genre et région",
+        labels={'Ventes': 'Ventes (en millions)'},
+        barmode='group',
+        layout=dict(xaxis_tickangle=-45)
+    )
 
-# Analyse des plateformes par région
-st.markdown("### 🕹️ Top 10 des plateformes par région")
+def decade_section():
+    # Décennies : colonne précalculée au chargement (vgsales.buckets)
+    decade_regional = aggregates.rollup('Decade', REGION_COLUMNS).drop(columns='count').reset_index()
 
-col1, col2 = st.columns(2)
+    # Reshape pour heatmap
+    decade_melted = decade_regional.melt(
+        id_vars=['Decade'], 
+        value_vars=['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales'],
+        var_name='Région', 
+        value_name='Ventes'
+    )
+    decade_melted['Région'] = decade_melted['Région'].map(region_mapping)
+
+    # Pivot pour heatmap
+    heatmap_data = decade_melted.pivot(index='Decade', columns='Région', values='Ventes')
+
+    return cached_figure(
+        px.imshow,
+        heatmap_data,
+        title="Ventes par décennie et région",
+        labels=dict(x="Région", y="Décennie", color="Ventes (millions)"),
+        aspect="auto",
+        color_continuous_scale='RdYlBu_r'
+    )
 
-with col1:
+def platform_section():
     # Top plateformes en Amérique du Nord
-    na_platforms = filtered_df.groupby('Platform')['NA_Sales'].sum().sort_values(ascending=False).head(10)
-    
-    fig_na_platforms = px.bar(
+    na_platforms = aggregates.rollup('Platform')['NA_Sales'].sort_values(ascending=False).head(10)
+    fig_na_platforms = cached_figure(
+        px.bar,
         x=na_platforms.values,
         y=na_platforms.index,
         orientation='h',
         title="Top 10 plateformes - Amérique du Nord",
         labels={'x': 'Ventes (millions)', 'y': 'Plateforme'},
         color=na_platforms.values,
-        color_continuous_scale='blues'
+        color_continuous_scale='blues',
+        layout=dict(yaxis={'categoryorder': 'total ascending'})
     )
-    fig_na_platforms.update_layout(yaxis={'categoryorder': 'total ascending'})
-    st.plotly_chart(fig_na_platforms, use_container_width=True)
 
-with col2:
     # Top plateformes en Europe
-    eu_platforms = filtered_df.groupby('Platform')['EU_Sales'].sum().sort_values(ascending=False).head(10)
-    
-    fig_eu_platforms = px.bar(
+    eu_platforms = aggregates.rollup('Platform')['EU_Sales'].sort_values(ascending=False).head(10)
+    fig_eu_platforms = cached_figure(
+        px.bar,
         x=eu_platforms.values,
         y=eu_platforms.index,
         orientation='h',
         title="Top 10 plateformes - Europe",
         labels={'x': 'Ventes (millions)', 'y': 'Plateforme'},
         color=eu_platforms.values,
-        color_continuous_scale='greens'
+        color_continuous_scale='greens',
+        layout=dict(yaxis={'categoryorder': 'total ascending'})
+    )
+    return fig_na_platforms, fig_eu_platforms
+
+def dominance_section():
+    # Calculer quelle région domine chaque genre (matrice genres × régions)
+    dominance_df = dominance(
+        aggregates.matrix('Genre', REGION_COLUMNS).rename(columns=lambda region: region.replace('_Sales', ''))
+    ).reset_index().rename(columns={'dominant': 'Région_dominante', 'max': 'Ventes_max', 'total': 'Total_genre'})
+    dominance_df['Pourcentage'] = (dominance_df['share'] * 100).round(1)
+
+    # Mapping des régions pour l'affichage
+    region_display = {'NA': 'Amérique du Nord', 'EU': 'Europe', 'JP': 'Japon', 'Other': 'Autres'}
+    dominance_df['Région_dominante'] = dominance_df['Région_dominante'].map(region_display)
+
+    return cached_figure(
+        px.bar,
+        dominance_df.sort_values('Pourcentage', ascending=False),
+        x='Genre',
+        y='Pourcentage',
+        color='Région_dominante',
+        title="Pourcentage de dominance par genre et région",
+        labels={'Pourcentage': 'Dominance (%)', 'Genre': 'Genre'},
+        layout=dict(xaxis_tickangle=-45)
     )
-    fig_eu_platforms.update_layout(yaxis={'categoryorder': 'total ascending'})
-    st.plotly_chart(fig_eu_platforms, use_container_width=True)
-
-# Analyse de la dominance régionale par genre
-st.markdown("### 🏆 Dominance régionale par genre")
-
-# Calculer quelle région domine chaque genre
-genre_dominance = []
-for genre in filtered_df['Genre'].unique():
-    genre_data = filtered_df[filtered_df['Genre'] == genre]
-    sales_by_region = {
-        'NA': genre_data['NA_Sales'].sum(),
-        'EU': genre_data['EU_Sales'].sum(),
-        'JP': genre_data['JP_Sales'].sum(),
-        'Other': genre_data['Other_Sales'].sum()
-    }
-    dominant_region = max(sales_by_region, key=sales_by_region.get)
-    genre_dominance.append({
-        'Genre': genre,
-        'Région_dominante': dominant_region,
-        'Ventes_max': sales_by_region[dominant_region],
-        'Total_genre': sum(sales_by_region.values())
-    })
-
-dominance_df = pd.DataFrame(genre_dominance)
-dominance_df['Pourcentage'] = (dominance_df['Ventes_max'] / dominance_df['Total_genre'] * 100).round(1)
-
-# Mapping des régions pour l'affichage
-region_display = {'NA': 'Amérique du Nord', 'EU': 'Europe', 'JP': 'Japon', 'Other': 'Autres'}
-dominance_df['Région_dominante'] = dominance_df['Région_dominante'].map(region_display)
-
-fig_dominance = px.bar(
-    dominance_df.sort_values('Pourcentage', ascending=False),
-    x='Genre',
-    y='Pourcentage',
-    color='Région_dominante',
-    title="Pourcentage de dominance par genre et région",
-    labels={'Pourcentage': 'Dominance (%)', 'Genre': 'Genre'}
-)
-fig_dominance.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_dominance, use_container_width=True)
-
-# Comparaison avec les ventes globales
-st.markdown("### 📊 Corrélation entre ventes régionales et globales")
-
-col1, col2 = st.columns(2)
 
-with col1:
-    # Scatter plot NA vs Global
-    fig_scatter_na = px.scatter(
+def scatter_section():
+    # Scatter plot NA vs Global (points réduits au-delà de quelques milliers, voir vgsales.plotting)
+    fig_scatter_na = scatter(
         filtered_df, 
         x='NA_Sales', 
         y='Global_Sales',
         title="Corrélation NA vs Ventes Globales",
         labels={'NA_Sales': 'Ventes Amérique du Nord', 'Global_Sales': 'Ventes Globales'},
-        opacity=0.6
-    )
-    # Ligne de tendance
-    fig_scatter_na.add_trace(
-        go.Scatter(
-            x=filtered_df['NA_Sales'], 
-            y=filtered_df['NA_Sales'] * (filtered_df['Global_Sales'] / filtered_df['NA_Sales']).mean(),
-            mode='lines', 
-            name='Tendance',
-            line=dict(dash='dash')
-        )
+        opacity=0.6,
+        # Droite des moindres carrés, lue dans les sommes du cube
+        trend=aggregates.get("trend_NA_Sales", lambda: aggregates.cube.trend('NA_Sales', 'Global_Sales'))
     )
-    st.plotly_chart(fig_scatter_na, use_container_width=True)
 
-with col2:
     # Scatter plot EU vs Global
-    fig_scatter_eu = px.scatter(
+    fig_scatter_eu = scatter(
         filtered_df, 
         x='EU_Sales', 
         y='Global_Sales',
         title="Corrélation EU vs Ventes Globales",
         labels={'EU_Sales': 'Ventes Europe', 'Global_Sales': 'Ventes Globales'},
-        opacity=0.6
+        opacity=0.6,
+        trend=aggregates.get("trend_EU_Sales", lambda: aggregates.cube.trend('EU_Sales', 'Global_Sales'))
     )
-    st.plotly_chart(fig_scatter_eu, use_container_width=True)
+    return fig_scatter_na, fig_scatter_eu
+
+def top_games_section():
+    # Listes pré-triées par région, parcourues jusqu'à 5 jeux retenus
+    top_games = load_topk_index("regions")
+    return {
+        region: top_games.frame(df, region, 5, selection)[['Name', region, 'Year', 'Genre']]
+        for region in REGION_COLUMNS
+    }
 
-# Top des jeux par région
-st.markdown("### 🎯 Top 5 des jeux les plus vendus par région")
+def statistics_section():
+    # Médianes lues dans les esquisses de quantiles : fusion des esquisses des
+    # cellules du cube, ou des lignes retenues quand le seuil de ventes s'applique
+    sketches = load_sketches("regions")
+    medians = aggregates.get(
+        "median_sketch",
+        lambda: [(sketches.rows(region, selection) if min_sales > 0
+                  else sketches.merge(region, aggregates.cube.cells.index)).median()
+                 for region in REGION_COLUMNS]
+    )
+
+    # Calcul des statistiques : une seule passe sur les colonnes régionales
+    region_moments = aggregates.get(
+        "region_moments",
+        lambda: Moments.from_array(filtered_df[REGION_COLUMNS].to_numpy(), sketch=False)
+    )
+    return pd.DataFrame({
+        'Région': ['Amérique du Nord', 'Europe', 'Japon', 'Autres régions'],
+        'Moyenne': region_moments.mean,
+        'Médiane': medians,
+        'Écart-type': region_moments.std,
+        'Maximum': region_moments.maximum
+    })
+
+sections.add("timeline", timeline_section)
+sections.add("genres", genre_section)
+sections.add("decades", decade_section)
+sections.add("platforms", platform_section)
+sections.add("dominance", dominance_section)
+# Section repliée : nuages de points construits seulement quand elle est ouverte
+sections.lazy("scatter", "📊 Corrélation entre ventes régionales et globales", scatter_section)
+sections.add("top_games", top_games_section)
+sections.add("statistics", statistics_section)
+
+st.plotly_chart(sections["timeline"], use_container_width=True)
+
+# Analyse par genre et région
+st.markdown("### 🎮 Ventes par genre et région")
+st.plotly_chart(sections["genres"], use_container_width=True)
+
+# Heatmap des ventes par décennie et région
+st.markdown("### 🔥 Heatmap : Ventes par décennie et région")
+st.plotly_chart(sections["decades"], use_container_width=True)
+
+# Analyse des plateformes par région
+st.markdown("### 🕹️ Top 10 des plateformes par région")
+fig_na_platforms, fig_eu_platforms = sections["platforms"]
 
 col1, col2 = st.columns(2)
 
 with col1:
-    st.markdown("**🇺🇸 Amérique du Nord**")
-    top_na = filtered_df.nlargest(5, 'NA_Sales')[['Name', 'NA_Sales', 'Year', 'Genre']]
-    for idx, game in top_na.iterrows():
-        st.write(f"• **{game['Name']}** ({game['Year']}) - {game['NA_Sales']:.2f}M - {game['Genre']}")
+    st.plotly_chart(fig_na_platforms, use_container_width=True)
 
 with col2:
-    st.markdown("**🇪🇺 Europe**")
-    top_eu = filtered_df.nlargest(5, 'EU_Sales')[['Name', 'EU_Sales', 'Year', 'Genre']]
-    for idx, game in top_eu.iterrows():
-        st.write(f"• **{game['Name']}** ({game['Year']}) - {game['EU_Sales']:.2f}M - {game['Genre']}")
+    st.plotly_chart(fig_eu_platforms, use_container_width=True)
 
-col3, col4 = st.columns(2)
+# Analyse de la dominance régionale par genre
+st.markdown("### 🏆 Dominance régionale par genre")
+st.plotly_chart(sections["dominance"], use_container_width=True)
 
-with col3:
-    st.markdown("**🇯🇵 Japon**")
-    top_jp = filtered_df.nlargest(5, 'JP_Sales')[['Name', 'JP_Sales', 'Year', 'Genre']]
-    for idx, game in top_jp.iterrows():
-        st.write(f"• **{game['Name']}** ({game['Year']}) - {game['JP_Sales']:.2f}M - {game['Genre']}")
+# Comparaison avec les ventes globales
+with sections.expander("scatter"):
+    if "scatter" in sections:
+        fig_scatter_na, fig_scatter_eu = sections["scatter"]
 
-with col4:
-    st.markdown("**🌏 Autres régions**")
-    top_other = filtered_df.nlargest(5, 'Other_Sales')[['Name', 'Other_Sales', 'Year', 'Genre']]
-    for idx, game in top_other.iterrows():
-        st.write(f"• **{game['Name']}** ({game['Year']}) - {game['Other_Sales']:.2f}M - {game['Genre']}")
+        col1, col2 = st.columns(2)
 
-# Analyse statistique
-st.markdown("### 📈 Statistiques détaillées")
+        with col1:
+            st.plotly_chart(fig_scatter_na, use_container_width=True)
+
+        with col2:
+            st.plotly_chart(fig_scatter_eu, use_container_width=True)
 
-# Calcul des statistiques
-stats_data = {
-    'Région': ['Amérique du Nord', 'Europe', 'Japon', 'Autres régions'],
-    'Moyenne': [filtered_df['NA_Sales'].mean(), filtered_df['EU_Sales'].mean(), 
-                filtered_df['JP_Sales'].mean(), filtered_df['Other_Sales'].mean()],
-    'Médiane': [filtered_df['NA_Sales'].median(), filtered_df['EU_Sales'].median(), 
-                filtered_df['JP_Sales'].median(), filtered_df['Other_Sales'].median()],
-    'Écart-type': [filtered_df['NA_Sales'].std(), filtered_df['EU_Sales'].std(), 
-                   filtered_df['JP_Sales'].std(), filtered_df['Other_Sales'].std()],
-    'Maximum': [filtered_df['NA_Sales'].max(), filtered_df['EU_Sales'].max(), 
-                filtered_df['JP_Sales'].max(), filtered_df['Other_Sales'].max()]
+# Top des jeux par région
+st.markdown("### 🎯 Top 5 des jeux les plus vendus par région")
+top_games = sections["top_games"]
+region_titles = {
+    'NA_Sales': "**🇺🇸 Amérique du Nord**",
+    'EU_Sales': "**🇪🇺 Europe**",
+    'JP_Sales': "**🇯🇵 Japon**",
+    'Other_Sales': "**🌏 Autres régions**"
 }
 
-stats_df = pd.DataFrame(stats_data)
+for columns, regions in ((st.columns(2), REGION_COLUMNS[:2]), (st.columns(2), REGION_COLUMNS[2:])):
+    for column, region in zip(columns, regions):
+        with column:
+            st.markdown(region_titles[region])
+            for idx, game in top_games[region].iterrows():
+                st.write(f"• **{game['Name']}** ({game['Year']}) - {game[region]:.2f}M - {game['Genre']}")
+
+# Analyse statistique
+st.markdown("### 📈 Statistiques détaillées")
+
+stats_df = sections["statistics"]
 st.dataframe(stats_df.style.format({
     'Moyenne': '{:.3f}',
     'Médiane': '{:.3f}',
     'Écart-type': '{:.3f}',
     'Maximum': '{:.2f}'
 }), use_container_width=True)
+st.caption(f"Médianes estimées à ±{RELATIVE_ACCURACY:.0%} près (esquisses de quantiles fusionnées).")
 
 # Conclusion dynamique
 st.markdown("---")
@@ -426,6 +461,9 @@ else:
     ❌ **Conclusion :** Non, l'Amérique du Nord n'est pas la plus grande consommatrice. C'est **{top_region}** qui arrive en tête avec **{top_value:.2f} millions** d'unités (**{percentage:.1f}%** du marché).
     """)
 
+# Robustesse du verdict sur toute la grille des filtres (table précalculée)
+st.caption(f"🧪 Verdict vérifié sur {robustness(load_verdicts(), 'north_america'):.0%} des sélections (périodes × genres × plateformes).")
+
 # Insights supplémentaires
 st.info(f"""
 ### 💡 Insights détaillés :
@@ -433,7 +471,7 @@ st.info(f"""
 - **Genre sélectionné :** {selected_genre}
 - **Plateforme :** {selected_platform}
 - **Seuil de ventes :** {min_sales} millions minimum
-- **Nombre de jeux analysés :** {len(filtered_df)} jeux
+- **Nombre de jeux analysés :** {int(totals['count'])} jeux
 - **Ventes totales :** {global_total:.2f} millions d'unités
 
 ### 🌍 Répartition mondiale actuelle :
@@ -7,6 +7,21 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+from vgsales import load_view
+from vgsales.buckets import GENERATIONS
+from vgsales.cache import FilterState, PageAggregates
+from vgsales.cube import load_cube
+from vgsales.figures import cached_figure
+from vgsales.filters import load_filter_engine
+from vgsales.incremental import incremental_cube
+from vgsales.platforms import unknown_platforms, with_manufacturers
+from vgsales.prefix import load_prefix_index
+from vgsales.sections import Sections
+from vgsales.stats import Moments
+from vgsales.titles import load_title_index
+from vgsales.topk import load_topk_index
+from vgsales.verdicts import load_verdicts, robustness
+
 # Configuration de la page
 st.set_page_config(
     page_title="Nintendo au Japon",
@@ -19,19 +34,8 @@ st.set_page_config(
 st.markdown("# 🇯🇵 Les joueurs japonais consomment-ils principalement des jeux sur les consoles Nintendo ❓")
 st.markdown("---")
 
-# Chargement du dataset
-@st.cache_data
-def load_data():
-    df = pd.read_csv("datasets/vgsales.csv")
-    # Nettoyage
-    df = df.dropna(subset=["Platform", "JP_Sales"])
-    # Conversion de Year en numérique
-    df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-    df = df.dropna(subset=['Year'])
-    df['Year'] = df['Year'].astype(int)
-    return df
-
-df = load_data()
+# Chargement du dataset (vue partagée, nettoyée une seule fois par processus)
+df = load_view("japan")
 
 # Sidebar pour les filtres
 st.sidebar.header("🎮 Filtres d'analyse")
@@ -48,36 +52,53 @@ selected_genre = st.sidebar.selectbox("Genre de jeu", genres)
 # Filtre par génération de console
 generations = st.sidebar.multiselect(
     "Générations de consoles",
-    ['Rétro (1980-1995)', 'Classique (1996-2005)', 'Moderne (2006-2015)', 'Actuelle (2016+)'],
-    default=['Rétro (1980-1995)', 'Classique (1996-2005)', 'Moderne (2006-2015)', 'Actuelle (2016+)']
+    list(GENERATIONS.labels),
+    default=list(GENERATIONS.labels)
 )
 
 # Seuil de ventes
 min_sales = st.sidebar.slider("Ventes minimales au Japon (millions)", 0.0, 2.0, 0.0, 0.1)
 
-# Mapping des générations
-def get_generation(year):
-    if year <= 1995:
-        return 'Rétro (1980-1995)'
-    elif year <= 2005:
-        return 'Classique (1996-2005)'
-    elif year <= 2015:
-        return 'Moderne (2006-2015)'
-    else:
-        return 'Actuelle (2016+)'
-
-df['Generation'] = df['Year'].apply(get_generation)
-
-# Application des filtres
-filtered_df = df[
-    (df['Year'] >= year_range[0]) & 
-    (df['Year'] <= year_range[1]) &
-    (df['JP_Sales'] >= min_sales) &
-    (df['Generation'].isin(generations))
-]
-
-if selected_genre != 'Tous':
-    filtered_df = filtered_df[filtered_df['Genre'] == selected_genre]
+# Années de la période retenues par les générations sélectionnées
+# (la colonne Generation est précalculée au chargement, voir vgsales.buckets)
+selected_years = GENERATIONS.years(range(year_range[0], year_range[1] + 1), generations).tolist()
+
+# Application des filtres (index bitmap partagé)
+selection = load_filter_engine("japan").mask(
+    Year=tuple(year_range),
+    Generation=generations,
+    JP_Sales=(min_sales, None) if min_sales > 0 else None,
+    Genre=None if selected_genre == 'Tous' else selected_genre
+)
+
+# Agrégats : tranche du cube pré-calculé, ou cube des lignes filtrées
+# (mis à jour par différence avec la sélection précédente) quand le seuil de
+# ventes au Japon est actif ; résultats en cache partagé
+def selection_cube():
+    if min_sales > 0:
+        return incremental_cube("japan", selection)
+    return load_cube("japan").where(
+        Year=tuple(year_range),
+        Generation=generations,
+        Genre=None if selected_genre == 'Tous' else selected_genre
+    )
+
+aggregates = PageAggregates(
+    "japan",
+    FilterState.from_selection(selected_years, genre=selected_genre, min_jp_sales=min_sales),
+    selection_cube
+)
+
+# Totaux de la période : sommes cumulées par année (années des générations
+# retenues) sauf si le seuil de ventes s'applique
+prefix = load_prefix_index("japan")
+if min_sales == 0:
+    totals = prefix.total(
+        selected_years,
+        **({} if selected_genre == 'Tous' else {'Genre': selected_genre})
+    )
+else:
+    totals = aggregates.rollup()
 
 # Explication de l'objectif
 st.info("""
@@ -85,37 +106,39 @@ st.info("""
 Nous allons analyser les ventes **au Japon** (`JP_Sales`) en fonction des **plateformes de jeux** pour déterminer si les consoles **Nintendo** dominent le marché japonais.
 """)
 
-# Liste des plateformes par constructeur (étendue)
-nintendo_platforms = ["DS", "3DS", "Wii", "WiiU", "GBA", "GC", "Switch", "SNES", "NES", "N64", "GB"]
-sony_platforms = ["PS", "PS2", "PS3", "PS4", "PSP", "PSV"]
-microsoft_platforms = ["XB", "X360", "XOne"]
-sega_platforms = ["DC", "GEN", "SAT", "SCD", "WS", "GG"]
-other_platforms = ["PC", "2600", "3DO", "NG", "TG16", "PCFX"]
-
-def get_manufacturer(platform):
-    if platform in nintendo_platforms:
-        return "🎮 Nintendo"
-    elif platform in sony_platforms:
-        return "🎯 Sony"
-    elif platform in microsoft_platforms:
-        return "🟢 Microsoft"
-    elif platform in sega_platforms:
-        return "🔵 Sega"
-    else:
-        return "🖥️ Autres"
+# Plateformes absentes de la table des constructeurs (vgsales.platforms)
+missing_platforms = unknown_platforms(df['Platform'].cat.categories)
+if missing_platforms:
+    st.warning(f"Constructeur inconnu pour : {', '.join(missing_platforms)}")
 
 # Agrégation des ventes japonaises par plateforme
-jp_sales_by_platform = filtered_df.groupby("Platform")["JP_Sales"].sum().sort_values(ascending=False).reset_index()
-
-# Ajout des colonnes constructeur et génération
-jp_sales_by_platform["Constructeur"] = jp_sales_by_platform["Platform"].apply(get_manufacturer)
+# (constructeur joint sur les codes de plateforme)
+jp_sales_by_platform = aggregates.get(
+    "jp_sales_by_platform",
+    lambda: (aggregates.rollup("Platform")["JP_Sales"]
+             .sort_values(ascending=False)
+             .reset_index()
+             .pipe(with_manufacturers)
+             .rename(columns={"Manufacturer": "Constructeur"}))
+)
 
 # Calcul des totaux par constructeur
-constructor_sales = jp_sales_by_platform.groupby("Constructeur")["JP_Sales"].sum().sort_values(ascending=False).reset_index()
+constructor_sales = aggregates.get(
+    "constructor_sales",
+    lambda: (aggregates.rollup("Manufacturer")["JP_Sales"]
+             .sort_values(ascending=False)
+             .reset_index()
+             .rename(columns={"Manufacturer": "Constructeur"}))
+)
 
 # Métriques principales
-total_jp_sales = filtered_df["JP_Sales"].sum()
-nintendo_sales = constructor_sales[constructor_sales["Constructeur"] == "🎮 Nintendo"]["JP_Sales"].values[0] if len(constructor_sales[constructor_sales["Constructeur"] == "🎮 Nintendo"]) > 0 else 0
+total_jp_sales = totals["JP_Sales"]
+if min_sales == 0 and selected_genre == 'Tous':
+    nintendo_sales = prefix.total(selected_years, Manufacturer="🎮 Nintendo")["JP_Sales"]
+    sony_sales = prefix.total(selected_years, Manufacturer="🎯 Sony")["JP_Sales"]
+else:
+    nintendo_sales = constructor_sales[constructor_sales["Constructeur"] == "🎮 Nintendo"]["JP_Sales"].values[0] if len(constructor_sales[constructor_sales["Constructeur"] == "🎮 Nintendo"]) > 0 else 0
+    sony_sales = constructor_sales[constructor_sales["Constructeur"] == "🎯 Sony"]["JP_Sales"].values[0] if len(constructor_sales[constructor_sales["Constructeur"] == "🎯 Sony"]) > 0 else 0
 nintendo_share = (nintendo_sales / total_jp_sales) * 100 if total_jp_sales > 0 else 0
 
 col1, col2, col3, col4 = st.columns(4)
@@ -124,12 +147,11 @@ with col1:
     st.metric("🎮 Nintendo", f"{nintendo_sales:.1f}M", f"{nintendo_share:.1f}%")
 
 with col2:
-    sony_sales = constructor_sales[constructor_sales["Constructeur"] == "🎯 Sony"]["JP_Sales"].values[0] if len(constructor_sales[constructor_sales["Constructeur"] == "🎯 Sony"]) > 0 else 0
     sony_share = (sony_sales / total_jp_sales) * 100 if total_jp_sales > 0 else 0
     st.metric("🎯 Sony", f"{sony_sales:.1f}M", f"{sony_share:.1f}%")
 
 with col3:
-    st.metric("🇯🇵 Total Japon", f"{total_jp_sales:.1f}M", f"{len(filtered_df)} jeux")
+    st.metric("🇯🇵 Total Japon", f"{total_jp_sales:.1f}M", f"{int(totals['count'])} jeux")
 
 with col4:
     st.metric("🏆 Leader", constructor_sales.iloc[0]["Constructeur"].split()[1] if len(constructor_sales) > 0 else "N/A", f"{(constructor_sales.iloc[0]['JP_Sales']/total_jp_sales*100):.1f}%" if len(constructor_sales) > 0 else "0%")
@@ -149,7 +171,8 @@ col1, col2 = st.columns(2)
 with col1:
     # Graphique en secteurs par constructeur
     st.markdown("### 📊 Répartition par constructeur")
-    fig_pie = px.pie(
+    fig_pie = cached_figure(
+        px.pie,
         constructor_sales, 
         values='JP_Sales', 
         names='Constructeur',
@@ -162,141 +185,207 @@ with col2:
     # Graphique en barres par plateforme (top 10)
     st.markdown("### 🏆 Top 10 des plateformes")
     top_platforms = jp_sales_by_platform.head(10)
-    fig_bar = px.bar(
+    fig_bar = cached_figure(
+        px.bar,
         top_platforms, 
         x='JP_Sales', 
         y='Platform',
         orientation='h',
         title="Top 10 des plateformes au Japon",
         color='Constructeur',
-        labels={'JP_Sales': 'Ventes (millions)', 'Platform': 'Plateforme'}
+        labels={'JP_Sales': 'Ventes (millions)', 'Platform': 'Plateforme'},
+        layout=dict(yaxis={'categoryorder': 'total ascending'})
     )
-    fig_bar.update_layout(yaxis={'categoryorder': 'total ascending'})
     st.plotly_chart(fig_bar, use_container_width=True)
 
 # Analyses temporelles
 st.markdown("---")
 st.markdown("## 📈 Évolution temporelle")
 
-# Évolution des parts de marché Nintendo vs autres
-yearly_data = filtered_df.groupby(['Year', 'Platform'])['JP_Sales'].sum().reset_index()
-yearly_data['Constructeur'] = yearly_data['Platform'].apply(get_manufacturer)
-yearly_constructor = yearly_data.groupby(['Year', 'Constructeur'])['JP_Sales'].sum().reset_index()
-
-fig_timeline = px.line(
-    yearly_constructor, 
-    x='Year', 
-    y='JP_Sales', 
-    color='Constructeur',
-    title="Évolution des ventes par constructeur au Japon",
-    labels={'JP_Sales': 'Ventes (millions)', 'Year': 'Année'}
-)
-st.plotly_chart(fig_timeline, use_container_width=True)
+# Lignes Nintendo retenues
+nintendo_rows = selection & (df['Manufacturer'] == '🎮 Nintendo').to_numpy()
 
-# Analyse par génération
-st.markdown("### 🎯 Analyse par génération de consoles")
+# Calcul des sections indépendantes en parallèle (vgsales.sections) ;
+# l'affichage suit ensuite l'ordre de la page
+sections = Sections()
 
-generation_data = filtered_df.groupby(['Generation', 'Platform'])['JP_Sales'].sum().reset_index()
-generation_data['Constructeur'] = generation_data['Platform'].apply(get_manufacturer)
-generation_constructor = generation_data.groupby(['Generation', 'Constructeur'])['JP_Sales'].sum().reset_index()
-
-fig_generation = px.bar(
-    generation_constructor, 
-    x='Generation', 
-    y='JP_Sales', 
-    color='Constructeur',
-    title="Ventes par génération et constructeur",
-    labels={'JP_Sales': 'Ventes (millions)', 'Generation': 'Génération'},
-    barmode='group'
-)
-st.plotly_chart(fig_generation, use_container_width=True)
+def timeline_section():
+    # Évolution des parts de marché Nintendo vs autres
+    yearly_constructor = (aggregates.rollup(['Year', 'Manufacturer'])['JP_Sales']
+                          .reset_index()
+                          .rename(columns={'Manufacturer': 'Constructeur'}))
 
-# Analyse par genre
-st.markdown("### 🎮 Dominance Nintendo par genre")
+    return cached_figure(
+        px.line,
+        yearly_constructor, 
+        x='Year', 
+        y='JP_Sales', 
+        color='Constructeur',
+        title="Évolution des ventes par constructeur au Japon",
+        labels={'JP_Sales': 'Ventes (millions)', 'Year': 'Année'}
+    )
 
-genre_analysis = filtered_df.groupby(['Genre', 'Platform'])['JP_Sales'].sum().reset_index()
-genre_analysis['Constructeur'] = genre_analysis['Platform'].apply(get_manufacturer)
-genre_constructor = genre_analysis.groupby(['Genre', 'Constructeur'])['JP_Sales'].sum().reset_index()
-
-# Calculer la dominance Nintendo par genre
-genre_dominance = []
-for genre in filtered_df['Genre'].unique():
-    genre_data = genre_constructor[genre_constructor['Genre'] == genre]
-    total_genre = genre_data['JP_Sales'].sum()
-    nintendo_genre = genre_data[genre_data['Constructeur'] == '🎮 Nintendo']['JP_Sales'].sum()
-    nintendo_percent = (nintendo_genre / total_genre * 100) if total_genre > 0 else 0
-    genre_dominance.append({
-        'Genre': genre,
-        'Nintendo_Share': nintendo_percent,
+def generation_section():
+    generation_constructor = (aggregates.rollup(['Generation', 'Manufacturer'])['JP_Sales']
+                              .reset_index()
+                              .rename(columns={'Manufacturer': 'Constructeur'}))
+
+    return cached_figure(
+        px.bar,
+        generation_constructor, 
+        x='Generation', 
+        y='JP_Sales', 
+        color='Constructeur',
+        title="Ventes par génération et constructeur",
+        labels={'JP_Sales': 'Ventes (millions)', 'Generation': 'Génération'},
+        barmode='group'
+    )
+
+def dominance_section():
+    # Calculer la dominance Nintendo par genre (matrice genres × constructeurs)
+    genre_constructor = aggregates.matrix('Genre', 'JP_Sales', columns='Manufacturer')
+    total_genre = genre_constructor.sum(axis=1)
+    nintendo_genre = genre_constructor.reindex(columns=['🎮 Nintendo'], fill_value=0)['🎮 Nintendo']
+    dominance_df = pd.DataFrame({
+        'Nintendo_Share': (nintendo_genre / total_genre * 100).where(total_genre > 0, 0),
         'Total_Sales': total_genre,
         'Nintendo_Sales': nintendo_genre
-    })
-
-dominance_df = pd.DataFrame(genre_dominance).sort_values('Nintendo_Share', ascending=False)
-
-fig_dominance = px.bar(
-    dominance_df, 
-    x='Genre', 
-    y='Nintendo_Share',
-    title="Dominance Nintendo par genre (%)",
-    labels={'Nintendo_Share': 'Part Nintendo (%)', 'Genre': 'Genre'},
-    color='Nintendo_Share',
-    color_continuous_scale='RdYlGn'
-)
-fig_dominance.update_layout(xaxis_tickangle=-45)
-st.plotly_chart(fig_dominance, use_container_width=True)
+    }).reset_index().sort_values('Nintendo_Share', ascending=False)
+
+    return cached_figure(
+        px.bar,
+        dominance_df, 
+        x='Genre', 
+        y='Nintendo_Share',
+        title="Dominance Nintendo par genre (%)",
+        labels={'Nintendo_Share': 'Part Nintendo (%)', 'Genre': 'Genre'},
+        color='Nintendo_Share',
+        color_continuous_scale='RdYlGn',
+        layout=dict(xaxis_tickangle=-45)
+    )
 
-# Heatmap des ventes par décennie et constructeur
-st.markdown("### 🔥 Heatmap : Évolution par décennie")
+def decade_section():
+    # Matrice décennies × constructeurs pour la heatmap
+    heatmap_data = aggregates.matrix('Decade', 'JP_Sales', columns='Manufacturer')
+
+    return cached_figure(
+        px.imshow,
+        heatmap_data,
+        title="Évolution des ventes par décennie et constructeur",
+        labels=dict(x="Constructeur", y="Décennie", color="Ventes (millions)"),
+        aspect="auto",
+        color_continuous_scale='Viridis'
+    )
 
-filtered_df['Decade'] = (filtered_df['Year'] // 10) * 10
-decade_data = filtered_df.groupby(['Decade', 'Platform'])['JP_Sales'].sum().reset_index()
-decade_data['Constructeur'] = decade_data['Platform'].apply(get_manufacturer)
-decade_constructor = decade_data.groupby(['Decade', 'Constructeur'])['JP_Sales'].sum().reset_index()
+def world_section():
+    # Parts de marché au Japon et dans le monde
+    jp_constructor = constructor_sales.copy()
+    jp_constructor['Pourcentage'] = (jp_constructor['JP_Sales'] / jp_constructor['JP_Sales'].sum() * 100).round(1)
 
-# Pivot pour heatmap
-heatmap_data = decade_constructor.pivot(index='Decade', columns='Constructeur', values='JP_Sales').fillna(0)
+    world_constructor = (aggregates.rollup('Manufacturer')['Global_Sales']
+                         .sort_values(ascending=False)
+                         .reset_index()
+                         .rename(columns={'Manufacturer': 'Constructeur'}))
+    world_constructor['Pourcentage'] = (world_constructor['Global_Sales'] / world_constructor['Global_Sales'].sum() * 100).round(1)
+    return jp_constructor, world_constructor
+
+def top_games_section():
+    nintendo_games = load_topk_index("japan").frame(df, 'JP_Sales', 10, selection, Manufacturer='🎮 Nintendo')
+    nintendo_top = nintendo_games[['Name', 'Platform', 'JP_Sales', 'Year', 'Genre']].reset_index(drop=True)
+    nintendo_top.index = nintendo_top.index + 1
+    return nintendo_top
+
+def exclusivity_section():
+    # Nombre de plateformes du jeu de chaque ligne dans la sélection
+    # (index des titres, bitsets de plateformes combinés sans fusion)
+    platform_counts = load_title_index("japan").platform_counts(selection)
+
+    # Analyse par type pour Nintendo
+    exclusivity_type = pd.Series(
+        np.where(platform_counts[nintendo_rows] == 1, 'Exclusivité', 'Multi-plateforme'),
+        name='Type'
+    )
+    exclusivity_stats = (df['JP_Sales'][nintendo_rows].reset_index(drop=True)
+                         .groupby(exclusivity_type)
+                         .agg(['count', 'sum', 'mean'])
+                         .reset_index())
+
+    return cached_figure(
+        px.bar,
+        exclusivity_stats, 
+        x='Type', 
+        y='sum',
+        title="Ventes Nintendo : Exclusivités vs Multi-plateformes",
+        labels={'sum': 'Ventes totales (millions)', 'Type': 'Type de jeu'},
+        color='sum',
+        color_continuous_scale='Blues'
+    )
 
-fig_heatmap = px.imshow(
-    heatmap_data,
-    title="Évolution des ventes par décennie et constructeur",
-    labels=dict(x="Constructeur", y="Décennie", color="Ventes (millions)"),
-    aspect="auto",
-    color_continuous_scale='Viridis'
-)
-st.plotly_chart(fig_heatmap, use_container_width=True)
+def platform_section():
+    # Statistiques par plateforme en une passe sur les lignes Nintendo retenues
+    nintendo_df = df[nintendo_rows]
+    platform_moments = Moments.grouped(
+        nintendo_df[['JP_Sales', 'Year']].to_numpy(dtype='float64'),
+        nintendo_df['Platform'].array.codes,
+        len(df['Platform'].cat.categories)
+    )
+    nintendo_platform_stats = pd.DataFrame({
+        'Ventes_Totales': platform_moments.total[:, 0],
+        'Ventes_Moyennes': platform_moments.mean[:, 0],
+        'Nb_Jeux': platform_moments.count[:, 0],
+        'Année_Min': platform_moments.minimum[:, 1],
+        'Année_Max': platform_moments.maximum[:, 1]
+    }, index=pd.Index(df['Platform'].cat.categories, name='Platform'))
+    nintendo_platform_stats = (nintendo_platform_stats[nintendo_platform_stats['Nb_Jeux'] > 0]
+                               .astype({'Année_Min': 'Int16', 'Année_Max': 'Int16'})
+                               .round(2))
+    return nintendo_platform_stats.sort_values('Ventes_Totales', ascending=False)
+
+sections.add("timeline", timeline_section)
+sections.add("generations", generation_section)
+sections.add("dominance", dominance_section)
+sections.add("decades", decade_section)
+sections.add("world", world_section)
+sections.add("top_games", top_games_section)
+# Section repliée : index des titres lu seulement quand elle est ouverte
+sections.lazy("exclusivity", "🎯 Exclusivités vs Multi-plateformes", exclusivity_section)
+sections.add("platforms", platform_section)
+
+st.plotly_chart(sections["timeline"], use_container_width=True)
+
+# Analyse par génération
+st.markdown("### 🎯 Analyse par génération de consoles")
+st.plotly_chart(sections["generations"], use_container_width=True)
+
+# Analyse par genre
+st.markdown("### 🎮 Dominance Nintendo par genre")
+st.plotly_chart(sections["dominance"], use_container_width=True)
+
+# Heatmap des ventes par décennie et constructeur
+st.markdown("### 🔥 Heatmap : Évolution par décennie")
+st.plotly_chart(sections["decades"], use_container_width=True)
 
 # Comparaison Japon vs Monde
 st.markdown("### 🌍 Comparaison Japon vs Monde")
+jp_constructor, world_constructor = sections["world"]
 
 col1, col2 = st.columns(2)
 
 with col1:
     # Parts de marché au Japon
     st.markdown("**🇯🇵 Parts de marché au Japon**")
-    jp_constructor = constructor_sales.copy()
-    jp_constructor['Pourcentage'] = (jp_constructor['JP_Sales'] / jp_constructor['JP_Sales'].sum() * 100).round(1)
-    
     for idx, row in jp_constructor.head(5).iterrows():
         st.write(f"• {row['Constructeur']}: {row['Pourcentage']:.1f}%")
 
 with col2:
     # Parts de marché mondial
     st.markdown("**🌍 Parts de marché mondial**")
-    world_data = filtered_df.groupby('Platform')['Global_Sales'].sum().reset_index()
-    world_data['Constructeur'] = world_data['Platform'].apply(get_manufacturer)
-    world_constructor = world_data.groupby('Constructeur')['Global_Sales'].sum().sort_values(ascending=False).reset_index()
-    world_constructor['Pourcentage'] = (world_constructor['Global_Sales'] / world_constructor['Global_Sales'].sum() * 100).round(1)
-    
     for idx, row in world_constructor.head(5).iterrows():
         st.write(f"• {row['Constructeur']}: {row['Pourcentage']:.1f}%")
 
 # Top des jeux Nintendo au Japon
 st.markdown("### 🏆 Top 10 des jeux Nintendo au Japon")
-
-nintendo_games = filtered_df[filtered_df['Platform'].isin(nintendo_platforms)].nlargest(10, 'JP_Sales')
-nintendo_top = nintendo_games[['Name', 'Platform', 'JP_Sales', 'Year', 'Genre']].reset_index(drop=True)
-nintendo_top.index = nintendo_top.index + 1
+nintendo_top = sections["top_games"]
 
 col1, col2 = st.columns(2)
 
@@ -315,43 +404,14 @@ with col2:
             st.write(f"   📱 {game['Platform']} • 🎮 {game['Genre']} • 📅 {game['Year']} • 📊 {game['JP_Sales']:.2f}M")
 
 # Analyse des exclusivités vs multi-plateformes
-st.markdown("### 🎯 Exclusivités vs Multi-plateformes")
-
-# Compter le nombre de plateformes par jeu
-game_platforms = filtered_df.groupby('Name')['Platform'].nunique().reset_index()
-game_platforms.columns = ['Name', 'Platform_Count']
-
-# Merge avec les données principales
-exclusivity_data = filtered_df.merge(game_platforms, on='Name')
-exclusivity_data['Type'] = exclusivity_data['Platform_Count'].apply(lambda x: 'Exclusivité' if x == 1 else 'Multi-plateforme')
-
-# Analyse par type pour Nintendo
-nintendo_exclusivity = exclusivity_data[exclusivity_data['Platform'].isin(nintendo_platforms)]
-exclusivity_stats = nintendo_exclusivity.groupby('Type')['JP_Sales'].agg(['count', 'sum', 'mean']).reset_index()
-
-fig_exclusivity = px.bar(
-    exclusivity_stats, 
-    x='Type', 
-    y='sum',
-    title="Ventes Nintendo : Exclusivités vs Multi-plateformes",
-    labels={'sum': 'Ventes totales (millions)', 'Type': 'Type de jeu'},
-    color='sum',
-    color_continuous_scale='Blues'
-)
-st.plotly_chart(fig_exclusivity, use_container_width=True)
+with sections.expander("exclusivity"):
+    if "exclusivity" in sections:
+        st.plotly_chart(sections["exclusivity"], use_container_width=True)
 
 # Analyse de performance par plateforme Nintendo
 st.markdown("### 📊 Performance des plateformes Nintendo")
 
-nintendo_platform_stats = filtered_df[filtered_df['Platform'].isin(nintendo_platforms)].groupby('Platform').agg({
-    'JP_Sales': ['sum', 'mean', 'count'],
-    'Year': ['min', 'max']
-}).round(2)
-
-nintendo_platform_stats.columns = ['Ventes_Totales', 'Ventes_Moyennes', 'Nb_Jeux', 'Année_Min', 'Année_Max']
-nintendo_platform_stats = nintendo_platform_stats.sort_values('Ventes_Totales', ascending=False)
-
-st.dataframe(nintendo_platform_stats.style.format({
+st.dataframe(sections["platforms"].style.format({
     'Ventes_Totales': '{:.2f}',
     'Ventes_Moyennes': '{:.3f}',
     'Nb_Jeux': '{:.0f}',
@@ -381,6 +441,9 @@ else:
     - Leader actuel : {constructor_sales.iloc[0]['Constructeur']} avec {(constructor_sales.iloc[0]['JP_Sales']/total_jp_sales*100):.1f}%
     """)
 
+# Robustesse du verdict sur toute la grille des filtres (table précalculée)
+st.caption(f"🧪 Verdict vérifié sur {robustness(load_verdicts(), 'nintendo_japan'):.0%} des sélections (périodes × genres × générations).")
+
 # Insights supplémentaires
 st.info(f"""
 ### 💡 Insights détaillés de l'analyse :
@@ -388,7 +451,7 @@ st.info(f"""
 - **Genre sélectionné :** {selected_genre}
 - **Générations incluses :** {', '.join(generations)}
 - **Seuil de ventes :** {min_sales} millions minimum
-- **Nombre de jeux analysés :** {len(filtered_df)} jeux
+- **Nombre de jeux analysés :** {int(totals['count'])} jeux
 - **Total des ventes au Japon :** {total_jp_sales:.1f} millions d'unités
 
 ### 🎮 Classement des constructeurs :
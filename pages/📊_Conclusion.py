@@ -4,6 +4,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from vgsales.verdicts import load_verdicts, lookup, robustness
+
 st.set_page_config(
     page_title="Conclusions - Analyse Jeux Vidéo",
     page_icon="🎯",
@@ -63,37 +65,54 @@ st.markdown("---")
 
 st.markdown("## ✅ **Validation des Hypothèses**")
 
+# Verdicts sur toute la période, lus dans la table évaluée sur la grille des
+# filtres (vgsales.verdicts), avec leur robustesse sur l'ensemble de la grille
+verdicts = load_verdicts()
+years = verdicts.index.get_level_values("first_year").min(), verdicts.index.get_level_values("last_year").max()
+action = lookup(verdicts, "action", years)
+north_america = lookup(verdicts, "north_america", years)
+nintendo_japan = lookup(verdicts, "nintendo_japan", years)
+
+def verdict_card(number, verdict, title, lines, robust):
+    color, status = ("#4CAF50", "76, 175, 80") if verdict else ("#F44336", "244, 67, 54")
+    header = f"{'✅' if verdict else '❌'} HYPOTHÈSE {number} {'CONFIRMÉE' if verdict else 'INFIRMÉE'}"
+    details = "".join(
+        f'<p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">{line}</p>' for line in lines
+    )
+    return f"""
+    <div style="padding: 1.5rem; background: rgba({status}, 0.1); border-left: 5px solid {color}; border-radius: 10px;">
+        <h4 style="margin: 0 0 1rem 0; color: {color};">{header}</h4>
+        <p style="margin: 0; color: inherit;"><strong>{title}</strong></p>
+        {details}
+        <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; opacity: 0.6;">🧪 Vérifiée sur {robust:.0%} des sélections de filtres</p>
+    </div>
+    """
+
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: rgba(76, 175, 80, 0.1); border-left: 5px solid #4CAF50; border-radius: 10px;">
-        <h4 style="margin: 0 0 1rem 0; color: #4CAF50;">✅ HYPOTHÈSE 1 CONFIRMÉE</h4>
-        <p style="margin: 0; color: inherit;"><strong>Les jeux d'Action dominent</strong></p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">📊 1.74 milliards de ventes (24.5%)</p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">🎮 Genre le plus vendu mondialement</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(verdict_card(
+        1, action["verdict"], "Les jeux d'Action dominent",
+        [f"📊 {action['value'] / 1000:.2f} milliards de ventes ({action['share']:.1%})",
+         "🎮 Genre le plus vendu mondialement"],
+        robustness(verdicts, "action")
+    ), unsafe_allow_html=True)
 
 with col2:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: rgba(76, 175, 80, 0.1); border-left: 5px solid #4CAF50; border-radius: 10px;">
-        <h4 style="margin: 0 0 1rem 0; color: #4CAF50;">✅ HYPOTHÈSE 2 CONFIRMÉE</h4>
-        <p style="margin: 0; color: inherit;"><strong>L'Amérique du Nord domine</strong></p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">🇺🇸 49.3% des ventes mondiales</p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">🌍 Marché leader mondial</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(verdict_card(
+        2, north_america["verdict"], "L'Amérique du Nord domine",
+        [f"🇺🇸 {north_america['share']:.1%} des ventes mondiales",
+         "🌍 Marché leader mondial"],
+        robustness(verdicts, "north_america")
+    ), unsafe_allow_html=True)
 
 with col3:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: rgba(76, 175, 80, 0.1); border-left: 5px solid #4CAF50; border-radius: 10px;">
-        <h4 style="margin: 0 0 1rem 0; color: #4CAF50;">✅ HYPOTHÈSE 3 CONFIRMÉE</h4>
-        <p style="margin: 0; color: inherit;"><strong>Nintendo domine le Japon</strong></p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">🇯🇵 58.8% des ventes au Japon</p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">🎮 Nintendo leader incontesté sur le marché japonais</p>
-    </div>
-   """, unsafe_allow_html=True)
+    st.markdown(verdict_card(
+        3, nintendo_japan["verdict"], "Nintendo domine le Japon",
+        [f"🇯🇵 {nintendo_japan['share']:.1%} des ventes au Japon",
+         "🎮 Nintendo leader incontesté sur le marché japonais"],
+        robustness(verdicts, "nintendo_japan")
+    ), unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -0,0 +1,52 @@
+"""Vue partagée et sélections aléatoires : chaque moteur est comparé à pandas."""
+import numpy as np
+import pytest
+
+from vgsales import SALES_COLUMNS, load_view
+
+# Nombre de sélections aléatoires par test
+STATES = 20
+
+
+@pytest.fixture(scope="session")
+def view():
+    """Vue ``japan`` de ``datasets/vgsales.csv`` (lignes datées)."""
+    return load_view("japan")
+
+
+def random_state(df, rng):
+    """Filtres de la barre latérale tirés au hasard, au format ``FilterEngine.mask``."""
+    years = np.sort(rng.choice(df["Year"].dropna().unique(), 2))
+    genres = df["Genre"].cat.categories
+    platforms = df["Platform"].cat.categories
+    return {
+        "Year": (int(years[0]), int(years[1])),
+        "Genre": None if rng.random() < 0.3 else list(rng.choice(genres, rng.integers(1, 4), replace=False)),
+        "Platform": None if rng.random() < 0.5 else str(rng.choice(platforms)),
+        "JP_Sales": None if rng.random() < 0.3 else (float(rng.choice([0.01, 0.1, 0.5])), None),
+    }
+
+
+def pandas_mask(df, state):
+    """Même sélection que ``state``, calculée ligne par ligne avec pandas."""
+    mask = df["Year"].between(*state["Year"])
+    if state["Genre"] is not None:
+        mask &= df["Genre"].isin(state["Genre"])
+    if state["Platform"] is not None:
+        mask &= df["Platform"] == state["Platform"]
+    if state["JP_Sales"] is not None:
+        mask &= df["JP_Sales"] >= state["JP_Sales"][0]
+    return mask.fillna(False).to_numpy(dtype=bool)
+
+
+@pytest.fixture(params=range(STATES))
+def state(request, view):
+    return random_state(view, np.random.default_rng(request.param))
+
+
+def reference_rollup(df, by):
+    """``count`` et sommes (float64) des ventes par ``by``, comme ``SalesCube.rollup``."""
+    grouped = df[SALES_COLUMNS].astype("float64").groupby(df[by], observed=True)
+    totals = grouped.sum()
+    totals.insert(0, "count", grouped.size())
+    return totals
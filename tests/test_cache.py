@@ -0,0 +1,52 @@
+"""Cache de résultats : éviction LRU bornée en octets, clés des sélections."""
+import numpy as np
+
+from vgsales.cache import FilterState, PageAggregates, ResultCache
+
+
+def test_evicts_least_recently_used():
+    cache = ResultCache(max_bytes=3 * 800)
+    for key in "abc":
+        cache.put(key, np.zeros(100))
+    # « a » redevient la plus récente : « b » part en premier
+    assert cache.get_or_compute("a", lambda: None) is not None
+    cache.put("d", np.zeros(100))
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 3
+    assert cache.get_or_compute("b", lambda: "recalculé") == "recalculé"
+    assert cache.bytes <= cache.max_bytes
+
+
+def test_skips_values_larger_than_the_bound():
+    cache = ResultCache(max_bytes=800)
+    cache.put("a", np.zeros(100))
+    cache.put("big", np.zeros(1000))
+    assert len(cache) == 1
+    assert cache.bytes == 800
+
+
+def test_replacing_an_entry_keeps_the_byte_count():
+    cache = ResultCache(max_bytes=10_000)
+    cache.put("a", np.zeros(100))
+    cache.put("a", np.zeros(200))
+    assert cache.bytes == 1600
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (1, 0)
+
+
+def test_equivalent_selections_share_entries():
+    years = range(1995, 2006)
+    first = FilterState.from_selection(years, "Toutes", ["Sports", "Action"], 0.1)
+    second = FilterState.from_selection(list(years), None, ["Action", "Sports"], 0.1000000001)
+    assert first == second
+    cache = ResultCache()
+    built = []
+
+    def cube():
+        built.append(True)
+        return None
+
+    assert PageAggregates("japan", first, cube, cache).get("total", lambda: 1) == 1
+    assert PageAggregates("japan", second, cube, cache).get("total", lambda: 2) == 1
+    assert cache.stats()["hits"] == 1
+    assert not built
@@ -0,0 +1,50 @@
+"""Stockage colonne : relu à l'identique, construit sans conflit entre sessions."""
+import threading
+
+import pandas as pd
+
+from vgsales.colstore import ColumnStore, ensure_store
+from vgsales.data import DATASET_PATH, read_dataset
+
+
+def sample_csv(tmp_path, rows=200):
+    lines = DATASET_PATH.read_text(encoding="utf-8").splitlines()[:rows + 1]
+    path = tmp_path / "vgsales.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_round_trip(tmp_path):
+    csv = sample_csv(tmp_path)
+    path, _ = ensure_store(csv)
+    store = ColumnStore(path)
+    expected = read_dataset(csv)
+    expected = expected.iloc[expected["Year"].argsort(kind="stable")].reset_index(drop=True)
+    frame = store.frame()
+    assert store.dated_rows == expected["Year"].notna().sum()
+    for column in ["Name", "Platform", "Genre", "Publisher"]:
+        assert frame[column].astype(object).equals(expected[column].astype(object))
+    for column in ["Year", "Global_Sales", "JP_Sales"]:
+        pd.testing.assert_series_equal(frame[column], expected[column], check_dtype=False)
+
+
+def test_concurrent_cold_starts(tmp_path):
+    csv = sample_csv(tmp_path)
+    results, errors = [], []
+
+    def build():
+        try:
+            results.append(ensure_store(csv))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(set(results)) == 1
+    path, _ = results[0]
+    assert ColumnStore(path).rows == 200
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
@@ -0,0 +1,43 @@
+"""Cube d'agrégats comparé à pandas sur ``datasets/vgsales.csv``."""
+import numpy as np
+import pytest
+
+from conftest import pandas_mask, reference_rollup
+from vgsales.cube import SalesCube
+from vgsales.data import SALES_COLUMNS
+
+
+@pytest.fixture(scope="module")
+def cube(view):
+    return SalesCube.from_frame(view)
+
+
+@pytest.mark.parametrize("by", ["Genre", "Platform", "Manufacturer", "Decade"])
+def test_rollup(view, cube, state, by):
+    # Le seuil de ventes n'est pas une dimension du cube
+    state = dict(state, JP_Sales=None)
+    sliced = cube.where(Year=state["Year"], Genre=state["Genre"], Platform=state["Platform"])
+    expected = reference_rollup(view[pandas_mask(view, state)], by)
+    actual = sliced.rollup(by).reindex(expected.index)
+    np.testing.assert_allclose(actual.to_numpy(dtype="float64"), expected.to_numpy(), atol=1e-6)
+
+
+def test_correlation(view, state):
+    rows = view[pandas_mask(view, state)]
+    if len(rows) < 3:
+        pytest.skip("sélection trop petite")
+    expected = rows[SALES_COLUMNS].astype("float64").corr()
+    actual = SalesCube.from_frame(rows).correlation()
+    # Colonnes constantes : corrélation indéfinie des deux côtés
+    defined = expected.notna().to_numpy()
+    np.testing.assert_allclose(actual.to_numpy()[defined], expected.to_numpy()[defined], atol=1e-6)
+
+
+def test_trend(view, state):
+    rows = view[pandas_mask(view, state)]
+    values = rows[["NA_Sales", "Global_Sales"]].astype("float64")
+    if values["NA_Sales"].nunique() < 2:
+        pytest.skip("ventes NA constantes")
+    expected = np.polyfit(values["NA_Sales"], values["Global_Sales"], 1)
+    actual = SalesCube.from_frame(rows).trend("NA_Sales", "Global_Sales")
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-9)
@@ -0,0 +1,70 @@
+"""Résumés de distribution par groupe, comparés aux valeurs exactes."""
+import numpy as np
+import pytest
+
+from vgsales.distributions import MAX_OUTLIERS, WHISKER, summarize
+from vgsales.sketch import RELATIVE_ACCURACY, QuantileSketch
+
+# Tolérance : seau de la valeur plus interpolation entre deux seaux
+RTOL = 2 * RELATIVE_ACCURACY
+
+
+@pytest.fixture(scope="module")
+def groups():
+    rng = np.random.default_rng(0)
+    return {
+        "Action": rng.lognormal(-1.5, 1.2, 3000).clip(0.01, 80),
+        "Puzzle": rng.lognormal(-2.5, 0.8, 400).clip(0.01, 80),
+        "Vide": np.array([]),
+        "Unique": np.array([0.42]),
+    }
+
+
+@pytest.fixture(scope="module")
+def summary(groups):
+    histograms = np.array([
+        np.bincount(QuantileSketch.buckets(values), minlength=QuantileSketch.size)
+        for values in groups.values()
+    ])
+    return summarize(histograms, list(groups))
+
+
+def test_empty_groups_are_dropped(summary):
+    assert list(summary.index) == ["Action", "Puzzle", "Unique"]
+
+
+@pytest.mark.parametrize("label", ["Action", "Puzzle"])
+def test_quartiles_and_mean(groups, summary, label):
+    values, row = groups[label], summary.loc[label]
+    assert row["count"] == len(values)
+    np.testing.assert_allclose(
+        row[["q1", "median", "q3"]].astype(float), np.quantile(values, [0.25, 0.5, 0.75]), rtol=RTOL
+    )
+    assert row["mean"] == pytest.approx(values.mean(), rel=RTOL)
+
+
+@pytest.mark.parametrize("label", ["Action", "Puzzle"])
+def test_whiskers_and_outliers(groups, summary, label):
+    values, row = groups[label], summary.loc[label]
+    reach = WHISKER * (row["q3"] - row["q1"])
+    inside = values[(values >= row["q1"] - reach) & (values <= row["q3"] + reach)]
+    assert row["lowerfence"] == pytest.approx(inside.min(), rel=RTOL)
+    assert row["upperfence"] == pytest.approx(inside.max(), rel=RTOL)
+    outliers = row["outliers"]
+    assert len(outliers) <= MAX_OUTLIERS
+    assert ((outliers < row["lowerfence"]) | (outliers > row["upperfence"])).all()
+    # Les valeurs les plus éloignées de la médiane sont retenues
+    assert outliers.max() == pytest.approx(values.max(), rel=RTOL)
+
+
+@pytest.mark.parametrize("label", ["Action", "Puzzle"])
+def test_density_is_normalized(summary, label):
+    row = summary.loc[label]
+    assert np.trapezoid(row["density"], row["grid"]) == pytest.approx(1.0, abs=0.1)
+
+
+def test_single_value(summary):
+    row = summary.loc["Unique"]
+    assert row["median"] == pytest.approx(0.42, rel=RTOL)
+    assert row["lowerfence"] == row["upperfence"] == pytest.approx(0.42, rel=RTOL)
+    assert len(row["outliers"]) == 0
@@ -0,0 +1,37 @@
+"""Cache des figures : clé de contenu et estimation de taille."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+
+from vgsales.cache import ResultCache
+from vgsales.figures import cached_figure, content_key, figure_size
+
+
+def test_content_key_follows_content():
+    values = pd.Series([1.5, 2.0, 3.25], index=["Action", "Sports", "Shooter"])
+    key = content_key(values, title="Ventes")
+    assert key == content_key(values.copy(), title="Ventes")
+    assert key != content_key(values * 2, title="Ventes")
+    assert key != content_key(values.rename(index={"Action": "Puzzle"}), title="Ventes")
+    assert key != content_key(values.astype("float32"), title="Ventes")
+    assert key != content_key(values, title="Total")
+
+
+def test_figure_size_tracks_data():
+    small = px.scatter(x=np.arange(10.0), y=np.arange(10.0))
+    large = px.scatter(x=np.arange(10000.0), y=np.arange(10000.0))
+    assert figure_size(large) > figure_size(small)
+    # Même ordre de grandeur que le JSON envoyé au navigateur
+    json_size = len(pio.to_json(large, validate=False))
+    assert json_size / 4 < figure_size(large) < json_size * 4
+
+
+def test_cached_figure_reuses_and_bypasses():
+    cache = ResultCache(1024 * 1024, sizeof=figure_size)
+    values = pd.Series([3.0, 2.0, 1.0], index=["a", "b", "c"])
+    fig = cached_figure(px.bar, x=values.to_numpy(), y=values.index.to_numpy(), cache=cache)
+    assert cached_figure(px.bar, x=values.to_numpy(), y=values.index.to_numpy(), cache=cache) is fig
+    assert len(cache) == 1
+    assert cached_figure(px.bar, x=values.to_numpy(), y=values.index.to_numpy(), cache=None) is not fig
+    assert len(cache) == 1
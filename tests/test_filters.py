@@ -0,0 +1,29 @@
+"""Moteur de filtres comparé aux masques pandas."""
+import numpy as np
+import pandas as pd
+
+from conftest import pandas_mask
+from vgsales.filters import FilterEngine
+
+
+def test_mask(view, state):
+    expected = pandas_mask(view, state)
+    np.testing.assert_array_equal(FilterEngine(view).mask(**state), expected)
+
+
+def test_threshold_excludes_missing_values():
+    df = pd.DataFrame({
+        "Platform": pd.Categorical(["PS2", "PS2", "Wii", "Wii"]),
+        "Genre": pd.Categorical(["Action"] * 4),
+        "Generation": pd.Categorical(["6e"] * 4),
+        "Year": [2001, 2002, 2007, 2008],
+        "Global_Sales": np.array([0.7, np.nan, 0.2, 1.5], dtype="float32"),
+        "JP_Sales": np.array([0.1, 0.0, np.nan, 0.3], dtype="float32"),
+    })
+    engine = FilterEngine(df)
+    for column, bounds in [("Global_Sales", (0.6, None)), ("Global_Sales", (None, 1.0)),
+                           ("JP_Sales", (0.0, None)), ("JP_Sales", (None, None))]:
+        low, high = bounds
+        values = df[column]
+        expected = (values >= (-np.inf if low is None else low)) & (values <= (np.inf if high is None else high))
+        np.testing.assert_array_equal(engine.mask(**{column: bounds}), expected.to_numpy())
@@ -0,0 +1,28 @@
+"""Cube mis à jour par différence, comparé à pandas après une suite de sélections."""
+import numpy as np
+
+from conftest import STATES, pandas_mask, random_state, reference_rollup
+from vgsales.incremental import CellIndex, IncrementalCube
+
+
+def test_update_sequence(view):
+    incremental = IncrementalCube(CellIndex(view))
+    rng = np.random.default_rng(0)
+    for _ in range(STATES):
+        mask = pandas_mask(view, random_state(view, rng))
+        cube = incremental.update(mask)
+        expected = reference_rollup(view[mask], "Genre")
+        actual = cube.rollup("Genre").reindex(expected.index)
+        np.testing.assert_allclose(actual.to_numpy(dtype="float64"), expected.to_numpy(), atol=1e-6)
+
+
+def test_small_changes_are_incremental(view):
+    # Seuil déplacé d'un cran : seules les lignes entrées ou sorties sont traitées
+    incremental = IncrementalCube(CellIndex(view))
+    sales = view["JP_Sales"].to_numpy()
+    incremental.update(sales >= 0.3)
+    cube = incremental.update(sales >= 0.2)
+    assert incremental.updates == 1
+    expected = reference_rollup(view[sales >= 0.2], "Platform")
+    actual = cube.rollup("Platform").reindex(expected.index)
+    np.testing.assert_allclose(actual.to_numpy(dtype="float64"), expected.to_numpy(), atol=1e-6)
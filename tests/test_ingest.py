@@ -0,0 +1,50 @@
+"""Agrégats en flux comparés aux totaux pandas du dataset complet."""
+import numpy as np
+import pandas as pd
+
+from vgsales.colstore import ColumnStore, ensure_store
+from vgsales.data import DATASET_PATH, SALES_COLUMNS, read_dataset
+from vgsales.ingest import stream_aggregates
+
+
+def store_of(tmp_path, rows=None):
+    lines = DATASET_PATH.read_text(encoding="utf-8").splitlines()
+    path = tmp_path / "vgsales.csv"
+    path.write_text("\n".join(lines[:rows + 1] if rows is not None else lines) + "\n", encoding="utf-8")
+    return ColumnStore(ensure_store(path)[0]), read_dataset(path)
+
+
+def test_totals(tmp_path):
+    store, df = store_of(tmp_path)
+    # Le même objet est mis à jour à chaque bloc
+    done = [step.done for step in stream_aggregates(store, chunk_rows=3000)]
+    assert done == [False] * (len(done) - 1) + [True]
+    final, = stream_aggregates(store)
+    assert final.rows == len(df)
+
+    sales = df[SALES_COLUMNS].astype("float64")
+    np.testing.assert_allclose(final.totals[SALES_COLUMNS], sales.sum(), rtol=1e-9)
+    np.testing.assert_allclose(final.moments.mean, sales.mean(), rtol=1e-9)
+    np.testing.assert_allclose(final.moments.std, sales.std(), rtol=1e-9)
+    for attribute, column in (("by_genre", "Genre"), ("by_platform", "Platform"), ("by_year", "Year")):
+        expected = sales.groupby(df[column]).sum()
+        actual = getattr(final, attribute)
+        actual = actual.set_axis(actual.index.astype(expected.index.dtype)).sort_index()
+        np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9)
+    pd.testing.assert_frame_equal(
+        final.head.reset_index(drop=True).astype(object),
+        df.head(10).astype(object),
+        check_dtype=False,
+    )
+
+
+def test_progress_follows_rows(tmp_path):
+    store, df = store_of(tmp_path, rows=10_000)
+    progress = [(s.rows, s.progress) for s in stream_aggregates(store, chunk_rows=1000)]
+    assert progress[2] == (3000, 0.3)
+    assert progress[-1] == (10_000, 1.0)
+
+
+def test_empty_dataset(tmp_path):
+    store, _ = store_of(tmp_path, rows=0)
+    assert list(stream_aggregates(store)) == []
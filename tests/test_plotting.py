@@ -0,0 +1,60 @@
+"""Réduction des nuages de points : borne, extrêmes et déterminisme."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from vgsales.plotting import GRID, reduce_points, scatter
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "x": rng.lognormal(-1.5, 1.0, 50_000),
+        "y": rng.lognormal(-2.0, 1.2, 50_000),
+    })
+
+
+def test_small_frames_are_kept(points):
+    small = points.head(100)
+    assert reduce_points(small, "x", "y") is small
+
+
+@pytest.mark.parametrize("max_points", [100, 1_000, 5_000])
+def test_bound(points, max_points):
+    reduced = reduce_points(points, "x", "y", max_points)
+    assert len(reduced) <= max_points
+    assert reduced.index.is_unique and reduced.index.isin(points.index).all()
+
+
+@pytest.mark.parametrize("max_points", [1_000, 5_000])
+def test_isolated_extremes_are_kept(points, max_points):
+    # Les plus grandes valeurs, seules dans leur case, sont toujours gardées
+    reduced = reduce_points(points, "x", "y", max_points)
+    for column in ("x", "y"):
+        assert points[column].idxmax() in reduced.index
+
+
+def test_extent_within_one_cell(points):
+    # Un point par case occupée : l'étendue est conservée à une case près
+    reduced = reduce_points(points, "x", "y", 5_000)
+    for column in ("x", "y"):
+        cell = (points[column].max() - points[column].min()) / (GRID - 1)
+        assert reduced[column].min() - points[column].min() <= cell
+        assert reduced[column].max() == points[column].max()
+
+
+def test_deterministic(points):
+    pd.testing.assert_frame_equal(reduce_points(points, "x", "y", 1_000), reduce_points(points, "x", "y", 1_000))
+
+
+def test_missing_and_constant_values():
+    df = pd.DataFrame({"x": np.r_[np.arange(20_000.0), np.nan], "y": 1.0})
+    reduced = reduce_points(df, "x", "y", 500)
+    assert 0 < len(reduced) <= 500
+
+
+def test_scatter_title_reports_reduction(points):
+    fig = scatter(points, "x", "y", title="Ventes", max_points=1_000)
+    assert sum(len(trace.x) for trace in fig.data) <= 1_000
+    assert "sur 50,000" in fig.layout.title.text
@@ -0,0 +1,29 @@
+"""Totaux par période lus dans les sommes cumulées, comparés à pandas."""
+import numpy as np
+
+from conftest import pandas_mask
+from vgsales.data import SALES_COLUMNS
+from vgsales.prefix import YearPrefixIndex
+
+
+def test_total(view, state):
+    prefix = YearPrefixIndex(view)
+    years = state["Year"]
+    groups = [{}]
+    if state["Platform"]:
+        groups.append({"Platform": state["Platform"]})
+    if state["Genre"]:
+        groups.append({"Genre": state["Genre"]})
+    for group in groups:
+        rows = view[pandas_mask(view, {"Year": years, "Genre": None, "Platform": None, "JP_Sales": None, **group})]
+        expected = [len(rows)] + [rows[m].astype("float64").sum() for m in SALES_COLUMNS]
+        np.testing.assert_allclose(prefix.total(years, **group).to_numpy(), expected, atol=1e-6)
+
+
+def test_total_of_year_list(view):
+    # Années non contiguës (générations retenues) : plusieurs périodes additionnées
+    prefix = YearPrefixIndex(view)
+    years = [1985, 1986, 1990, 2001, 2002, 2003]
+    rows = view[view["Year"].isin(years)]
+    np.testing.assert_allclose(prefix.total(years)["Global_Sales"], rows["Global_Sales"].astype("float64").sum())
+    assert prefix.total(years)["count"] == len(rows)
@@ -0,0 +1,53 @@
+"""Esquisses de quantiles : borne d'erreur relative et fusion."""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vgsales.cube import SalesCube
+from vgsales.sketch import RELATIVE_ACCURACY, QuantileSketch, SketchIndex
+
+
+@pytest.fixture(scope="module")
+def sketches(view):
+    return SketchIndex(view)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_quantile_error_bound(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(-1.5, 1.2, rng.integers(2, 5000)).clip(0.01, 80)
+    sketch = QuantileSketch(np.bincount(QuantileSketch.buckets(values), minlength=QuantileSketch.size))
+    q = np.array([0.1, 0.25, 0.5, 0.75, 0.9])
+    np.testing.assert_allclose(sketch.quantile(q), np.quantile(values, q), rtol=RELATIVE_ACCURACY)
+
+
+def test_zeros_and_missing_values():
+    values = np.array([0.0, np.nan, 0.0, 2.0, np.inf])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        buckets = QuantileSketch.buckets(values)
+    assert buckets[0] == buckets[1] == buckets[2] == 0
+    assert buckets[4] == QuantileSketch.size - 1
+    assert QuantileSketch.values()[buckets[3]] == pytest.approx(2.0, rel=RELATIVE_ACCURACY)
+
+
+def test_merge_equals_rows(view, sketches):
+    # Fusion des esquisses des cellules d'une tranche = esquisse de ses lignes
+    cube = SalesCube.from_frame(view)
+    cells = cube.where(Year=(1995, 2005), Genre=["Action", "Sports"]).cells.index
+    rows = (view["Year"].between(1995, 2005) & view["Genre"].isin(["Action", "Sports"])).to_numpy()
+    merged = sketches.merge("Global_Sales", cells)
+    np.testing.assert_array_equal(merged.counts, sketches.rows("Global_Sales", rows).counts)
+    assert merged.median() == pytest.approx(view["Global_Sales"][rows].median(), rel=RELATIVE_ACCURACY)
+
+
+def test_grouped(view, sketches):
+    cells = SalesCube.from_frame(view).cells
+    genres = view["Genre"].cat.categories
+    codes = pd.Categorical(cells["Genre"], categories=genres).codes
+    histograms = sketches.grouped("Global_Sales", cells.index, codes, len(genres))
+    for code, genre in enumerate(genres):
+        rows = (view["Genre"] == genre).to_numpy()
+        np.testing.assert_array_equal(histograms[code], sketches.rows("Global_Sales", rows).counts)
@@ -0,0 +1,58 @@
+"""Snapshot Parquet : reconstruit seulement quand le contenu du CSV change."""
+import os
+import threading
+
+import pandas as pd
+
+from vgsales.data import DATASET_PATH
+from vgsales.snapshot import ensure_snapshot, read_source_info
+
+
+def sample_csv(tmp_path, rows=50):
+    lines = DATASET_PATH.read_text(encoding="utf-8").splitlines()[:rows + 1]
+    path = tmp_path / "vgsales.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_invalidation(tmp_path):
+    csv = sample_csv(tmp_path)
+    snapshot, version = ensure_snapshot(csv)
+    assert len(pd.read_parquet(snapshot)) == 50
+
+    # Même fichier : ni hash ni réécriture
+    written = snapshot.stat().st_mtime_ns
+    assert ensure_snapshot(csv) == (snapshot, version)
+    assert snapshot.stat().st_mtime_ns == written
+
+    # ``touch`` : même contenu, même version, empreinte mise à jour
+    stat = csv.stat()
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert ensure_snapshot(csv)[1] == version
+    assert read_source_info(snapshot)["mtime_ns"] == csv.stat().st_mtime_ns
+
+    # Contenu modifié : nouvelle version et snapshot reconstruit
+    csv.write_text(csv.read_text(encoding="utf-8").replace("Wii Sports", "Wii Sports 2"), encoding="utf-8")
+    snapshot, changed = ensure_snapshot(csv)
+    assert changed != version
+    assert "Wii Sports 2" in pd.read_parquet(snapshot)["Name"].tolist()
+
+
+def test_concurrent_builds(tmp_path):
+    csv = sample_csv(tmp_path)
+    results, errors = [], []
+
+    def build():
+        try:
+            results.append(ensure_snapshot(csv))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(set(results)) == 1
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
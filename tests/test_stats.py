@@ -0,0 +1,55 @@
+"""Statistiques en une passe : comparaison avec pandas et fusion par blocs."""
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vgsales.sketch import RELATIVE_ACCURACY
+from vgsales.stats import Moments
+
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(-1.5, 1.2, (5000, 3)).clip(0.01, 80)
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return values
+
+
+def test_from_array_matches_pandas(values):
+    stats = Moments.from_array(values).frame(["a", "b", "c"])
+    expected = pd.DataFrame(values, columns=["a", "b", "c"]).agg(["count", "mean", "std", "min", "max"]).T
+    pd.testing.assert_frame_equal(stats[expected.columns], expected, check_dtype=False)
+    np.testing.assert_allclose(stats["median"], np.nanmedian(values, axis=0), rtol=2 * RELATIVE_ACCURACY)
+
+
+@pytest.mark.parametrize("chunks", [2, 7, 50])
+def test_merged_chunks_equal_whole(values, chunks):
+    whole = Moments.from_array(values)
+    merged = reduce(Moments.merge, [Moments.from_array(chunk) for chunk in np.array_split(values, chunks)])
+    for field in ("count", "total", "m2", "minimum", "maximum"):
+        np.testing.assert_allclose(getattr(merged, field), getattr(whole, field), rtol=1e-9)
+    np.testing.assert_array_equal(merged.sketch, whole.sketch)
+
+
+def test_merge_with_empty_chunk(values):
+    whole = Moments.from_array(values)
+    empty = Moments.from_array(values[:0])
+    for merged in (whole.merge(empty), empty.merge(whole)):
+        np.testing.assert_allclose(merged.m2, whole.m2)
+        np.testing.assert_allclose(merged.variance, whole.variance)
+
+
+def test_grouped_matches_pandas(values):
+    codes = np.random.default_rng(1).integers(0, 6, len(values))
+    # Groupe 5 vide
+    codes[codes == 5] = 4
+    stats = Moments.grouped(values, codes, 6)
+    grouped = pd.DataFrame(values).groupby(codes)
+    np.testing.assert_array_equal(stats.count[:5], grouped.count().to_numpy())
+    np.testing.assert_allclose(stats.mean[:5], grouped.mean().to_numpy())
+    np.testing.assert_allclose(stats.variance[:5], grouped.var().to_numpy())
+    np.testing.assert_array_equal(stats.minimum[:5], grouped.min().to_numpy())
+    np.testing.assert_array_equal(stats.maximum[:5], grouped.max().to_numpy())
+    assert (stats.count[5] == 0).all()
@@ -0,0 +1,29 @@
+"""Index des titres comparé à un ``groupby`` pandas."""
+import numpy as np
+import pandas as pd
+
+from conftest import pandas_mask
+from vgsales.titles import TitleIndex
+
+
+def test_platform_counts(view, state):
+    mask = pandas_mask(view, state)
+    rows = view[mask]
+    expected = rows["Platform"].groupby(rows["Name"], observed=True).nunique()
+    counts = TitleIndex(view).platform_counts(mask)[mask]
+    np.testing.assert_array_equal(counts, expected.reindex(rows["Name"]).to_numpy())
+
+
+def test_more_platforms_than_word_bits():
+    # 150 plateformes : bitsets sur trois mots
+    rng = np.random.default_rng(0)
+    platforms = [f"P{i}" for i in range(150)]
+    df = pd.DataFrame({
+        "Name": pd.Categorical(rng.choice([f"Jeu {i}" for i in range(300)], 2000)),
+        "Platform": pd.Categorical(rng.choice(platforms, 2000), categories=platforms),
+    })
+    mask = rng.random(len(df)) < 0.5
+    rows = df[mask]
+    expected = rows["Platform"].groupby(rows["Name"], observed=True).nunique()
+    counts = TitleIndex(df).platform_counts(mask)[mask]
+    np.testing.assert_array_equal(counts, expected.reindex(rows["Name"]).to_numpy())
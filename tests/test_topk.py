@@ -0,0 +1,25 @@
+"""Index top-K comparé à ``DataFrame.nlargest``."""
+import pandas as pd
+import pytest
+
+from conftest import pandas_mask
+from vgsales.topk import TopKIndex
+
+
+@pytest.mark.parametrize("measure", ["JP_Sales", "Global_Sales"])
+def test_top(view, state, measure):
+    index = TopKIndex(view)
+    # La plateforme est une partition de l'index, pas un filtre de la sélection
+    mask = pandas_mask(view, dict(state, Platform=None))
+    partition = {"Platform": state["Platform"]} if state["Platform"] else {}
+    selected = mask & (view["Platform"] == state["Platform"]).to_numpy() if partition else mask
+    for k in (1, 5, 10):
+        expected = view[selected].nlargest(k, measure, keep="first").index
+        actual = view.index[index.top(measure, k, mask, **partition)]
+        pd.testing.assert_index_equal(actual, expected)
+
+
+def test_lists_built_on_demand(view):
+    index = TopKIndex(view)
+    index.top("JP_Sales", 5, Manufacturer="🎮 Nintendo")
+    assert list(index.lists) == [("JP_Sales", "Manufacturer")]
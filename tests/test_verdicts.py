@@ -0,0 +1,59 @@
+"""Table des verdicts comparée à un recalcul pandas de lignes tirées au hasard."""
+import numpy as np
+import pytest
+
+from vgsales import REGION_COLUMNS, load_view
+from vgsales.buckets import GENERATIONS
+from vgsales.verdicts import ALL_LABELS, HYPOTHESES, build_table
+
+SAMPLES = 30
+
+
+@pytest.fixture(scope="module")
+def table():
+    return build_table(max_workers=2)
+
+
+def reference(row):
+    """Effectif, valeur, part et verdict recalculés sur les lignes de la vue."""
+    hypothesis = HYPOTHESES[row["hypothesis"]]
+    df = load_view(hypothesis.view)
+    mask = df["Year"].between(row["first_year"], row["last_year"]).to_numpy()
+    for column in hypothesis.groups:
+        if row[column] != ALL_LABELS[column]:
+            mask = mask & (df[column] == row[column]).to_numpy()
+    generations = GENERATIONS.codes(df["Year"].to_numpy())
+    mask = mask & ((int(row["generations"]) >> generations) & 1).astype(bool)
+    rows = df[mask]
+    if isinstance(hypothesis.candidates, str):
+        sales = rows[hypothesis.measure].astype("float64").groupby(rows[hypothesis.candidates], observed=True).sum()
+    else:
+        sales = rows[list(REGION_COLUMNS)].astype("float64").sum()
+    total = rows[hypothesis.denominator].astype("float64").sum() if hypothesis.denominator else sales.sum()
+    value = sales.get(hypothesis.target, 0.0)
+    share = value / total if total > 0 else 0.0
+    verdict = sales.idxmax() == hypothesis.target if hypothesis.rule == "leader" else share > 0.5
+    return len(rows), value, share, verdict
+
+
+@pytest.mark.parametrize("hypothesis", list(HYPOTHESES))
+def test_sampled_rows(table, hypothesis):
+    rows = table[table["hypothesis"] == hypothesis]
+    rng = np.random.default_rng(0)
+    for position in rng.choice(len(rows), SAMPLES, replace=False):
+        row = rows.iloc[position]
+        count, value, share, verdict = reference(row)
+        assert row["count"] == count
+        assert row["value"] == pytest.approx(value, rel=1e-5, abs=1e-4)
+        assert row["share"] == pytest.approx(share, rel=1e-5, abs=1e-5)
+        assert row["verdict"] == verdict
+
+
+def test_empty_selections_are_dropped(table):
+    assert (table["count"] > 0).all()
+
+
+def test_serial_build_matches_pool(table):
+    # Construction dans le processus du serveur (sans pool), voir ``load_verdicts``
+    serial = build_table(max_workers=0)
+    assert serial.equals(table)
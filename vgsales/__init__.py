@@ -0,0 +1,6 @@
+from vgsales.data import (
+    DATASET_PATH,
+    REGION_COLUMNS,
+    SALES_COLUMNS,
+    load_view,
+)
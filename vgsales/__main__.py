@@ -0,0 +1,21 @@
+"""Étape d'ingestion : ``python -m vgsales [chemin/vers/vgsales.csv]``.
+
+Pour le dataset par défaut, évalue aussi les hypothèses sur toute la grille
+des filtres (``vgsales.verdicts``), sur un pool de processus : les pages
+lisent ensuite la table sans la reconstruire.
+"""
+import sys
+from pathlib import Path
+
+from vgsales.data import DATASET_PATH
+from vgsales.colstore import ensure_store
+
+source = Path(sys.argv[1]) if len(sys.argv) > 1 else DATASET_PATH
+path, version = ensure_store(source)
+print(f"Stockage colonne : {path} ({version[:12]})")
+
+if source.resolve() == DATASET_PATH:
+    from vgsales.verdicts import ensure_verdicts
+
+    path, _ = ensure_verdicts()
+    print(f"Table des verdicts : {path}")
@@ -0,0 +1,62 @@
+"""Découpage des années en périodes (générations, décennies, ères).
+
+Une période est définie par ses bornes supérieures inclusives : l'affectation
+se fait en un seul ``np.searchsorted`` vectorisé, sans appel Python par ligne.
+Les périodes de ``PERIODS`` sont calculées une fois au chargement, sous forme
+de colonnes catégorielles des vues et des cellules du cube ; une page peut
+définir ses propres ères avec ``Bucketing`` au même coût.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Bucketing:
+    # bornes[i] : dernière année de la période i ; la dernière période est ouverte
+    bounds: tuple
+    labels: tuple
+
+    def __post_init__(self):
+        if len(self.labels) != len(self.bounds) + 1:
+            raise ValueError("Il faut une étiquette de plus que de bornes")
+        if list(self.bounds) != sorted(self.bounds):
+            raise ValueError("Les bornes doivent être croissantes")
+
+    @classmethod
+    def regular(cls, start, stop, width, labels=None):
+        """Périodes de ``width`` années de ``start`` à ``stop`` (ex. décennies)."""
+        starts = list(range(start, stop, width))
+        bounds = tuple(s + width - 1 for s in starts[:-1])
+        return cls(bounds, tuple(labels or starts))
+
+    def codes(self, years):
+        return np.searchsorted(np.asarray(self.bounds), np.asarray(years), side="left")
+
+    def apply(self, years):
+        """Période de chaque année, en catégorie ordonnée."""
+        dtype = pd.CategoricalDtype(list(self.labels), ordered=True)
+        return pd.Categorical.from_codes(self.codes(years), dtype=dtype)
+
+    def years(self, years, labels):
+        """Années de ``years`` qui tombent dans une des périodes ``labels``."""
+        years = np.asarray(years)
+        wanted = [self.labels.index(label) for label in labels if label in self.labels]
+        return years[np.isin(self.codes(years), wanted)]
+
+
+GENERATIONS = Bucketing(
+    bounds=(1995, 2005, 2015),
+    labels=('Rétro (1980-1995)', 'Classique (1996-2005)', 'Moderne (2006-2015)', 'Actuelle (2016+)'),
+)
+
+DECADES = Bucketing.regular(1950, 2100, 10)
+
+PERIODS = {"Generation": GENERATIONS, "Decade": DECADES}
+
+
+def with_periods(df, periods=PERIODS):
+    """``df`` avec une colonne par période, calculée depuis ``Year``."""
+    years = df["Year"].to_numpy()
+    return df.assign(**{name: bucketing.apply(years) for name, bucketing in periods.items()})
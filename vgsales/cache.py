@@ -0,0 +1,170 @@
+"""Cache LRU des agrégats, partagé par toutes les sessions du processus.
+
+Les utilisateurs reviennent presque toujours aux mêmes sélections : les
+agrégats d'une page sont mis en cache sous une clé canonique
+``(lignes de la vue, état des filtres, agrégat)``. Le cache est borné en
+octets (taille estimée des DataFrame/Series/tableaux stockés) et évince les
+entrées les moins récemment utilisées.
+
+Les valeurs renvoyées sont partagées entre sessions : une page ne doit jamais
+les modifier en place.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from vgsales.data import view_key
+from vgsales.prefix import year_runs
+
+RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def sizeof(value):
+    """Taille approximative en octets d'un résultat mis en cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES, sizeof=sizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        # Calcul hors verrou : deux sessions peuvent calculer la même entrée,
+        # la seconde remplace simplement la première
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+RESULTS = ResultCache()
+
+
+def _values(selection, everything):
+    """Valeurs retenues d'un filtre catégoriel, ``()`` signifiant « toutes »."""
+    if selection is None or selection == everything:
+        return ()
+    if isinstance(selection, str):
+        return (selection,)
+    return tuple(sorted(selection))
+
+
+@dataclass(frozen=True)
+class FilterState:
+    """État normalisé de la barre latérale, utilisable comme clé de cache."""
+
+    years: tuple = ()
+    platforms: tuple = ()
+    genres: tuple = ()
+    min_global_sales: float = 0.0
+    min_jp_sales: float = 0.0
+
+    @classmethod
+    def from_selection(cls, years, platform=None, genre=None, min_global_sales=0.0, min_jp_sales=0.0):
+        return cls(
+            years=tuple(year_runs(years)),
+            platforms=_values(platform, "Toutes"),
+            genres=_values(genre, "Tous"),
+            min_global_sales=round(float(min_global_sales), 6),
+            min_jp_sales=round(float(min_jp_sales), 6),
+        )
+
+
+class PageAggregates:
+    """Agrégats d'une sélection, servis depuis ``RESULTS`` quand c'est possible.
+
+    ``cube`` est une fonction renvoyant le cube de la sélection : il n'est
+    construit qu'au premier agrégat absent du cache.
+    """
+
+    def __init__(self, view, state, cube, cache=RESULTS):
+        self.key = (view_key(view), state)
+        self.cache = cache
+        self._cube_factory = cube
+        self._cube = None
+        # Les sections d'une page peuvent demander le cube depuis plusieurs threads
+        self._cube_lock = threading.Lock()
+
+    @property
+    def cube(self):
+        with self._cube_lock:
+            if self._cube is None:
+                self._cube = self._cube_factory()
+            return self._cube
+
+    def rollup(self, by=None, measures=None):
+        by_key = tuple(by) if isinstance(by, list) else by
+        measures_key = tuple(measures) if measures is not None else None
+        return self.cache.get_or_compute(
+            (self.key, "rollup", by_key, measures_key),
+            lambda: self.cube.rollup(by, measures),
+        )
+
+    def matrix(self, by, measures=None, columns=None):
+        measures_key = tuple(measures) if isinstance(measures, list) else measures
+        return self.cache.get_or_compute(
+            (self.key, "matrix", by, measures_key, columns),
+            lambda: self.cube.matrix(by, measures, columns),
+        )
+
+    def get(self, name, compute):
+        """Agrégat propre à une page (ex. ``constructor_sales``)."""
+        return self.cache.get_or_compute((self.key, name), compute)
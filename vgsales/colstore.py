@@ -0,0 +1,152 @@
+"""Stockage colonne par colonne, lu en mémoire partagée (``np.memmap``).
+
+Chaque version du dataset est écrite dans ``datasets/vgsales.cols/<version>/`` :
+
+- colonnes numériques : un tableau ``.npy`` à largeur fixe, plus un masque des
+  valeurs manquantes pour les colonnes nullables (``Year``) ;
+- colonnes texte : codes entiers ``.npy`` et dictionnaire trié dans
+  ``manifest.json`` (code ``-1`` pour une valeur manquante).
+
+Les fichiers sont projetés en mémoire en lecture seule : les pages mises en
+cache du système sont partagées entre tous les workers Streamlit au lieu d'une
+copie complète par processus. Les lignes sont triées par année, sans année à
+la fin : les vues ``Year`` non nul sont de simples tranches sans copie. Les
+totaux d'une période du curseur d'années se lisent dans les sommes cumulées
+par année (``vgsales.prefix``) ; les lignes d'une période sont retenues par
+les masques de ``vgsales.filters``, combinés aux autres filtres.
+"""
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+
+# À incrémenter quand la disposition des fichiers change
+STORE_FORMAT = 2
+
+
+def store_root(csv_path):
+    return Path(csv_path).with_suffix(".cols")
+
+
+def _codes_dtype(n_categories):
+    # Même règle que pandas, pour que Categorical.from_codes ne recopie pas
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def write_store(df, target, version):
+    """Écrit ``df`` au format colonne dans le répertoire ``target``."""
+    target = Path(target)
+    # Répertoire temporaire propre à cet appel : plusieurs sessions (threads)
+    # ou workers peuvent construire la même version en même temps
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"))
+    try:
+        _write_columns(df, tmp, version)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # Un autre worker a publié la même version entre-temps
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not (target / MANIFEST).exists():
+            raise
+    return target
+
+
+def _write_columns(df, tmp, version):
+    """Fichiers des colonnes et manifeste de ``df``, dans le répertoire ``tmp``."""
+    # Tri stable par année (ordre d'origine conservé dans une même année),
+    # lignes sans année à la fin
+    order = np.argsort(df["Year"].to_numpy(dtype="float64", na_value=np.inf), kind="stable")
+    df = df.iloc[order]
+
+    columns = {}
+    for name, series in df.items():
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            dtype = series.dtype.numpy_dtype if hasattr(series.dtype, "numpy_dtype") else series.dtype
+            np.save(tmp / f"{name}.npy", series.to_numpy(dtype=dtype, na_value=0))
+            spec = {"kind": "numeric", "dtype": np.dtype(dtype).str}
+            if series.hasnans:
+                np.save(tmp / f"{name}.na.npy", series.isna().to_numpy())
+                spec["nullable"] = True
+        else:
+            categorical = pd.Categorical(series)
+            dictionary = categorical.categories.tolist()
+            codes = categorical.codes.astype(_codes_dtype(len(dictionary)))
+            np.save(tmp / f"{name}.codes.npy", codes)
+            spec = {"kind": "dictionary", "dictionary": dictionary}
+        columns[name] = spec
+
+    manifest = {
+        "version": version,
+        "rows": len(df),
+        "dated_rows": int(df["Year"].notna().sum()),
+        "columns": columns,
+    }
+    (tmp / MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False))
+
+
+def ensure_store(csv_path):
+    """Répertoire d'une version à jour du stockage colonne pour ``csv_path``."""
+    from vgsales.snapshot import ensure_snapshot
+
+    snapshot, version = ensure_snapshot(csv_path)
+    root = store_root(csv_path)
+    target = root / f"{version[:16]}-v{STORE_FORMAT}"
+    if not (target / MANIFEST).exists():
+        write_store(pd.read_parquet(snapshot), target, version)
+        for old in root.iterdir():
+            if old != target and not old.name.startswith("."):
+                shutil.rmtree(old, ignore_errors=True)
+    return target, version
+
+
+class ColumnStore:
+    """Colonnes d'une version du dataset, projetées en mémoire."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.manifest = json.loads((self.path / MANIFEST).read_text())
+        self.rows = self.manifest["rows"]
+        self.dated_rows = self.manifest["dated_rows"]
+        self.arrays = {}
+        self.dtypes = {}
+        for name, spec in self.manifest["columns"].items():
+            if spec["kind"] == "numeric":
+                values = self._load(f"{name}.npy")
+                na = self._load(f"{name}.na.npy") if spec.get("nullable") else None
+                self.arrays[name] = (values, na)
+            else:
+                self.arrays[name] = (self._load(f"{name}.codes.npy"), None)
+                self.dtypes[name] = pd.CategoricalDtype(spec["dictionary"])
+
+    def _load(self, filename):
+        return np.load(self.path / filename, mmap_mode="r")
+
+    def column(self, name, rows=slice(None)):
+        values, na = self.arrays[name]
+        values = values[rows]
+        if name in self.dtypes:
+            return pd.Categorical.from_codes(values, dtype=self.dtypes[name])
+        if na is None or not na[rows].any():
+            return values
+        if values.dtype.kind == "f":
+            return np.where(na[rows], np.nan, values)
+        return pd.arrays.IntegerArray(values, na[rows])
+
+    def frame(self, rows=slice(None)):
+        """DataFrame sans copie sur les lignes ``rows`` (une tranche)."""
+        data = {name: self.column(name, rows) for name in self.arrays}
+        index = pd.RangeIndex(self.rows)[rows]
+        return pd.DataFrame(data, index=index, copy=False)
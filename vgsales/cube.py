@@ -0,0 +1,186 @@
+"""Cube d'agrégats pré-calculés (Year × Genre × Platform).
+
+Chaque cellule du cube contient, pour une combinaison (année, genre,
+plateforme) présente dans les données, le nombre de jeux ainsi que la somme
+et la somme des carrés de chaque colonne de ventes, et la somme des produits
+de chaque paire de colonnes (covariances, corrélations et pentes). Les périodes dérivées de
+l'année (``Generation``, ``Decade``) et le constructeur de la plateforme
+(``Manufacturer``) sont des attributs des cellules. Les graphiques des pages
+sont des agrégations de ces cellules : un changement de filtre ne relit que
+quelques milliers de cellules au lieu de toutes les lignes.
+
+Les filtres portant sur des lignes individuelles (seuil de ventes minimales)
+ne sont pas des dimensions du cube : dans ce cas, la page construit un cube
+sur les lignes filtrées avec ``SalesCube.from_frame`` et garde la même API.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vgsales.buckets import with_periods
+from vgsales.data import SALES_COLUMNS, load_view, view_key
+from vgsales.platforms import with_manufacturers
+
+DIMENSIONS = ["Year", "Genre", "Platform"]
+
+
+def squares_column(measure):
+    return f"{measure}_sq"
+
+
+def product_column(a, b):
+    """Colonne des sommes des produits ``a × b`` (des carrés si ``a == b``)."""
+    if a == b:
+        return squares_column(a)
+    a, b = sorted((a, b))
+    return f"{a}*{b}"
+
+
+def product_pairs(measures):
+    """Paires distinctes de mesures dont le cube garde les produits croisés."""
+    return [(a, b) for i, a in enumerate(measures) for b in measures[i + 1:]]
+
+
+class SalesCube:
+    def __init__(self, cells, measures=SALES_COLUMNS):
+        self.cells = cells
+        self.measures = list(measures)
+
+    @classmethod
+    def from_frame(cls, df, dimensions=DIMENSIONS, measures=SALES_COLUMNS):
+        values = df[measures].astype("float64")
+        squares = (values ** 2).rename(columns=squares_column)
+        products = pd.DataFrame(
+            {product_column(a, b): values[a] * values[b] for a, b in product_pairs(measures)},
+            index=values.index,
+        )
+        grouped = pd.concat([values, squares, products], axis=1).groupby(
+            [df[d] for d in dimensions], observed=True
+        )
+        cells = grouped.sum()
+        cells.insert(0, "count", grouped.size())
+        return cls(with_manufacturers(with_periods(cells.reset_index())), measures)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def where(self, **filters):
+        """Tranche du cube.
+
+        Chaque filtre vaut ``None`` (pas de filtre), un tuple ``(min, max)``
+        inclusif, une liste de valeurs admises ou une valeur unique.
+        """
+        mask = pd.Series(True, index=self.cells.index)
+        for column, value in filters.items():
+            if value is None:
+                continue
+            values = self.cells[column]
+            if isinstance(value, tuple):
+                mask &= values.between(*value)
+            elif isinstance(value, (list, set, frozenset)):
+                mask &= values.isin(list(value))
+            else:
+                mask &= values == value
+        return SalesCube(self.cells[mask], self.measures)
+
+    def rollup(self, by=None, measures=None):
+        """Somme des cellules regroupées par ``by`` (toutes si ``None``).
+
+        Renvoie les colonnes ``count`` et les sommes des mesures.
+        """
+        measures = self.measures if measures is None else list(measures)
+        columns = ["count"] + measures
+        if by is None:
+            return self.cells[columns].sum()
+        return self.cells.groupby(by, observed=True)[columns].sum()
+
+    def matrix(self, by, measures=None, columns=None):
+        """Matrice dense groupes × mesures, en une seule passe sur les cellules.
+
+        Avec ``columns`` (ex. ``"Manufacturer"``), la mesure unique
+        ``measures`` est ventilée par valeur de cette colonne : la matrice est
+        alors groupes × valeurs, à zéro pour les combinaisons absentes. Seuls
+        les groupes présents dans la sélection figurent dans la matrice.
+        """
+        groups, group_labels = pd.factorize(self.cells[by], sort=True)
+        if columns is None:
+            measures = self.measures if measures is None else list(measures)
+            cells, labels = groups, pd.Index(measures)
+            weights = [self.cells[m].to_numpy(dtype="float64") for m in measures]
+            width = 1
+        else:
+            codes, labels = pd.factorize(self.cells[columns], sort=True)
+            width = len(labels)
+            cells = groups * width + codes
+            weights = [self.cells[measures].to_numpy(dtype="float64")]
+        sums = np.column_stack([
+            np.bincount(cells, weights=w, minlength=len(group_labels) * width)
+            for w in weights
+        ]).reshape(len(group_labels), len(labels))
+        return pd.DataFrame(
+            sums,
+            index=pd.Index(group_labels, name=by),
+            columns=pd.Index(labels, name=columns),
+        )
+
+    def covariance(self, measures=None):
+        """Matrice de covariance (échantillon) des mesures, à partir des sommes.
+
+        Additionne les nombres, sommes et sommes des produits croisés des
+        cellules : le coût dépend du nombre de cellules, pas de lignes.
+        """
+        measures = self.measures if measures is None else list(measures)
+        pairs = [squares_column(m) for m in measures] + [product_column(a, b) for a, b in product_pairs(measures)]
+        sums = self.cells[["count"] + measures + pairs].sum()
+        count = sums["count"]
+        means = sums[measures].to_numpy(dtype="float64") / count
+        products = np.array([[sums[product_column(a, b)] for b in measures] for a in measures])
+        covariance = (products - count * np.outer(means, means)) / (count - 1)
+        return pd.DataFrame(covariance, index=measures, columns=measures)
+
+    def correlation(self, measures=None):
+        """Matrice de corrélation de Pearson des mesures (comme ``DataFrame.corr``)."""
+        covariance = self.covariance(measures)
+        std = np.sqrt(np.diag(covariance.to_numpy()).clip(min=0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = covariance.to_numpy() / np.outer(std, std)
+        return pd.DataFrame(correlation.clip(-1, 1), index=covariance.index, columns=covariance.columns)
+
+    def trend(self, x, y):
+        """Pente et ordonnée à l'origine de la droite des moindres carrés de ``y``
+        en fonction de ``x`` (``nan`` si ``x`` est constant ou la tranche vide)."""
+        covariance = self.covariance([x, y])
+        sums = self.cells[["count", x, y]].sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = covariance.at[x, y] / covariance.at[x, x]
+            intercept = (sums[y] - slope * sums[x]) / sums["count"]
+        return float(slope), float(intercept)
+
+
+def dominance(matrix):
+    """Colonne dominante de chaque ligne d'une matrice (voir ``SalesCube.matrix``).
+
+    Renvoie, par groupe, la colonne de plus grande valeur (la première en cas
+    d'égalité), cette valeur, le total de la ligne et la part de la colonne
+    dominante dans ce total (0 pour une ligne vide).
+    """
+    values = matrix.to_numpy(dtype="float64")
+    best = values.argmax(axis=1)
+    top = values[np.arange(len(values)), best]
+    total = values.sum(axis=1)
+    share = np.divide(top, total, out=np.zeros_like(top), where=total > 0)
+    return pd.DataFrame(
+        {"dominant": matrix.columns[best], "max": top, "total": total, "share": share},
+        index=matrix.index,
+    )
+
+
+def load_cube(name):
+    """Cube de la vue ``name`` de ``vgsales.data``, construit une fois par version
+    et partagé par les vues aux mêmes lignes."""
+    return _load_cube(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_cube(key, _name):
+    return SalesCube.from_frame(load_view(_name))
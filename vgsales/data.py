@@ -0,0 +1,96 @@
+"""Accès centralisé au dataset des ventes de jeux vidéo.
+
+Le CSV est normalisé une seule fois à l'ingestion (snapshot Parquet, voir
+``vgsales.snapshot``) puis converti en stockage colonne projeté en mémoire
+(``vgsales.colstore``), ouvert une seule fois par processus serveur et par
+version du fichier source : toutes les pages partagent le même DataFrame (``st.cache_resource`` ne copie pas l'objet
+à chaque accès, contrairement à ``st.cache_data``). Les règles de nettoyage
+propres à chaque page sont exposées sous forme de vues nommées.
+
+Le DataFrame partagé ne doit jamais être modifié en place : une page qui a
+besoin d'une colonne dérivée utilise ``df.assign(...)``.
+"""
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from vgsales.buckets import with_periods
+from vgsales.colstore import ColumnStore, ensure_store
+from vgsales.platforms import with_manufacturers
+
+DATASET_PATH = Path(__file__).resolve().parent.parent / "datasets" / "vgsales.csv"
+
+REGION_COLUMNS = ["NA_Sales", "EU_Sales", "JP_Sales", "Other_Sales"]
+SALES_COLUMNS = REGION_COLUMNS + ["Global_Sales"]
+
+# Types explicites : évite l'inférence colonne par colonne et la conversion
+# ``pd.to_numeric(Year)`` répétée dans chaque page. Les ventes tiennent en
+# float32 (deux décimales) et les colonnes texte sont encodées par dictionnaire
+# dans le stockage colonne : Platform, Genre, Publisher et Name arrivent dans
+# les pages en ``category``, chaque valeur distincte n'étant stockée qu'une fois
+# et partagée par toutes les vues. Filtres et groupby travaillent sur les codes.
+DTYPES = {
+    "Rank": "int32",
+    "Name": "str",
+    "Platform": "str",
+    "Year": "Int16",
+    "Genre": "str",
+    "Publisher": "str",
+    **{column: "float32" for column in SALES_COLUMNS},
+}
+
+# Colonnes qui doivent être renseignées pour chaque vue (en plus de Year)
+VIEWS = {
+    "genres": ["Genre", "Global_Sales"],
+    "regions": REGION_COLUMNS,
+    "japan": ["Platform", "JP_Sales"],
+}
+
+
+def read_dataset(path=DATASET_PATH):
+    return pd.read_csv(path, dtype=DTYPES, na_values=["N/A"])
+
+
+@st.cache_resource(show_spinner="Chargement des données...", max_entries=1)
+def _open_store(path, version):
+    return ColumnStore(path)
+
+
+def load_store():
+    return _open_store(*ensure_store(DATASET_PATH))
+
+
+def dataset_version():
+    """Version courante du dataset, à utiliser comme clé des caches dérivés."""
+    return ensure_store(DATASET_PATH)[1]
+
+
+def load_view(name):
+    """Sous-ensemble nettoyé du dataset partagé, avec ``Year`` non nul.
+
+    Les périodes de ``vgsales.buckets.PERIODS`` (``Generation``, ``Decade``)
+    y sont ajoutées une fois pour toutes, en colonnes catégorielles, ainsi que
+    le constructeur de chaque plateforme (``Manufacturer``, voir
+    ``vgsales.platforms``).
+    """
+    return _load_view(name, *ensure_store(DATASET_PATH))
+
+
+@st.cache_resource(max_entries=len(VIEWS))
+def _load_view(name, path, version):
+    store = _open_store(path, version)
+    # Les lignes datées forment un préfixe du stockage : tranche sans copie
+    df = store.frame(slice(0, store.dated_rows))
+    mask = df[VIEWS[name]].notna().all(axis=1)
+    return with_manufacturers(with_periods(df if mask.all() else df[mask]))
+
+
+def view_key(name):
+    """Identifiant des lignes d'une vue, pour les caches de résultats et d'index.
+
+    Deux vues qui retiennent exactement les mêmes lignes (toutes les lignes
+    datées) ont la même clé et partagent donc leurs agrégats et leurs index.
+    """
+    rows = "dated" if len(load_view(name)) == load_store().dated_rows else name
+    return dataset_version(), rows
@@ -0,0 +1,85 @@
+"""Résumés de distribution par groupe, pour des box plots et violons légers.
+
+``px.box`` et ``px.violin`` envoient toutes les valeurs au navigateur, qui
+calcule quartiles et densité. ``summarize`` les lit dans les histogrammes des
+esquisses de quantiles (``vgsales.sketch``) de chaque groupe, fusionnées à
+partir des cellules du cube de la sélection : aucune ligne n'est relue ni
+triée. On obtient les quartiles, les moustaches (valeurs extrêmes à moins de
+1,5 écart interquartile des quartiles, comme Plotly), les valeurs aberrantes
+(un point par seau, au plus ``MAX_OUTLIERS`` par groupe, les plus éloignés
+de la médiane) et une densité à noyau gaussien sur ``DENSITY_POINTS`` points.
+Toutes ces valeurs sont exactes à ``RELATIVE_ACCURACY`` près. Les figures
+(``vgsales.plotting.box`` et ``violin``) ne contiennent que ces résumés.
+"""
+import numpy as np
+import pandas as pd
+
+from vgsales.sketch import QuantileSketch
+
+MAX_OUTLIERS = 50
+DENSITY_POINTS = 100
+DENSITY_BINS = 512
+WHISKER = 1.5
+
+
+def _density(points, weights, q1, q3):
+    """Grille et densité (noyau gaussien, largeur de Silverman) de valeurs pondérées."""
+    count = weights.sum()
+    low, high = points[0], points[-1]
+    mean = np.average(points, weights=weights)
+    std = np.sqrt((weights * (points - mean) ** 2).sum() / (count - 1)) if count > 1 else 0.0
+    spread = min(std, (q3 - q1) / 1.349) if q3 > q1 else std
+    bandwidth = 1.059 * spread * count ** -0.2
+    if high <= low or bandwidth <= 0:
+        return np.array([low]), np.array([1.0])
+    counts, edges = np.histogram(points, bins=DENSITY_BINS, range=(low, high), weights=weights)
+    centers = (edges[:-1] + edges[1:]) / 2
+    grid = np.linspace(low, high, DENSITY_POINTS)
+    kernel = np.exp(-0.5 * ((grid[:, None] - centers[None, :]) / bandwidth) ** 2)
+    density = kernel @ counts / (count * bandwidth * np.sqrt(2 * np.pi))
+    return grid, density
+
+
+def summarize(histograms, labels, max_outliers=MAX_OUTLIERS):
+    """Résumé de la distribution de chaque groupe.
+
+    ``histograms`` a une ligne par groupe de ``labels`` (histogrammes
+    d'esquisses, voir ``SketchIndex.grouped``). Renvoie un tableau indexé par
+    les groupes non vides : nombre, moyenne, quartiles, moustaches
+    (``lowerfence``, ``upperfence``), valeurs aberrantes retenues, grille et
+    densité.
+    """
+    values = QuantileSketch.values()
+    rows = {}
+    for label, counts in zip(labels, histograms):
+        sketch = QuantileSketch(counts)
+        if not sketch.count:
+            continue
+        q1, median, q3 = sketch.quantile([0.25, 0.5, 0.75])
+        # Seaux occupés, par valeur croissante
+        occupied = np.flatnonzero(counts)
+        points, weights = values[occupied], counts[occupied]
+        reach = WHISKER * (q3 - q1)
+        inside = (points >= q1 - reach) & (points <= q3 + reach)
+        # Les quartiles (approchés) peuvent tomber entre deux seaux : moustaches
+        # au moins jusqu'aux quartiles
+        lowerfence = min(points[inside].min(), q1) if inside.any() else q1
+        upperfence = max(points[inside].max(), q3) if inside.any() else q3
+        outliers = points[~inside]
+        if len(outliers) > max_outliers:
+            outliers = np.sort(outliers[np.argsort(np.abs(outliers - median), kind="stable")[-max_outliers:]])
+        grid, density = _density(points, weights, q1, q3)
+        rows[label] = {
+            "count": sketch.count,
+            "mean": np.average(points, weights=weights),
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lowerfence": lowerfence,
+            "upperfence": upperfence,
+            "outliers": outliers,
+            "grid": grid,
+            "density": density,
+        }
+    columns = ["count", "mean", "q1", "median", "q3", "lowerfence", "upperfence", "outliers", "grid", "density"]
+    return pd.DataFrame.from_dict(rows, orient="index", columns=columns)
@@ -0,0 +1,128 @@
+"""Cache des figures Plotly, indexé par le contenu de leurs données.
+
+Construire une figure avec Plotly Express (validation de chaque propriété,
+gabarit, traces par couleur) coûte plus cher que l'agrégat qu'elle affiche,
+et se répète à chaque réexécution du script, y compris quand les données
+n'ont pas changé. ``cached_figure(px.bar, données, **paramètres)`` renvoie la
+figure déjà construite pour un contenu identique : la clé est une empreinte
+(BLAKE2) de la fonction de construction, des données agrégées (valeurs,
+index, types) et des paramètres de style. Les réexécutions à filtres
+inchangés et les autres sessions qui tracent le même agrégat reprennent donc
+la figure. Les graphiques de genres de l'accueil et de l'hypothèse 1 ne
+partagent pas d'entrée : le premier couvre toutes les lignes du dataset, le
+second les lignes datées de la sélection.
+
+Les figures sont gardées dans un ``ResultCache`` à part, borné par une
+estimation de leur taille (octets des tableaux de données des traces) et
+évincé par ancienneté d'utilisation. Les figures intermédiaires d'un calcul
+en cours (``cache=None``) ne sont pas mises en cache. ``st.plotly_chart``
+sérialise lui-même la figure reçue sans la modifier ; une figure du cache est
+partagée entre sessions et ne doit jamais être modifiée en place : les mises
+en forme passent par ``layout=``, appliqué avant la mise en cache.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from vgsales.cache import ResultCache
+
+FIGURE_CACHE_BYTES = 32 * 1024 * 1024
+
+# Propriétés des traces qui portent les données
+DATA_PROPERTIES = (
+    "x", "y", "z", "values", "labels", "ids", "parents", "text", "hovertext",
+    "customdata", "marker.color", "marker.size",
+)
+# Mise en forme d'une trace et de la figure (gabarit, axes, légende)
+TRACE_BYTES = 2 * 1024
+LAYOUT_BYTES = 16 * 1024
+
+
+def _nbytes(value):
+    if value is None:
+        return 0
+    if isinstance(value, np.ndarray):
+        # Chaînes : environ 16 octets par valeur
+        return value.size * 16 if value.dtype == object else value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    if isinstance(value, str):
+        return len(value)
+    return 8
+
+
+def figure_size(fig):
+    """Taille estimée de la figure : octets des données de ses traces, sans
+    la sérialiser."""
+    size = LAYOUT_BYTES
+    for trace in fig.data:
+        size += TRACE_BYTES + sum(_nbytes(trace[name]) for name in DATA_PROPERTIES if name in trace)
+    return size
+
+
+FIGURES = ResultCache(FIGURE_CACHE_BYTES, sizeof=figure_size)
+
+
+def _update(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"frame")
+        _update(digest, value.index)
+        for column in value.columns:
+            _update(digest, column)
+            _update(digest, value[column].array)
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(b"series" if isinstance(value, pd.Series) else b"index")
+        _update(digest, value.name)
+        if isinstance(value, pd.Series):
+            _update(digest, value.index)
+        _update(digest, value.array)
+    elif isinstance(value, (np.ndarray, pd.api.extensions.ExtensionArray)):
+        digest.update(str(value.dtype).encode())
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            digest.update(repr(value.shape).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            try:
+                digest.update(pd.util.hash_array(np.asarray(value)).tobytes())
+            except TypeError:
+                # Valeurs non hachables par pandas (ex. tableaux par groupe)
+                for item in value:
+                    _update(digest, item)
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"list%d" % len(value))
+        for item in value:
+            _update(digest, item)
+    elif callable(value):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    else:
+        digest.update(repr(value).encode())
+
+
+def content_key(*values, **params):
+    """Empreinte du contenu de ``values`` et ``params``."""
+    digest = hashlib.blake2b(digest_size=16)
+    _update(digest, values)
+    _update(digest, params)
+    return digest.hexdigest()
+
+
+def cached_figure(build, *data, layout=None, cache=FIGURES, **params):
+    """Figure ``build(*data, **params)`` mise en forme par ``layout``, reprise du
+    cache quand la fonction, les données et les paramètres sont identiques.
+
+    Avec ``cache=None``, la figure est construite sans passer par le cache.
+    """
+
+    def compute():
+        fig = build(*data, **params)
+        return fig.update_layout(**layout) if layout else fig
+
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(content_key(build, *data, layout=layout, **params), compute)
@@ -0,0 +1,102 @@
+"""Moteur de filtres à base de bitmaps, partagé par les pages d'hypothèses.
+
+L'index conserve un bitmap compressé (``np.packbits``, un bit par ligne) pour
+chaque valeur des colonnes discrètes (plateforme, genre, génération, année) et l'ordre de
+tri des colonnes de ventes pour les seuils. Une sélection de la barre latérale
+se résout en OU entre les bitmaps d'une même colonne puis en ET entre les
+colonnes, sur ``n / 8`` octets, sans comparer les valeurs ligne par ligne.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vgsales.data import load_view, view_key
+
+BITMAP_COLUMNS = ["Platform", "Genre", "Generation", "Year"]
+SORTED_COLUMNS = ["Global_Sales", "JP_Sales"]
+
+
+class FilterEngine:
+    def __init__(self, df, bitmap_columns=BITMAP_COLUMNS, sorted_columns=SORTED_COLUMNS):
+        self.rows = len(df)
+        self.bitmaps = {}
+        for column in bitmap_columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                keys, codes = values.cat.categories, values.array.codes
+            else:
+                keys, codes = np.unique(values.to_numpy(), return_inverse=True)
+            self.bitmaps[column] = {
+                key: np.packbits(codes == code) for code, key in enumerate(keys)
+            }
+        self.sorted = {}
+        for column in sorted_columns:
+            values = df[column].to_numpy()
+            order = np.argsort(values, kind="stable")
+            self.sorted[column] = (values[order], order)
+
+    def _empty(self):
+        return np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+
+    def _full(self):
+        return np.packbits(np.ones(self.rows, dtype=bool))
+
+    def _bitmap(self, column, value):
+        bitmaps = self.bitmaps[column]
+        if isinstance(value, tuple):
+            low, high = value
+            keys = [k for k in bitmaps if (low is None or k >= low) and (high is None or k <= high)]
+        elif isinstance(value, (list, set, frozenset)):
+            keys = [k for k in value if k in bitmaps]
+        else:
+            keys = [value] if value in bitmaps else []
+        if not keys:
+            return self._empty()
+        return np.bitwise_or.reduce([bitmaps[k] for k in keys])
+
+    def _range(self, column, value):
+        low, high = value
+        sorted_values, order = self.sorted[column]
+        # Bornes converties dans le type de la colonne (float32), comme ``>=`` ;
+        # une borne ouverte vaut ±inf : les valeurs manquantes, triées en fin,
+        # ne sont jamais retenues
+        low = sorted_values.dtype.type(-np.inf if low is None else low)
+        high = sorted_values.dtype.type(np.inf if high is None else high)
+        start = np.searchsorted(sorted_values, low, side="left")
+        stop = np.searchsorted(sorted_values, high, side="right")
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[order[start:stop]] = True
+        return np.packbits(mask)
+
+    def select(self, **filters):
+        """Bitmap compressé des lignes retenues.
+
+        Colonnes bitmap : valeur unique, liste de valeurs ou tuple
+        ``(min, max)`` inclusif. Colonnes triées : tuple ``(min, max)``, une
+        borne ``None`` étant ouverte. Un filtre ``None`` est ignoré.
+        """
+        selected = None
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if column in self.bitmaps:
+                bitmap = self._bitmap(column, value)
+            else:
+                bitmap = self._range(column, value)
+            selected = bitmap if selected is None else selected & bitmap
+        return self._full() if selected is None else selected
+
+    def mask(self, **filters):
+        """Masque booléen des lignes retenues, utilisable avec ``df[mask]``."""
+        return np.unpackbits(self.select(**filters), count=self.rows).astype(bool)
+
+
+def load_filter_engine(name):
+    """Index de filtres de la vue ``name``, construit une fois par version
+    et partagé par les vues aux mêmes lignes."""
+    return _load_filter_engine(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_filter_engine(key, _name):
+    return FilterEngine(load_view(_name))
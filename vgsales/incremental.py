@@ -0,0 +1,112 @@
+"""Mise à jour incrémentale du cube d'une sélection de lignes.
+
+Quand un filtre par jeu (seuil de ventes) est actif, le cube de la sélection
+doit être calculé à partir des lignes. Les mesures du cube (nombre, sommes,
+sommes des carrés et des produits croisés) sont additives : d'une exécution à
+l'autre, on ne traite que les lignes entrées dans la sélection ou sorties de
+celle-ci, et on ajoute ou retranche leur contribution aux cellules. Quand l'écart est trop grand,
+ou après un certain nombre de mises à jour (pour borner la dérive des
+arrondis), on recalcule tout.
+
+Les statistiques non additives (médiane, maximum, nombre de valeurs
+distinctes) ne passent pas par ce mécanisme et sont toujours recalculées sur
+les lignes sélectionnées.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vgsales.buckets import with_periods
+from vgsales.cube import DIMENSIONS, SalesCube, product_column, product_pairs, squares_column
+from vgsales.data import SALES_COLUMNS, load_view, view_key
+from vgsales.platforms import with_manufacturers
+
+# Au-delà de cette fraction de lignes modifiées, le recalcul complet est moins cher
+MAX_DELTA = 0.5
+# Nombre de mises à jour incrémentales avant un recalcul complet
+MAX_UPDATES = 50
+
+
+class CellIndex:
+    """Cellule du cube de chaque ligne d'une vue.
+
+    Seuls les numéros de cellule (``int32``) sont gardés en mémoire : les
+    contributions des lignes (valeurs, carrés, produits croisés) sont calculées
+    dans ``sums`` pour les seules lignes demandées, à partir des colonnes
+    projetées en mémoire de la vue.
+    """
+
+    def __init__(self, df, dimensions=DIMENSIONS, measures=SALES_COLUMNS):
+        grouped = df.groupby(list(dimensions), observed=True, sort=True)
+        self.cell_ids = grouped.ngroup().to_numpy().astype(np.int32)
+        self.keys = with_manufacturers(with_periods(grouped.size().index.to_frame(index=False)))
+        self.measures = list(measures)
+        self.pairs = product_pairs(self.measures)
+        self.columns = (["count"] + self.measures + [squares_column(m) for m in self.measures]
+                        + [product_column(a, b) for a, b in self.pairs])
+        # Colonnes de la vue (sans copie)
+        self.data = {m: df[m].to_numpy() for m in self.measures}
+
+    def sums(self, rows):
+        """Totaux par cellule des lignes ``rows`` (indices)."""
+        ids = self.cell_ids[rows]
+        values = {m: self.data[m][rows].astype("float64") for m in self.measures}
+        contributions = ([np.ones(len(ids))] + [values[m] for m in self.measures]
+                         + [values[m] ** 2 for m in self.measures]
+                         + [values[a] * values[b] for a, b in self.pairs])
+        return np.column_stack([
+            np.bincount(ids, weights=w, minlength=len(self.keys)) for w in contributions
+        ])
+
+
+class IncrementalCube:
+    """Cube d'une sélection, mis à jour par différence avec la précédente."""
+
+    def __init__(self, index):
+        self.index = index
+        self.mask = None
+        self.totals = None
+        self.updates = 0
+
+    def update(self, mask):
+        mask = np.asarray(mask, dtype=bool)
+        if self.mask is not None:
+            entered = np.flatnonzero(mask & ~self.mask)
+            left = np.flatnonzero(self.mask & ~mask)
+            delta = len(entered) + len(left)
+        if self.mask is None or delta > MAX_DELTA * len(mask) or self.updates >= MAX_UPDATES:
+            self.totals = self.index.sums(np.flatnonzero(mask))
+            self.updates = 0
+        elif delta:
+            self.totals = self.totals + self.index.sums(entered) - self.index.sums(left)
+            self.updates += 1
+        self.mask = mask
+        return self.cube()
+
+    def cube(self):
+        cells = pd.concat(
+            [self.index.keys, pd.DataFrame(self.totals, columns=self.index.columns)], axis=1
+        )
+        cells = cells[cells["count"] > 0.5].reset_index(drop=True)
+        cells["count"] = cells["count"].round().astype("int64")
+        return SalesCube(cells, self.index.measures)
+
+
+def load_cell_index(name):
+    return _load_cell_index(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_cell_index(key, _name):
+    return CellIndex(load_view(_name))
+
+
+def incremental_cube(name, mask):
+    """Cube des lignes ``mask`` de la vue ``name``, mis à jour depuis la
+    sélection précédente de la même session."""
+    index = load_cell_index(name)
+    states = st.session_state.setdefault("incremental_cubes", {})
+    state = states.get(name)
+    if state is None or state.index is not index:
+        state = states[name] = IncrementalCube(index)
+    return state.update(mask)
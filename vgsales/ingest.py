@@ -0,0 +1,80 @@
+"""Agrégats en flux sur le stockage colonne, par blocs.
+
+Pour les exports trop volumineux pour être chargés d'un coup, le stockage
+colonne partagé (``vgsales.colstore``, déjà typé et nettoyé à l'ingestion)
+est parcouru par tranches de ``CHUNK_ROWS`` lignes, projetées en mémoire sans
+copie : le CSV n'est pas relu. Chaque bloc met à jour des totaux courants
+(par région, genre, plateforme et année) et les statistiques descriptives des
+ventes (``vgsales.stats``), qu'une page peut afficher avant la fin du
+parcours.
+"""
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from vgsales.data import SALES_COLUMNS
+from vgsales.stats import Moments
+
+CHUNK_ROWS = 200_000
+
+# Agrégats complets déjà calculés : version du stockage -> RunningAggregates
+_completed = {}
+
+
+def _empty_totals(index_name):
+    return pd.DataFrame(columns=SALES_COLUMNS, dtype="float64").rename_axis(index_name)
+
+
+@dataclass
+class RunningAggregates:
+    rows: int = 0
+    rows_total: int = 0
+    done: bool = False
+    # Premières lignes du classement (``Rank``) vues jusqu'ici
+    head: pd.DataFrame = None
+    totals: pd.Series = field(default_factory=lambda: pd.Series(0.0, index=SALES_COLUMNS))
+    by_genre: pd.DataFrame = field(default_factory=lambda: _empty_totals("Genre"))
+    by_platform: pd.DataFrame = field(default_factory=lambda: _empty_totals("Platform"))
+    by_year: pd.DataFrame = field(default_factory=lambda: _empty_totals("Year"))
+    # Moyenne, écart-type, extrêmes et médiane par colonne de ventes, fusionnés bloc par bloc
+    moments: Moments = None
+
+    @property
+    def progress(self):
+        return 1.0 if self.done else min(self.rows / max(self.rows_total, 1), 1.0)
+
+    @property
+    def year_range(self):
+        return (self.by_year.index.min(), self.by_year.index.max()) if len(self.by_year) else (None, None)
+
+    def update(self, chunk):
+        top = chunk.nsmallest(10, "Rank")
+        self.head = top if self.head is None else pd.concat([self.head, top]).nsmallest(10, "Rank")
+        self.rows += len(chunk)
+        sales = chunk[SALES_COLUMNS].astype("float64")
+        self.totals = self.totals + sales.sum()
+        partial = Moments.from_array(sales.to_numpy())
+        self.moments = partial if self.moments is None else self.moments.merge(partial)
+        for attribute, column in (("by_genre", "Genre"), ("by_platform", "Platform"), ("by_year", "Year")):
+            partial = sales.groupby(chunk[column], observed=True).sum()
+            current = getattr(self, attribute)
+            setattr(self, attribute, current.add(partial, fill_value=0) if len(current) else partial)
+
+
+def stream_aggregates(store, chunk_rows=CHUNK_ROWS):
+    """Génère les agrégats courants après chaque bloc de ``store`` (``ColumnStore``).
+
+    Le dernier élément a ``done=True`` ; il est mémorisé pour le processus,
+    pour cette version du stockage. Un stockage vide ne génère rien.
+    """
+    key = store.manifest["version"]
+    if key in _completed:
+        yield _completed[key]
+        return
+
+    aggregates = RunningAggregates(rows_total=store.rows)
+    for start in range(0, store.rows, chunk_rows):
+        aggregates.update(store.frame(slice(start, min(start + chunk_rows, store.rows))))
+        aggregates.done = start + chunk_rows >= store.rows
+        yield aggregates
+    _completed[key] = aggregates
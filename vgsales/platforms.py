@@ -0,0 +1,96 @@
+"""Table de dimension des plateformes (constructeur, génération matérielle).
+
+Chaque plateforme du dataset y est décrite une seule fois : constructeur,
+génération de la console et année de sortie. Le constructeur est résolu au
+chargement en une colonne catégorielle ``Manufacturer`` des vues et des
+cellules du cube, par une jointure sur les codes de ``Platform`` (un accès
+tableau par ligne, sans appel Python) : les pages regroupent directement par
+constructeur au lieu de reclasser les plateformes à chaque graphique.
+
+Une plateforme absente de la table n'est pas rangée dans « Autres » : elle
+est classée « Inconnu » et signalée par ``unknown_platforms`` pour que la
+table soit complétée.
+"""
+import numpy as np
+import pandas as pd
+
+# Plateforme : (constructeur, génération de la console, année de sortie)
+PLATFORMS = pd.DataFrame.from_records(
+    [
+        ("2600", "Atari", 2, 1977),
+        ("NES", "Nintendo", 3, 1983),
+        ("TG16", "NEC", 4, 1987),
+        ("GEN", "Sega", 4, 1988),
+        ("GB", "Nintendo", 4, 1989),
+        ("GG", "Sega", 4, 1990),
+        ("NG", "SNK", 4, 1990),
+        ("SNES", "Nintendo", 4, 1990),
+        ("SCD", "Sega", 4, 1991),
+        ("3DO", "The 3DO Company", 5, 1993),
+        ("PCFX", "NEC", 5, 1994),
+        ("PS", "Sony", 5, 1994),
+        ("SAT", "Sega", 5, 1994),
+        ("N64", "Nintendo", 5, 1996),
+        ("DC", "Sega", 6, 1998),
+        ("WS", "Bandai", 5, 1999),
+        ("PS2", "Sony", 6, 2000),
+        ("GBA", "Nintendo", 6, 2001),
+        ("GC", "Nintendo", 6, 2001),
+        ("XB", "Microsoft", 6, 2001),
+        ("DS", "Nintendo", 7, 2004),
+        ("PSP", "Sony", 7, 2004),
+        ("X360", "Microsoft", 7, 2005),
+        ("PS3", "Sony", 7, 2006),
+        ("Wii", "Nintendo", 7, 2006),
+        ("3DS", "Nintendo", 8, 2011),
+        ("PSV", "Sony", 8, 2011),
+        ("WiiU", "Nintendo", 8, 2012),
+        ("PS4", "Sony", 8, 2013),
+        ("XOne", "Microsoft", 8, 2013),
+        ("Switch", "Nintendo", 9, 2017),
+        ("PC", None, None, None),
+    ],
+    columns=["Platform", "Manufacturer", "Console_Generation", "Release"],
+    index="Platform",
+).astype({"Console_Generation": "Int8", "Release": "Int16"})
+
+# Libellés affichés : les grands constructeurs, puis tous les autres
+MANUFACTURER_LABELS = {
+    "Nintendo": "🎮 Nintendo",
+    "Sony": "🎯 Sony",
+    "Microsoft": "🟢 Microsoft",
+    "Sega": "🔵 Sega",
+}
+OTHERS = "🖥️ Autres"
+UNKNOWN = "❓ Inconnu"
+
+MANUFACTURERS = pd.CategoricalDtype(list(MANUFACTURER_LABELS.values()) + [OTHERS, UNKNOWN])
+
+
+def manufacturer_label(platform):
+    """Libellé du constructeur de ``platform`` (``UNKNOWN`` hors de la table)."""
+    if platform not in PLATFORMS.index:
+        return UNKNOWN
+    return MANUFACTURER_LABELS.get(PLATFORMS.at[platform, "Manufacturer"], OTHERS)
+
+
+def unknown_platforms(platforms):
+    """Plateformes de ``platforms`` absentes de la table, triées."""
+    return sorted(set(platforms) - set(PLATFORMS.index))
+
+
+def with_manufacturers(df):
+    """``df`` avec la colonne catégorielle ``Manufacturer`` tirée de ``Platform``.
+
+    La table est résolue une fois par catégorie de ``Platform`` ; chaque ligne
+    n'est ensuite qu'une indexation de tableau par son code.
+    """
+    platforms = df["Platform"].array
+    lookup = np.array(
+        [MANUFACTURERS.categories.get_loc(manufacturer_label(p)) for p in platforms.categories],
+        dtype=np.int8,
+    )
+    codes = lookup[platforms.codes] if len(lookup) else np.zeros(len(df), dtype=np.int8)
+    # Code -1 (plateforme manquante) : reste manquant
+    codes = np.where(platforms.codes < 0, -1, codes)
+    return df.assign(Manufacturer=pd.Categorical.from_codes(codes, dtype=MANUFACTURERS))
@@ -0,0 +1,166 @@
+"""Nuages de points à taille bornée pour le navigateur.
+
+Un ``px.scatter`` envoie chaque ligne au navigateur. Au-delà de
+``MAX_POINTS`` lignes, les points sont réduits avant le tracé : on garde un
+point par case d'une grille ``GRID × GRID`` sur l'étendue des données, ce qui
+conserve l'étendue du nuage et tous les points isolés (valeurs extrêmes),
+puis des lignes régulièrement espacées jusqu'à ``MAX_POINTS`` pour la
+densité. La réduction est déterministe. Au-delà de ``WEBGL_ROWS`` points
+tracés, la trace passe en WebGL. La taille de la figure et le temps de rendu
+restent bornés quelle que soit la sélection.
+
+Une droite de tendance (pente et ordonnée à l'origine, voir
+``SalesCube.trend``) s'ajoute comme une trace de deux points, aux bornes des
+abscisses de toutes les lignes.
+
+``box`` et ``violin`` tracent des distributions déjà résumées par groupe
+(``vgsales.distributions.summarize``) : la figure grandit avec le nombre de
+groupes, pas avec le nombre de jeux.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+MAX_POINTS = 5_000
+GRID = 128
+WEBGL_ROWS = 1_000
+# Couleur de la première trace de Plotly Express
+DEFAULT_COLOR = px.colors.qualitative.Plotly[0]
+
+
+def reduce_points(df, x, y, max_points=MAX_POINTS, grid=GRID):
+    """Lignes de ``df`` à tracer : toutes, ou un point par case occupée de la grille."""
+    if len(df) <= max_points:
+        return df
+    cells = np.zeros(len(df), dtype=np.int64)
+    for column in (x, y):
+        values = df[column].to_numpy(dtype="float64")
+        low, high = np.nanmin(values), np.nanmax(values)
+        scale = (grid - 1) / (high - low) if high > low else 0.0
+        cells = cells * grid + np.nan_to_num((values - low) * scale).astype(np.int64)
+    # Premier point de chaque case, dans l'ordre des lignes
+    _, first = np.unique(cells, return_index=True)
+    keep = np.sort(first)
+    if len(keep) > max_points:
+        # Grille trop fine pour la borne : sous-échantillonnage régulier, en
+        # gardant les cases qui ne contiennent qu'un point (isolés)
+        counts = np.bincount(np.unique(cells, return_inverse=True)[1])
+        isolated = np.sort(first[counts == 1])
+        others = np.setdiff1d(keep, isolated)
+        budget = max(max_points - len(isolated), 0)
+        sampled = others[np.linspace(0, len(others) - 1, budget).astype(np.int64)] if budget and len(others) else others[:0]
+        keep = np.union1d(isolated[:max_points], sampled)
+    else:
+        # Reste du budget : lignes régulièrement espacées, pour la densité
+        others = np.setdiff1d(np.arange(len(df)), keep)
+        budget = min(max_points - len(keep), len(others))
+        keep = np.union1d(keep, others[np.linspace(0, len(others) - 1, budget).astype(np.int64)] if budget else [])
+    return df.iloc[keep.astype(np.int64)]
+
+
+def scatter(df, x, y, title=None, trend=None, max_points=MAX_POINTS, webgl_rows=WEBGL_ROWS, **kwargs):
+    """``px.scatter`` sur les points réduits, en WebGL au-delà de ``webgl_rows`` points.
+
+    ``trend`` : ``(pente, ordonnée à l'origine)`` d'une droite de tendance.
+    """
+    points = reduce_points(df, x, y, max_points)
+    if title and len(points) < len(df):
+        title = f"{title} ({len(points):,} points sur {len(df):,})"
+    fig = px.scatter(
+        points,
+        x=x,
+        y=y,
+        title=title,
+        render_mode="webgl" if len(points) > webgl_rows else "svg",
+        **kwargs,
+    )
+    if trend is not None:
+        add_trend(fig, df[x], *trend)
+    return fig
+
+
+def add_trend(fig, x, slope, intercept, name="Tendance"):
+    """Droite ``y = slope × x + intercept`` entre le minimum et le maximum de ``x``."""
+    if len(x) == 0 or not np.isfinite([slope, intercept]).all():
+        return fig
+    bounds = np.array([np.nanmin(x), np.nanmax(x)], dtype="float64")
+    return fig.add_trace(
+        go.Scatter(
+            x=bounds,
+            y=slope * bounds + intercept,
+            mode="lines",
+            name=name,
+            line=dict(dash="dash"),
+        )
+    )
+
+
+def box(summary, x, y, title=None):
+    """Box plot précalculé : une boîte par groupe de ``summary``, valeurs aberrantes en points."""
+    labels = list(summary.index)
+    fig = go.Figure(
+        go.Box(
+            x=labels,
+            q1=summary["q1"],
+            median=summary["median"],
+            q3=summary["q3"],
+            lowerfence=summary["lowerfence"],
+            upperfence=summary["upperfence"],
+            mean=summary["mean"],
+            name=y,
+            marker_color=DEFAULT_COLOR,
+            boxpoints=False,
+        )
+    )
+    outliers = summary["outliers"]
+    fig.add_trace(
+        go.Scatter(
+            x=np.repeat(labels, outliers.map(len).to_numpy(dtype="int64")),
+            y=np.concatenate(outliers.to_list()) if len(outliers) else [],
+            mode="markers",
+            marker=dict(color=DEFAULT_COLOR, size=4),
+            name="Valeurs aberrantes",
+        )
+    )
+    return fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, showlegend=False)
+
+
+def violin(summary, x, y, title=None, width=0.8):
+    """Violons précalculés : contour de la densité de chaque groupe, médiane et quartiles."""
+    labels = list(summary.index)
+    fig = go.Figure()
+    for position, (label, row) in enumerate(summary.iterrows()):
+        half = row["density"] / row["density"].max() * width / 2
+        fig.add_trace(
+            go.Scatter(
+                x=np.concatenate([position - half, (position + half)[::-1]]),
+                y=np.concatenate([row["grid"], row["grid"][::-1]]),
+                fill="toself",
+                mode="lines",
+                line=dict(width=1, color=DEFAULT_COLOR),
+                name=label,
+                hoveron="fills",
+                text=f"{label}<br>médiane : {row['median']:.2f}<br>quartiles : {row['q1']:.2f} – {row['q3']:.2f}",
+                hoverinfo="text",
+            )
+        )
+    # Quartiles (trait) et médiane (point) de chaque groupe
+    positions = np.arange(len(labels))
+    fig.add_trace(
+        go.Scatter(
+            x=np.repeat(positions, 3),
+            y=np.column_stack([summary["q1"], summary["q3"], np.full(len(labels), np.nan)]).ravel(),
+            mode="lines",
+            line=dict(width=4, color="black"),
+            hoverinfo="skip",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(x=positions, y=summary["median"], mode="markers", marker=dict(color="white", size=5), name="Médiane")
+    )
+    return fig.update_layout(
+        title=title,
+        xaxis=dict(title=x, tickmode="array", tickvals=positions, ticktext=labels),
+        yaxis_title=y,
+        showlegend=False,
+    )
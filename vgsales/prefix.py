@@ -0,0 +1,106 @@
+"""Sommes cumulées par année pour les totaux sur une période.
+
+On conserve les sommes cumulées année après année de chaque colonne de
+ventes et du nombre de jeux, globalement et pour chaque genre, chaque
+plateforme et chaque constructeur. Le total d'une période se lit alors en deux
+accès et une soustraction, quelle que soit la taille du dataset.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vgsales.data import SALES_COLUMNS, load_view, view_key
+
+GROUP_COLUMNS = ["Genre", "Platform", "Manufacturer"]
+MEASURES = ["count"] + SALES_COLUMNS
+
+
+def year_runs(years):
+    """Périodes contiguës ``(début, fin)`` inclusives couvrant ``years``.
+
+    ``years`` est soit un tuple ``(début, fin)``, soit une liste d'années.
+    """
+    if isinstance(years, tuple):
+        return [(int(years[0]), int(years[1]))]
+    runs = []
+    for year in sorted(set(int(y) for y in years)):
+        if runs and runs[-1][1] == year - 1:
+            runs[-1] = (runs[-1][0], year)
+        else:
+            runs.append((year, year))
+    return runs
+
+
+class YearPrefixIndex:
+    def __init__(self, df, group_columns=GROUP_COLUMNS):
+        years = df["Year"].to_numpy()
+        self.first_year = int(years.min()) if len(years) else 0
+        self.last_year = int(years.max()) if len(years) else -1
+        span = self.last_year - self.first_year + 1
+
+        year_codes = years.astype(np.int64) - self.first_year
+        values = np.column_stack(
+            [np.ones(len(df))] + [df[c].to_numpy(dtype="float64") for c in SALES_COLUMNS]
+        )
+        # prefix[i] : totaux des années strictement antérieures à first_year + i
+        self.prefix = self._cumulate(year_codes, values, span, 1)[:, 0]
+        self.groups = {}
+        for column in group_columns:
+            categories = df[column].cat.categories
+            codes = df[column].array.codes.astype(np.int64)
+            cells = year_codes * len(categories) + codes
+            self.groups[column] = (
+                {key: i for i, key in enumerate(categories)},
+                self._cumulate(cells, values, span, len(categories)),
+            )
+
+    @staticmethod
+    def _cumulate(cells, values, span, width):
+        totals = np.column_stack([
+            np.bincount(cells, weights=values[:, j], minlength=span * width)
+            for j in range(values.shape[1])
+        ]).reshape(span, width, values.shape[1])
+        prefix = np.zeros((span + 1, width, values.shape[1]))
+        np.cumsum(totals, axis=0, out=prefix[1:])
+        return prefix
+
+    def _runs(self, years):
+        """Intervalles de ``prefix`` (demi-ouverts) correspondant à ``years``."""
+        clipped = []
+        for low, high in year_runs(years):
+            low, high = max(low, self.first_year), min(high, self.last_year)
+            if low <= high:
+                clipped.append((low - self.first_year, high - self.first_year + 1))
+        return clipped
+
+    def total(self, years, **group):
+        """Nombre de jeux et ventes sur ``years`` (tuple ou liste d'années).
+
+        Au plus un filtre de groupe, sous la forme ``Platform=valeur`` ou
+        ``Platform=[valeurs]`` (ex. plusieurs plateformes additionnées).
+        """
+        if len(group) > 1:
+            raise ValueError("Un seul filtre de groupe par requête")
+        if group:
+            (column, value), = group.items()
+            index, prefix = self.groups[column]
+            values = value if isinstance(value, (list, set, frozenset, tuple)) else [value]
+            columns = [index[v] for v in values if v in index]
+            prefix = prefix[:, columns].sum(axis=1)
+        else:
+            prefix = self.prefix
+        result = np.zeros(len(MEASURES))
+        for start, stop in self._runs(years):
+            result += prefix[stop] - prefix[start]
+        return pd.Series(result, index=MEASURES)
+
+
+def load_prefix_index(name):
+    """Index par année de la vue ``name``, construit une fois par version
+    et partagé par les vues aux mêmes lignes."""
+    return _load_prefix_index(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_prefix_index(key, _name):
+    return YearPrefixIndex(load_view(_name))
@@ -0,0 +1,84 @@
+"""Exécution parallèle des sections indépendantes d'une page.
+
+Une page déclare le calcul de chaque section (agrégats et figure Plotly)
+comme une tâche, exécutée sur un pool de threads partagé par le processus :
+NumPy et pandas relâchent le GIL pendant leurs calculs, les sections
+avancent donc en même temps. L'affichage reste dans le thread du script, dans
+l'ordre de la page : ``sections[nom]`` attend le résultat de la section (et
+relance son exception éventuelle).
+
+Une tâche ne doit appeler aucune fonction d'affichage de Streamlit ; elle peut
+en revanche lire les caches (``st.cache_resource``) : le contexte du script
+est transmis au thread qui l'exécute.
+
+Les sections plus bas dans la page peuvent être repliées (``lazy``) : elles
+s'affichent dans un ``st.expander`` qui relance le script quand on l'ouvre ou
+le ferme, et ne sont calculées que s'il est ouvert. Agrégats et figures
+passant par les caches partagés, rouvrir une section ne recalcule rien.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="vgsales-section")
+        return _pool
+
+
+def expander(label, key, expanded=False):
+    """``st.expander`` dont ``.open`` indique s'il est ouvert (relance à chaque changement)."""
+    return st.expander(label, expanded=expanded, key=key, on_change="rerun")
+
+
+def is_open(key, expanded=False):
+    """État de l'expander ``key``, lisible avant son affichage."""
+    return bool(st.session_state.get(key, expanded))
+
+
+class Sections:
+    def __init__(self, executor=None):
+        self.executor = executor or _executor()
+        self.context = get_script_run_ctx()
+        self.futures = {}
+        self.expanders = {}
+
+    def _run(self, compute):
+        if self.context is not None:
+            add_script_run_ctx(threading.current_thread(), self.context)
+        return compute()
+
+    def add(self, name, compute):
+        """Lance le calcul de la section ``name`` (fonction sans argument)."""
+        if name in self.futures:
+            raise ValueError(f"Section déjà déclarée : {name}")
+        self.futures[name] = self.executor.submit(self._run, compute)
+
+    def lazy(self, name, label, compute, expanded=False):
+        """Section repliée sous ``label`` : calculée seulement si elle est ouverte."""
+        key = f"section_{name}"
+        self.expanders[name] = (label, key, expanded)
+        if is_open(key, expanded):
+            self.add(name, compute)
+
+    def expander(self, name):
+        """Expander de la section repliée ``name`` ; ``name in sections`` si elle est calculée."""
+        label, key, expanded = self.expanders[name]
+        return expander(label, key, expanded)
+
+    def __contains__(self, name):
+        return name in self.futures
+
+    def __getitem__(self, name):
+        return self.futures[name].result()
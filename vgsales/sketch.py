@@ -0,0 +1,139 @@
+"""Esquisses de quantiles fusionnables, par cellule du cube.
+
+Une esquisse est un histogramme à pas logarithmique (à la DDSketch) : une
+valeur ``x > 0`` tombe dans le seau ``ceil(log(x) / log(gamma))``, avec
+``gamma = (1 + a) / (1 - a)``, et chaque seau est représenté par une valeur
+à moins de ``a`` (en relatif) de toutes celles qu'il contient. Tout quantile
+lu dans l'esquisse est donc exact à ``RELATIVE_ACCURACY`` près, en valeur
+relative. Les ventes nulles ont leur propre seau.
+
+Deux esquisses se fusionnent en additionnant leurs histogrammes : on garde,
+par cellule du cube (année × genre × plateforme) et par colonne de ventes,
+le nombre de jeux de chaque seau. La médiane ou les quartiles d'une tranche
+du cube s'obtiennent en additionnant les esquisses de ses cellules, sans
+relire ni trier les lignes. Pour une sélection de lignes (seuil de ventes),
+le seau de chaque ligne est précalculé : l'esquisse est un seul ``bincount``.
+"""
+import numpy as np
+import streamlit as st
+
+from vgsales.cube import DIMENSIONS
+from vgsales.data import SALES_COLUMNS, load_view, view_key
+
+RELATIVE_ACCURACY = 0.01
+# Bornes des valeurs positives distinguées (en millions) ; au-delà, les
+# valeurs sont rangées dans le premier ou le dernier seau
+MIN_VALUE = 1e-3
+MAX_VALUE = 1e4
+
+
+class QuantileSketch:
+    """Histogramme logarithmique ; le seau 0 contient les valeurs nulles."""
+
+    gamma = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    offset = int(np.ceil(np.log(MIN_VALUE) / np.log(gamma))) - 1
+    size = int(np.ceil(np.log(MAX_VALUE) / np.log(gamma))) - offset + 1
+
+    def __init__(self, counts=None):
+        self.counts = np.zeros(self.size) if counts is None else np.asarray(counts, dtype="float64")
+
+    @classmethod
+    def buckets(cls, values):
+        """Seau de chaque valeur de ``values``."""
+        values = np.asarray(values, dtype="float64")
+        # Valeurs nulles, négatives ou manquantes : seau 0, écartées avant le log
+        positive = values > 0
+        index = np.ceil(np.log(np.clip(np.where(positive, values, 1.0), MIN_VALUE, MAX_VALUE)) / np.log(cls.gamma))
+        return np.where(positive, index.astype(np.int64) - cls.offset, 0).astype(np.int16)
+
+    @classmethod
+    def values(cls):
+        """Valeur représentative de chaque seau (0 pour le seau des valeurs nulles)."""
+        index = np.arange(cls.size) + cls.offset
+        values = 2 * cls.gamma ** index / (cls.gamma + 1)
+        values[0] = 0.0
+        return values
+
+    @property
+    def count(self):
+        return int(round(self.counts.sum()))
+
+    def quantile(self, q):
+        """Quantile ``q`` (ou tableau de quantiles), à ``RELATIVE_ACCURACY`` près."""
+        q = np.asarray(q, dtype="float64")
+        if not self.count:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        cumulative = np.cumsum(self.counts)
+        values = self.values()
+        # Rang (à partir de 0) de la valeur cherchée parmi les valeurs triées ;
+        # entre deux rangs, interpolation linéaire comme ``Series.quantile``
+        ranks = q * (self.count - 1)
+        low = values[np.searchsorted(cumulative, np.floor(ranks), side="right")]
+        high = values[np.searchsorted(cumulative, np.ceil(ranks), side="right")]
+        result = low + (ranks - np.floor(ranks)) * (high - low)
+        return result if q.ndim else float(result)
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+class SketchIndex:
+    """Esquisses de chaque cellule du cube d'une vue, pour chaque colonne de ventes.
+
+    Les cellules sont numérotées comme celles de ``vgsales.cube.load_cube`` :
+    ``cells`` accepte directement l'index ``cube.where(...).cells.index``.
+    """
+
+    def __init__(self, df, dimensions=DIMENSIONS, measures=SALES_COLUMNS):
+        grouped = df.groupby(list(dimensions), observed=True, sort=True)
+        self.cell_ids = grouped.ngroup().to_numpy()
+        self.cells = grouped.ngroups
+        self.buckets = {}
+        self.sparse = {}
+        for measure in measures:
+            buckets = QuantileSketch.buckets(df[measure].to_numpy())
+            self.buckets[measure] = buckets
+            # Paires (cellule, seau) présentes et nombre de jeux de chacune
+            pairs, counts = np.unique(
+                self.cell_ids.astype(np.int64) * QuantileSketch.size + buckets, return_counts=True
+            )
+            self.sparse[measure] = (pairs // QuantileSketch.size, pairs % QuantileSketch.size, counts)
+
+    def merge(self, measure, cells=None):
+        """Esquisse des cellules ``cells`` (toutes si ``None``), fusionnées."""
+        pair_cells, pair_buckets, counts = self.sparse[measure]
+        if cells is not None:
+            selected = np.zeros(self.cells, dtype=bool)
+            selected[np.asarray(cells)] = True
+            keep = selected[pair_cells]
+            pair_buckets, counts = pair_buckets[keep], counts[keep]
+        return QuantileSketch(np.bincount(pair_buckets, weights=counts, minlength=QuantileSketch.size))
+
+    def grouped(self, measure, cells, groups, width):
+        """Histogrammes par groupe, forme ``(width, QuantileSketch.size)`` : la
+        cellule ``cells[i]`` appartient au groupe ``groups[i]`` (0 à ``width - 1``)."""
+        pair_cells, pair_buckets, counts = self.sparse[measure]
+        group_of = np.full(self.cells, -1, dtype=np.int64)
+        group_of[np.asarray(cells)] = groups
+        pair_groups = group_of[pair_cells]
+        keep = pair_groups >= 0
+        return np.bincount(
+            pair_groups[keep] * QuantileSketch.size + pair_buckets[keep],
+            weights=counts[keep],
+            minlength=width * QuantileSketch.size,
+        ).reshape(width, QuantileSketch.size)
+
+    def rows(self, measure, mask):
+        """Esquisse des lignes retenues par le masque booléen ``mask``."""
+        return QuantileSketch(np.bincount(self.buckets[measure][mask], minlength=QuantileSketch.size))
+
+
+def load_sketches(name):
+    """Esquisses par cellule de la vue ``name``, construites une fois par version
+    et partagées par les vues aux mêmes lignes."""
+    return _load_sketches(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_sketches(key, _name):
+    return SketchIndex(load_view(_name))
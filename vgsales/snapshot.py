@@ -0,0 +1,117 @@
+"""Snapshot binaire (Parquet) du CSV source.
+
+Le CSV n'est analysé qu'à l'ingestion : le snapshot ``vgsales.parquet`` est
+écrit à côté du fichier source, avec son empreinte (SHA-256, taille, mtime)
+dans les métadonnées du schéma. Il est reconstruit automatiquement dès que le
+contenu du CSV ou les types de ``vgsales.data.DTYPES`` changent ; un simple
+``touch`` ne déclenche qu'un recalcul du hash.
+
+Le snapshot est construit à la demande au premier chargement, ou à l'avance
+au déploiement avec ``python -m vgsales``.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+METADATA_KEY = b"vgsales.source"
+
+# Versions déjà vérifiées dans ce processus : (chemin, mtime, taille) -> version
+_verified = {}
+
+
+def snapshot_path(csv_path):
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def schema_id():
+    from vgsales.data import DTYPES
+
+    return hashlib.sha256(json.dumps(DTYPES, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def read_source_info(target):
+    """Empreinte du CSV enregistrée dans le snapshot, ou ``None``."""
+    try:
+        metadata = pq.read_schema(target).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = metadata.get(METADATA_KEY)
+    return json.loads(raw) if raw else None
+
+
+def _write_table(table, target, info):
+    metadata = dict(table.schema.metadata or {})
+    metadata[METADATA_KEY] = json.dumps(info).encode()
+    # Fichier temporaire propre à cet appel : plusieurs sessions (threads) ou
+    # workers peuvent reconstruire le snapshot en même temps
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table.replace_schema_metadata(metadata), tmp)
+        # Remplacement atomique : les autres workers lisent l'ancien ou le nouveau
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def build_snapshot(csv_path, target=None, info=None):
+    from vgsales.data import read_dataset
+
+    csv_path = Path(csv_path)
+    target = target or snapshot_path(csv_path)
+    if info is None:
+        stat = csv_path.stat()
+        info = {
+            "sha256": file_sha256(csv_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "schema": schema_id(),
+        }
+    table = pa.Table.from_pandas(read_dataset(csv_path), preserve_index=False)
+    _write_table(table, target, info)
+    return target
+
+
+def ensure_snapshot(csv_path):
+    """Chemin et version d'un snapshot à jour pour ``csv_path``.
+
+    La version combine le hash du CSV et celui du schéma ; le hash n'est
+    recalculé que si la taille ou le mtime du CSV ont changé.
+    """
+    csv_path = Path(csv_path)
+    target = snapshot_path(csv_path)
+    stat = csv_path.stat()
+    key = (str(csv_path), stat.st_mtime_ns, stat.st_size)
+    if key in _verified and target.exists():
+        return target, _verified[key]
+
+    info = read_source_info(target) if target.exists() else None
+    current = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "schema": schema_id()}
+    if info and all(info.get(k) == v for k, v in current.items()):
+        sha256 = info["sha256"]
+    else:
+        sha256 = file_sha256(csv_path)
+        current["sha256"] = sha256
+        if info and info.get("sha256") == sha256 and info.get("schema") == current["schema"]:
+            # Contenu identique : on met seulement l'empreinte à jour
+            _write_table(pq.read_table(target), target, current)
+        else:
+            build_snapshot(csv_path, target, current)
+    version = hashlib.sha256(f"{sha256}:{current['schema']}".encode()).hexdigest()
+    _verified[key] = version
+    return target, version
+
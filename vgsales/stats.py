@@ -0,0 +1,146 @@
+"""Noyau de statistiques descriptives en une passe, fusionnable.
+
+``Moments.from_array`` calcule pour toutes les colonnes d'un tableau 2-D, en
+opérations vectorisées sur le tableau entier : nombre de valeurs, somme,
+somme des carrés des écarts à la moyenne (variance stable), minimum, maximum
+et esquisse de quantiles (``vgsales.sketch``) pour une médiane approchée.
+Deux ``Moments`` se fusionnent avec la formule de Chan (mise à jour de
+Welford par blocs) : l'ingestion en flux les accumule bloc par bloc, et
+``Moments.grouped`` donne les mêmes statistiques par groupe.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from vgsales.sketch import QuantileSketch
+
+
+def _as_columns(values):
+    values = np.asarray(values, dtype="float64")
+    return values.reshape(-1, 1) if values.ndim == 1 else values
+
+
+@dataclass
+class Moments:
+    # Tableaux de forme (colonnes,) ou (groupes, colonnes)
+    count: np.ndarray
+    total: np.ndarray
+    m2: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    # Histogrammes des esquisses, forme (..., colonnes, QuantileSketch.size)
+    sketch: np.ndarray = None
+
+    @classmethod
+    def from_array(cls, values, sketch=True):
+        """Statistiques de chaque colonne de ``values`` (valeurs manquantes ignorées)."""
+        values = _as_columns(values)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        total = np.where(valid, values, 0).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+        m2 = np.where(valid, (values - mean) ** 2, 0).sum(axis=0)
+        counts = None
+        if sketch:
+            # Un seul bincount : seau décalé de size par colonne
+            ids = QuantileSketch.buckets(values) + np.arange(values.shape[1]) * QuantileSketch.size
+            counts = np.bincount(
+                ids[valid], minlength=values.shape[1] * QuantileSketch.size
+            ).reshape(values.shape[1], QuantileSketch.size)
+        return cls(
+            count,
+            total,
+            m2,
+            np.min(values, axis=0, initial=np.inf, where=valid),
+            np.max(values, axis=0, initial=-np.inf, where=valid),
+            counts,
+        )
+
+    @classmethod
+    def grouped(cls, values, codes, groups):
+        """Statistiques par groupe : ``codes`` (0 à ``groups - 1``) donne le groupe de chaque ligne."""
+        values = _as_columns(values)
+        codes = np.asarray(codes)
+        valid = ~np.isnan(values)
+        columns = range(values.shape[1])
+        count = np.column_stack([np.bincount(codes[valid[:, j]], minlength=groups) for j in columns])
+        total = np.column_stack([
+            np.bincount(codes, weights=np.where(valid[:, j], values[:, j], 0), minlength=groups)
+            for j in columns
+        ])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+        deviations = np.where(valid, (values - mean[codes]) ** 2, 0)
+        m2 = np.column_stack([
+            np.bincount(codes, weights=deviations[:, j], minlength=groups) for j in columns
+        ])
+        # Minimum et maximum : lignes triées par groupe, réduction par tranche
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(groups + 1))
+        minimum = np.full((groups, values.shape[1]), np.inf)
+        maximum = np.full((groups, values.shape[1]), -np.inf)
+        present = bounds[:-1] < bounds[1:]
+        if present.any():
+            starts = bounds[:-1][present]
+            ordered = values[order]
+            minimum[present] = np.fmin.reduceat(np.where(valid[order], ordered, np.inf), starts)
+            maximum[present] = np.fmax.reduceat(np.where(valid[order], ordered, -np.inf), starts)
+        return cls(count, total, m2, minimum, maximum)
+
+    def merge(self, other):
+        """Statistiques de la réunion des deux échantillons (formule de Chan)."""
+        count = self.count + other.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            m2 = self.m2 + other.m2 + np.where(
+                count > 0, delta ** 2 * self.count * other.count / count, 0
+            )
+        m2 = np.where(self.count == 0, other.m2, np.where(other.count == 0, self.m2, m2))
+        sketch = None
+        if self.sketch is not None and other.sketch is not None:
+            sketch = self.sketch + other.sketch
+        return Moments(
+            count,
+            self.total + other.total,
+            m2,
+            np.minimum(self.minimum, other.minimum),
+            np.maximum(self.maximum, other.maximum),
+            sketch,
+        )
+
+    @property
+    def mean(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.total / self.count
+
+    @property
+    def variance(self):
+        """Variance d'échantillon (``ddof=1``), comme ``Series.var``."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    @property
+    def median(self):
+        """Médiane approchée de chaque colonne (esquisse, voir ``vgsales.sketch``)."""
+        if self.sketch is None:
+            raise ValueError("Statistiques calculées sans esquisse de quantiles")
+        return np.array([QuantileSketch(counts).median() for counts in self.sketch])
+
+    def frame(self, columns):
+        """Tableau colonne -> statistiques (pour des moments non groupés)."""
+        result = {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": np.where(self.count > 0, self.minimum, np.nan),
+            "max": np.where(self.count > 0, self.maximum, np.nan),
+        }
+        if self.sketch is not None:
+            result["median"] = self.median
+        return pd.DataFrame(result, index=list(columns))
@@ -0,0 +1,67 @@
+"""Index des titres : plateformes de chaque jeu, sous forme de bitset.
+
+Un même jeu apparaît sur une ligne par plateforme. L'index regroupe les
+lignes par titre (``Name``) une fois au chargement et associe à chaque titre
+l'ensemble de ses plateformes, codé en bitset sur les codes de ``Platform``
+(un bit par plateforme, sur autant de mots ``uint64`` que nécessaire). Pour
+une sélection, les bitsets des lignes retenues sont combinés par OU titre
+par titre, sans ``groupby`` ni fusion avec les lignes.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vgsales.data import load_view, view_key
+
+
+WORD_BITS = 64
+
+
+class TitleIndex:
+    def __init__(self, df):
+        platforms = df["Platform"].array
+        # Titre de chaque ligne (-1 : nom manquant, hors index)
+        self.title_ids, titles = pd.factorize(df["Name"].array, sort=True)
+        self.titles = pd.Index(titles.astype(str), name="Name")
+        named = self.title_ids >= 0
+        # Bitset de la plateforme de chaque ligne : tableau (lignes, mots)
+        words = max(-(-len(platforms.categories) // WORD_BITS), 1)
+        self.bits = np.zeros((len(df), words), dtype=np.uint64)
+        rows = np.flatnonzero(named & (platforms.codes >= 0))
+        codes = platforms.codes[rows].astype(np.uint64)
+        self.bits[rows, codes // WORD_BITS] = np.left_shift(np.uint64(1), codes % WORD_BITS)
+        # Lignes regroupées par titre : tranche [offsets[t], offsets[t + 1])
+        self.order = np.flatnonzero(named)[np.argsort(self.title_ids[named], kind="stable")]
+        self.offsets = np.searchsorted(self.title_ids[self.order], np.arange(len(self.titles) + 1))
+
+    def _combine(self, bits):
+        """OU des ``bits`` des lignes de chaque titre (chaque titre a au moins une ligne)."""
+        if not len(self.order):
+            return np.zeros((0, bits.shape[1]), dtype=np.uint64)
+        return np.bitwise_or.reduceat(bits[self.order], self.offsets[:-1], axis=0)
+
+    @staticmethod
+    def _count(bitsets):
+        """Nombre de bits à 1 de chaque bitset (somme sur ses mots)."""
+        return np.bitwise_count(bitsets).sum(axis=1, dtype=np.int64)
+
+    def platform_counts(self, mask):
+        """Nombre de plateformes du titre de chaque ligne, dans la sélection ``mask``.
+
+        Renvoie un tableau aligné sur les lignes de la vue (0 hors index).
+        """
+        counts = self._count(self._combine(np.where(np.asarray(mask)[:, None], self.bits, np.uint64(0))))
+        if not len(counts):
+            return np.zeros(len(self.title_ids), dtype=counts.dtype)
+        return np.where(self.title_ids >= 0, counts[self.title_ids], 0)
+
+
+def load_title_index(name):
+    """Index des titres de la vue ``name``, construit une fois par version
+    et partagé par les vues aux mêmes lignes."""
+    return _load_title_index(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_title_index(key, _name):
+    return TitleIndex(load_view(_name))
@@ -0,0 +1,96 @@
+"""Index des meilleures ventes (top-K) par partition.
+
+Pour une colonne de ventes, l'index conserve l'ordre des lignes par ventes
+décroissantes, globalement ou à l'intérieur de chaque valeur d'une colonne de
+partition (genre, plateforme, constructeur). Un « top K » d'une sélection
+parcourt cette liste dans l'ordre et s'arrête dès que K lignes retenues ont
+été vues, au lieu de trier toutes les lignes filtrées à chaque exécution. À
+ventes égales, l'ordre des lignes de la vue est conservé, comme avec
+``DataFrame.nlargest``.
+
+Chaque liste (mesure, partition) est construite à sa première requête puis
+gardée : seules les listes interrogées par les pages occupent de la mémoire,
+avec des positions en ``int32``.
+"""
+import threading
+
+import numpy as np
+import streamlit as st
+
+from vgsales.data import load_view, view_key
+
+
+class TopKIndex:
+    def __init__(self, df):
+        self.df = df
+        self.lists = {}
+        self._lock = threading.Lock()
+
+    def _positions(self, order):
+        return order.astype(np.int32) if len(self.df) <= np.iinfo(np.int32).max else order
+
+    def _build(self, measure, column):
+        values = self.df[measure].to_numpy(dtype="float64")
+        # Tri stable par ventes décroissantes ; valeurs manquantes exclues
+        order = np.argsort(-values, kind="stable")
+        order = order[~np.isnan(values[order])]
+        if column is None:
+            return self._positions(order), None, None
+        categories = self.df[column].cat.categories
+        codes = self.df[column].array.codes
+        # Tri stable par code : l'ordre des ventes est conservé dans chaque partition
+        ordered = order[np.argsort(codes[order], kind="stable")]
+        bounds = np.searchsorted(codes[ordered], np.arange(len(categories) + 1))
+        return self._positions(ordered), bounds, {key: i for i, key in enumerate(categories)}
+
+    def _list(self, measure, column):
+        key = (measure, column)
+        with self._lock:
+            if key not in self.lists:
+                self.lists[key] = self._build(measure, column)
+            return self.lists[key]
+
+    def _order(self, measure, partition):
+        if len(partition) > 1:
+            raise ValueError("Une seule partition par requête")
+        if not partition:
+            return self._list(measure, None)[0]
+        (column, value), = partition.items()
+        ordered, bounds, index = self._list(measure, column)
+        if value not in index:
+            return ordered[:0]
+        code = index[value]
+        return ordered[bounds[code]:bounds[code + 1]]
+
+    def top(self, measure, k, mask=None, **partition):
+        """Positions des ``k`` lignes de plus fortes ventes ``measure``.
+
+        ``mask`` est le masque booléen de la sélection (toutes les lignes si
+        ``None``) ; au plus une partition, sous la forme ``Genre=valeur``.
+        """
+        order = self._order(measure, partition)
+        if mask is None:
+            return order[:k]
+        found = []
+        start, step = 0, max(4 * k, 64)
+        while start < len(order) and sum(len(f) for f in found) < k:
+            chunk = order[start:start + step]
+            found.append(chunk[mask[chunk]])
+            start += step
+            step *= 2
+        return np.concatenate(found)[:k] if found else order[:0]
+
+    def frame(self, df, measure, k, mask=None, **partition):
+        """Lignes du top ``k`` de ``df`` (la vue indexée), par ventes décroissantes."""
+        return df.iloc[self.top(measure, k, mask, **partition)]
+
+
+def load_topk_index(name):
+    """Index top-K de la vue ``name``, construit une fois par version
+    et partagé par les vues aux mêmes lignes."""
+    return _load_topk_index(view_key(name), name)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_topk_index(key, _name):
+    return TopKIndex(load_view(_name))
@@ -0,0 +1,291 @@
+"""Évaluation des hypothèses sur toute la grille des filtres.
+
+Chaque page d'hypothèse calcule son verdict pour un seul état de la barre
+latérale. Ce module évalue les trois verdicts pour toutes les combinaisons
+de filtres agrégeables : chaque période ``(début, fin)`` d'années, chaque
+plateforme ou genre (et leur absence), et chaque ensemble de générations
+pour le Japon. Les seuils de ventes par jeu, qui portent sur des lignes, ne
+font pas partie de la grille.
+
+Les ventes sont d'abord réduites en un tenseur groupe × année × candidat
+(genre, région ou constructeur) ; les sommes de toutes les périodes se lisent
+ensuite dans les sommes cumulées par année. Au déploiement
+(``python -m vgsales``), l'évaluation des groupes est répartie sur un pool de
+processus. Le résultat est une table compacte (``vgsales.verdicts.parquet``,
+à côté du CSV), que les pages consultent sans recalcul ; si le dataset a
+changé depuis, la première page qui la lit la reconstruit dans le processus
+du serveur. La part des combinaisons où un verdict tient mesure sa
+robustesse.
+"""
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from vgsales.buckets import GENERATIONS
+from vgsales.data import DATASET_PATH, REGION_COLUMNS, dataset_version, load_view
+
+METADATA_KEY = b"vgsales.verdicts"
+TABLE_FORMAT = 1
+
+# Libellés « sans filtre » des listes déroulantes des pages
+ALL_LABELS = {"Platform": "Toutes", "Genre": "Tous"}
+# Toutes les générations (bitmask sur GENERATIONS.labels)
+ALL_GENERATIONS = (1 << len(GENERATIONS.labels)) - 1
+
+# Groupes évalués par tâche du pool
+GROUPS_PER_TASK = 64
+
+# Une seule vérification ou construction de la table à la fois par processus
+_build_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Hypothesis:
+    name: str
+    view: str
+    # Colonnes de filtre de la barre latérale
+    groups: tuple
+    # Candidats : colonne dont chaque valeur est un candidat (ventes ``measure``)
+    # ou liste de colonnes de ventes
+    candidates: object
+    target: str
+    measure: str = None
+    # Colonne du total (par défaut, somme des candidats)
+    denominator: str = None
+    # "leader" : la cible est le premier candidat ; "majority" : plus de 50 %
+    rule: str = "leader"
+    generations: bool = False
+
+
+HYPOTHESES = {
+    "action": Hypothesis(
+        "action", "genres", ("Platform",), "Genre", "Action", measure="Global_Sales",
+    ),
+    "north_america": Hypothesis(
+        "north_america", "regions", ("Genre", "Platform"), REGION_COLUMNS, "NA_Sales",
+        denominator="Global_Sales",
+    ),
+    "nintendo_japan": Hypothesis(
+        "nintendo_japan", "japan", ("Genre",), "Manufacturer", "🎮 Nintendo",
+        measure="JP_Sales", rule="majority", generations=True,
+    ),
+}
+
+
+def verdicts_path(csv_path=DATASET_PATH):
+    return csv_path.with_name(f"{csv_path.stem}.verdicts.parquet")
+
+
+def _tensor(df, hypothesis, years):
+    """Ventes et nombre de jeux par groupe de filtres × année × candidat.
+
+    Chaque colonne de filtre reçoit une valeur supplémentaire (dernier
+    indice) pour « sans filtre », somme des autres.
+    """
+    year_codes = df["Year"].to_numpy().astype(np.int64) - years[0]
+    codes, keys = np.zeros(len(df), dtype=np.int64), []
+    for column in hypothesis.groups:
+        categories = df[column].cat.categories
+        codes = codes * len(categories) + df[column].array.codes
+        keys.append(list(categories))
+    if isinstance(hypothesis.candidates, str):
+        candidates = list(df[hypothesis.candidates].cat.categories)
+        candidate_codes = df[hypothesis.candidates].array.codes
+        weights = [df[hypothesis.measure].to_numpy(dtype="float64")]
+    else:
+        candidates = list(hypothesis.candidates)
+        candidate_codes = np.zeros(len(df), dtype=np.int64)
+        weights = [df[c].to_numpy(dtype="float64") for c in candidates]
+    extra = [df[hypothesis.denominator].to_numpy(dtype="float64")] if hypothesis.denominator else []
+    width = len(candidates) if isinstance(hypothesis.candidates, str) else 1
+
+    shape = [len(k) for k in keys] + [len(years)]
+    cells = (codes * len(years) + year_codes) * width + candidate_codes
+    size = int(np.prod(shape)) * width
+    layers = [np.bincount(cells, weights=w, minlength=size).reshape(shape + [width]) for w in weights]
+    sales = np.concatenate(layers, axis=-1) if len(layers) > 1 else layers[0]
+    counts = np.bincount(codes * len(years) + year_codes, minlength=int(np.prod(shape))).reshape(shape)
+    totals = [np.bincount(codes * len(years) + year_codes, weights=w, minlength=int(np.prod(shape))).reshape(shape)
+              for w in extra]
+    # Marges « sans filtre » le long de chaque colonne de filtre
+    for axis, column in enumerate(hypothesis.groups):
+        sales = np.concatenate([sales, sales.sum(axis=axis, keepdims=True)], axis=axis)
+        counts = np.concatenate([counts, counts.sum(axis=axis, keepdims=True)], axis=axis)
+        totals = [np.concatenate([t, t.sum(axis=axis, keepdims=True)], axis=axis) for t in totals]
+        keys[axis].append(ALL_LABELS[column])
+    groups = list(itertools.product(*keys))
+    sales = sales.reshape(len(groups), len(years), len(candidates))
+    counts = counts.reshape(len(groups), len(years))
+    total = totals[0].reshape(len(groups), len(years)) if totals else sales.sum(axis=-1)
+    return groups, candidates, sales, counts, total
+
+
+def _evaluate(hypothesis, years, candidates, sales, counts, total, masks):
+    """Verdicts de toutes les périodes pour un bloc de groupes (tâche du pool)."""
+    starts, ends = np.triu_indices(len(years))
+    target = candidates.index(hypothesis.target) if hypothesis.target in candidates else None
+    results = []
+    for mask, weights in masks:
+        def windows(values):
+            # Sommes cumulées par année (lignes : groupes), puis toutes les périodes
+            values = values * weights.reshape((1, -1) + (1,) * (values.ndim - 2))
+            cumulative = np.concatenate(
+                [np.zeros_like(values[:, :1]), np.cumsum(values, axis=1)], axis=1
+            )
+            return cumulative[:, ends + 1] - cumulative[:, starts]
+
+        window_sales, window_counts, window_total = windows(sales), windows(counts), windows(total)
+        leader = window_sales.argmax(axis=-1)
+        value = window_sales[..., target] if target is not None else np.zeros_like(window_total)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(window_total > 0, value / window_total, 0.0)
+        if hypothesis.rule == "leader":
+            verdict = (leader == target) & (window_counts > 0)
+        else:
+            verdict = share > 0.5
+        results.append((mask, window_counts, value, share, leader, verdict))
+    return results
+
+
+def _evaluate_task(args):
+    hypothesis, years, candidates, sales, counts, total, masks = args
+    return _evaluate(hypothesis, years, candidates, sales, counts, total, masks)
+
+
+def build_table(max_workers=None):
+    """Table des verdicts de toutes les hypothèses sur toute la grille.
+
+    Avec ``max_workers=0``, les groupes sont évalués dans le processus courant,
+    sans pool.
+    """
+    frames = []
+    with contextlib.ExitStack() as stack:
+        if max_workers == 0:
+            run = map
+        else:
+            # Processus lancés par « spawn » : un « fork » copierait des
+            # verrous tenus par d'autres threads
+            context = multiprocessing.get_context("spawn")
+            run = stack.enter_context(ProcessPoolExecutor(max_workers=max_workers, mp_context=context)).map
+        for hypothesis in HYPOTHESES.values():
+            df = load_view(hypothesis.view)
+            years = np.arange(int(df["Year"].min()), int(df["Year"].max()) + 1)
+            groups, candidates, sales, counts, total = _tensor(df, hypothesis, years)
+            if hypothesis.generations:
+                codes = GENERATIONS.codes(years)
+                masks = [(m, ((m >> codes) & 1).astype("float64")) for m in range(1, ALL_GENERATIONS + 1)]
+            else:
+                masks = [(ALL_GENERATIONS, np.ones(len(years)))]
+            chunks = range(0, len(groups), GROUPS_PER_TASK)
+            tasks = [
+                (hypothesis, years, candidates, sales[i:i + GROUPS_PER_TASK],
+                 counts[i:i + GROUPS_PER_TASK], total[i:i + GROUPS_PER_TASK], masks)
+                for i in chunks
+            ]
+            starts, ends = np.triu_indices(len(years))
+            for i, results in zip(chunks, run(_evaluate_task, tasks)):
+                block = groups[i:i + GROUPS_PER_TASK]
+                for mask, window_counts, value, share, leader, verdict in results:
+                    frame = pd.DataFrame({
+                        "group": np.repeat(np.arange(i, i + len(block)), len(starts)),
+                        "first_year": np.tile(years[starts], len(block)),
+                        "last_year": np.tile(years[ends], len(block)),
+                        "generations": mask,
+                        "count": window_counts.ravel(),
+                        "value": value.ravel(),
+                        "share": share.ravel(),
+                        "leader": np.asarray(candidates, dtype=object)[leader.ravel()],
+                        "verdict": verdict.ravel(),
+                    })
+                    frames.append(_with_groups(frame[frame["count"] > 0], hypothesis, groups))
+    table = pd.concat(frames, ignore_index=True)
+    return table.astype({
+        "hypothesis": "category", "Platform": "category", "Genre": "category", "leader": "category",
+        "first_year": "int16", "last_year": "int16", "generations": "int8",
+        "count": "int32", "value": "float32", "share": "float32",
+    })
+
+
+def _with_groups(frame, hypothesis, groups):
+    group = frame["group"].to_numpy()
+    keys = {
+        column: np.array([key[j] for key in groups], dtype=object)[group]
+        for j, column in enumerate(hypothesis.groups)
+    }
+    frame = frame.drop(columns="group").assign(hypothesis=hypothesis.name, **keys)
+    for column, label in ALL_LABELS.items():
+        if column not in frame:
+            frame[column] = label
+    return frame
+
+
+def ensure_verdicts(csv_path=DATASET_PATH, max_workers=None):
+    """Chemin d'une table des verdicts à jour pour la version courante du dataset.
+
+    La table est construite au déploiement par ``python -m vgsales``, sur un
+    pool de processus (``max_workers``, voir ``build_table``).
+    """
+    target = verdicts_path(csv_path)
+    version = dataset_version()
+    info = {"version": version, "format": TABLE_FORMAT}
+    try:
+        metadata = pq.read_schema(target).metadata or {}
+        current = json.loads(metadata.get(METADATA_KEY, b"null"))
+    except (OSError, pa.ArrowInvalid):
+        current = None
+    if current != info:
+        table = pa.Table.from_pandas(build_table(max_workers), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: json.dumps(info).encode()})
+        # Fichier temporaire propre à cet appel, remplacement atomique
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return target, version
+
+
+def load_verdicts():
+    """Table des verdicts, vérifiée et lue une fois par version du dataset."""
+    return _load_verdicts(dataset_version())
+
+
+@st.cache_resource(show_spinner="Évaluation des hypothèses...", max_entries=1)
+def _load_verdicts(version):
+    # La table n'est vérifiée (et reconstruite si besoin) qu'ici, une seule
+    # fois par version : les pages ne relisent pas son schéma à chaque
+    # exécution. Pas de pool dans le serveur : Streamlit y remplace
+    # ``__main__`` par le script de la page, que « spawn » réexécuterait
+    with _build_lock:
+        path, _ = ensure_verdicts(max_workers=0)
+    table = pd.read_parquet(path)
+    return table.set_index(["hypothesis", "first_year", "last_year", "Platform", "Genre", "generations"]).sort_index()
+
+
+def lookup(table, hypothesis, years, platform="Toutes", genre="Tous", generations=ALL_GENERATIONS):
+    """Ligne de la table pour un état des filtres, ou ``None`` (sélection vide)."""
+    key = (hypothesis, int(years[0]), int(years[1]), platform, genre, generations)
+    try:
+        return table.loc[key]
+    except KeyError:
+        return None
+
+
+def robustness(table, hypothesis):
+    """Part des combinaisons de filtres (non vides) où le verdict tient."""
+    return float(table.loc[hypothesis, "verdict"].mean())